@@ -1,5 +1,20 @@
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+import sys
+from dataclasses import dataclass
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, Any, List, Literal, Optional
+
+# Analysis timeframes accepted by the resampler ("1w" is used by the chart controls)
+Timeframe = Literal["1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w"]
+BacktestMode = Literal["vector", "event"]
+
+
+def _intern(value: Any) -> Any:
+    """Intern repeated identifier strings (symbols, strategy names)."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(v) if isinstance(v, str) else v for v in value]
+    return value
 
 
 class RiskParams(BaseModel):
@@ -17,24 +32,20 @@ class BacktestRequest(BaseModel):
     strategy: str  # e.g. "SMACrossover"
     params: Dict[str, Any] = {}
     initial_cash: float = 100000.0
-    mode: str = "vector" # "vector" | "event"
+    mode: BacktestMode = "vector"
     slippage: float = 0.0 # Percent (0.01 = 1%)
     commission: float = 0.0 # Per unit (dollar)
     start_date: str | None = None # "YYYY-MM-DD"
     end_date: str | None = None # "YYYY-MM-DD"
-    timeframe: str = "1h" # Analysis timeframe: "1m", "5m", "15m", "30m", "1h", "4h", "1d"
-    risk_params: RiskParams = RiskParams()  # Risk management configuration
-
-class ChartPoint(BaseModel):
-    time: int # Unix timestamp (seconds) or formatted string
-    value: float
-    
-class SignalPoint(BaseModel):
-    time: int
-    type: str # "buy" or "sell"
-    price: float
+    timeframe: Timeframe = "1h" # Analysis timeframe
+    risk_params: RiskParams = Field(default_factory=RiskParams)  # Risk management configuration
+
+    _intern_identifiers = field_validator("symbol", "strategy")(_intern)
 
-class CandlePoint(BaseModel):
+# CandlePoint is created once per bar for /data; a plain slotted dataclass keeps
+# construction free of per-instance validation. Build it positionally.
+@dataclass(slots=True, frozen=True)
+class CandlePoint:
     time: int
     open: float
     high: float
@@ -42,19 +53,45 @@ class CandlePoint(BaseModel):
     close: float
     volume: float
 
-class IndicatorPoint(BaseModel):
-    time: int
-    value: float
+class MarketDataResponse(BaseModel):
+    """Schema of GET /data/{symbol}, used for OpenAPI docs only.
+
+    The route returns CandlePoint dataclasses straight through orjson, so
+    this wrapper is never instantiated on the hot path.
+    """
+    symbol: str
+    timeframe: str
+    candles: List[CandlePoint] = []
+
+class CandleSeries(BaseModel):
+    """Columnar OHLCV payload: parallel lists aligned by index."""
+    time: List[int] = []
+    open: List[float] = []
+    high: List[float] = []
+    low: List[float] = []
+    close: List[float] = []
+    volume: List[float] = []
+
+class ChartSeries(BaseModel):
+    """Columnar time/value payload (equity curve, indicators)."""
+    time: List[int] = []
+    value: List[float] = []
+
+class SignalSeries(BaseModel):
+    """Columnar trade markers: parallel time/type/price lists."""
+    time: List[int] = []
+    type: List[Literal["buy", "sell"]] = []
+    price: List[float] = []
 
 class BacktestResponse(BaseModel):
     symbol: str
     strategy: str
     metrics: Dict[str, Any]
-    equity_curve: List[ChartPoint]
-    signals: List[SignalPoint]
-    candles: List[CandlePoint] = []
-    indicators: Dict[str, List[IndicatorPoint]] = {}
-    status: str = "success"
+    equity_curve: ChartSeries = Field(default_factory=ChartSeries)
+    signals: SignalSeries = Field(default_factory=SignalSeries)
+    candles: CandleSeries = Field(default_factory=CandleSeries)
+    indicators: Dict[str, ChartSeries] = {}
+    status: Literal["success", "error"] = "success"
     error: Optional[str] = None
     task_id: Optional[str] = None  # For async mode
 
@@ -69,7 +106,7 @@ class BacktestTaskResponse(BaseModel):
 class BacktestStatusResponse(BaseModel):
     """Response for async backtest status polling."""
     task_id: str
-    status: str  # "processing", "completed", "failed"
+    status: Literal["processing", "completed", "failed"]
     progress: Optional[float] = None  # 0.0 - 1.0
     result: Optional[BacktestResponse] = None
     error: Optional[str] = None
@@ -79,12 +116,14 @@ class ScanRequest(BaseModel):
     params: Dict[str, Any] = {}
     symbols: List[str] | None = None  # None = all instruments
     initial_cash: float = 100000.0
-    mode: str = "vector"
+    mode: BacktestMode = "vector"
     start_date: str | None = None
     end_date: str | None = None
-    timeframe: str = "1h"
+    timeframe: Timeframe = "1h"
     max_concurrency: int = 10
 
+    _intern_identifiers = field_validator("strategy", "symbols")(_intern)
+
 
 class ScanResult(BaseModel):
     symbol: str
@@ -92,7 +131,7 @@ class ScanResult(BaseModel):
     signal_count: int = 0
     last_signal: str | None = None
     last_signal_time: int | None = None
-    status: str = "success"  # "success" | "error" | "cached"
+    status: Literal["success", "error", "cached"] = "success"
     error: str | None = None
     cached: bool = False
 
@@ -109,5 +148,5 @@ class ScanResponse(BaseModel):
     elapsed_ms: int
 
 class StorageSettingsUpdate(BaseModel):
-    provider: str  # "local", "cloudflare_r2", "oracle_object_storage"
+    provider: Literal["local", "cloudflare_r2", "oracle_object_storage"]
 
@@ -1,51 +1,181 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+import orjson
 import logging
 import os
-import sys
 import uuid
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
-from typing import List, Dict, Any
-
-# Add parent directory to path to allow imports if running from top level
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-if parent_dir not in sys.path:
-    sys.path.append(parent_dir)
-
-from services.market_data_service import MarketDataService  # noqa: E402
-from services.backtest_service import BacktestService  # noqa: E402
-from services.scanner_service import ScannerService  # noqa: E402
-from .models import (  # noqa: E402
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+from services.market_data_service import MarketDataService
+from services.backtest_service import BacktestService
+from services.scanner_service import ScannerService
+from services.response_cache import ResponseCache, request_cache_key
+from .orjson_response import ORJSONResponse
+from .models import (
     BacktestRequest,
     BacktestResponse,
     BacktestTaskResponse,
     BacktestStatusResponse,
+    MarketDataResponse,
     ScanRequest,
     ScanResponse,
     StorageSettingsUpdate,
 )
-from hermes_data.config import get_settings  # noqa: E402
+from hermes_data.config import get_settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Validators/serializers are built once at import and reused for every request.
+# Handlers return pre-encoded Response objects, so FastAPI skips its
+# response_model validation and jsonable_encoder walk; response_model is kept
+# for the OpenAPI schema only.
+_BACKTEST_REQUEST_ADAPTER = TypeAdapter(BacktestRequest)
+_BACKTEST_RESPONSE_ADAPTER = TypeAdapter(BacktestResponse)
+_TASK_RESPONSE_ADAPTER = TypeAdapter(BacktestTaskResponse)
+_SCAN_REQUEST_ADAPTER = TypeAdapter(ScanRequest)
+_SCAN_RESPONSE_ADAPTER = TypeAdapter(ScanResponse)
 
 # Lazy service initialization to allow mocking in tests
 _market_data_service = None
 _backtest_service = None
 _scanner_service = None
+# Guards lazy creation of the singletons, which also happens on worker threads
+_services_lock = threading.RLock()
+
+# Async task store (in-memory fallback when no Redis queue is configured)
+# Ordered oldest -> most recently touched; bounded by MAX_STORED_TASKS and TTL
+_task_store: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Completion signals for in-process tasks, awaited by SSE status streams
+_task_done: Dict[str, asyncio.Event] = {}
+
+# SSE keepalive interval, and status re-check interval for RQ jobs
+SSE_KEEPALIVE_SECONDS = 15.0
+QUEUED_STATUS_POLL_SECONDS = 1.0
+
+# Finished task results are kept this long before being evicted
+TASK_RESULT_TTL_SECONDS = 3600
+MAX_STORED_TASKS = 256
+BACKTEST_JOB_TIMEOUT_SECONDS = 600
+
+# Shared RQ queue (set HERMES_REDIS_URL); lets any API worker answer status polls
+_rq_queue = None
+
+# Serializes storage provider switches
+_storage_switch_lock = asyncio.Lock()
+
+# Serialized responses for repeated identical backtest/scan requests
+_response_cache = ResponseCache()
+
+
+async def _parse_body(request: Request, adapter: TypeAdapter):
+    """Validate the raw request body in a single pass with a cached adapter."""
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False)) from e
+
+
+def _json_response(adapter: TypeAdapter, result, cache_key: Optional[str] = None) -> Response:
+    body = adapter.dump_json(result)
+    if cache_key is not None:
+        _response_cache.put(cache_key, body)
+    return Response(content=body, media_type="application/json")
+
+
+def _cached_response(cache_key: Optional[str]):
+    if cache_key is None:
+        return None
+    body = _response_cache.get(cache_key)
+    if body is None:
+        return None
+    return Response(content=body, media_type="application/json")
+
+
+# Read-only market data: browsers may reuse a response for this long and
+# revalidate with If-None-Match afterwards
+HTTP_CACHE_MAX_AGE_SECONDS = 60
+
+
+def _conditional_response(raw_request: Request, response: Response, vary: Optional[str] = None) -> Response:
+    """Tag a read-only response with a content ETag; 304 if the client has it.
+
+    The ETag hashes the encoded body, so it works for every storage provider
+    and changes exactly when the served data does.
+    """
+    etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={HTTP_CACHE_MAX_AGE_SECONDS}"}
+    if vary is not None:
+        headers["Vary"] = vary
+    if_none_match = raw_request.headers.get("if-none-match", "")
+    client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_tags or "*" in client_tags:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def get_task_queue():
+    """Get the RQ backtest queue, or None to run tasks in-process.
+
+    Jobs are executed by separate `rq worker backtests` processes started
+    from the hermes-backend directory.
+    """
+    global _rq_queue
+    redis_url = os.environ.get("HERMES_REDIS_URL")
+    if not redis_url:
+        return None
+    if _rq_queue is None:
+        try:
+            from redis import Redis
+            from rq import Queue
+        except ImportError:
+            logging.warning("HERMES_REDIS_URL is set but redis/rq are not installed; using in-process tasks")
+            return None
+        _rq_queue = Queue("backtests", connection=Redis.from_url(redis_url))
+    return _rq_queue
+
 
-# Async task store (in-memory; production should use Redis/DB)
-_task_store: Dict[str, Dict[str, Any]] = {}
+def _prune_task_store() -> None:
+    """Evict expired finished tasks, then the least recently used ones over the cap.
 
-# Process pool for CPU-bound backtest computations
-_executor = ProcessPoolExecutor(max_workers=min(4, (os.cpu_count() or 2)))
+    Finished tasks older than TASK_RESULT_TTL_SECONDS are dropped. If the
+    store still exceeds MAX_STORED_TASKS, finished tasks go first and
+    running ones only as a last resort.
+    """
+    cutoff = time.time() - TASK_RESULT_TTL_SECONDS
+    expired = [
+        task_id for task_id, task in _task_store.items()
+        if task.get("finished_at") is not None and task["finished_at"] < cutoff
+    ]
+    for task_id in expired:
+        del _task_store[task_id]
+
+    overflow = len(_task_store) - MAX_STORED_TASKS
+    if overflow <= 0:
+        return
+    finished = [task_id for task_id, task in _task_store.items() if task.get("finished_at") is not None]
+    for task_id in finished[:overflow]:
+        del _task_store[task_id]
+    while len(_task_store) > MAX_STORED_TASKS:
+        _task_store.popitem(last=False)
 
 
 def get_market_data_service() -> MarketDataService:
     """Get or create the MarketDataService singleton."""
     global _market_data_service
     if _market_data_service is None:
-        _market_data_service = MarketDataService()
+        with _services_lock:
+            if _market_data_service is None:
+                _market_data_service = MarketDataService()
     return _market_data_service
 
 
@@ -53,20 +183,25 @@ def get_backtest_service() -> BacktestService:
     """Get or create the BacktestService singleton."""
     global _backtest_service
     if _backtest_service is None:
-        _backtest_service = BacktestService(get_market_data_service())
+        with _services_lock:
+            if _backtest_service is None:
+                _backtest_service = BacktestService(get_market_data_service())
     return _backtest_service
 
 
 @router.get("/instruments", response_model=List[str])
-async def list_instruments():
-    return get_market_data_service().list_instruments()
+async def list_instruments(raw_request: Request):
+    instruments = await asyncio.to_thread(get_market_data_service().list_instruments)
+    return _conditional_response(raw_request, ORJSONResponse(instruments))
 
 
 @router.post("/instruments/sync", response_model=Dict[str, Any])
 async def sync_instruments():
     """Sync instrument registry with storage."""
     try:
-        count = get_market_data_service().data_service.sync_registry()
+        svc = get_market_data_service()
+        count = await asyncio.to_thread(svc.data_service.sync_registry)
+        svc.invalidate_cache()
         return {
             "status": "success",
             "message": f"Synced {count} instruments",
@@ -77,15 +212,38 @@ async def sync_instruments():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/data/{symbol}", response_model=Dict[str, Any])
-async def get_market_data(symbol: str, timeframe: str = "1h"):
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+@router.get("/data/{symbol}", response_model=None, responses={200: {"model": MarketDataResponse}})
+async def get_market_data(
+    raw_request: Request,
+    symbol: str,
+    timeframe: str = "1h",
+    response_format: str = Query("json", alias="format"),
+):
+    """Get candles as JSON (default) or as an Arrow IPC stream.
+
+    Arrow is selected with `?format=arrow` or an
+    `Accept: application/vnd.apache.arrow.stream` header.
+    """
+    wants_arrow = response_format == "arrow" or ARROW_STREAM_MEDIA_TYPE in raw_request.headers.get("accept", "")
     try:
-        candles = get_market_data_service().get_candles(symbol, timeframe)
-        return {
+        if wants_arrow:
+            payload = await asyncio.to_thread(get_market_data_service().get_candles_arrow, symbol, timeframe)
+            return _conditional_response(raw_request, Response(
+                content=payload,
+                media_type=ARROW_STREAM_MEDIA_TYPE,
+                headers={"X-Hermes-Symbol": symbol, "X-Hermes-Timeframe": timeframe},
+            ), vary="Accept")
+        candles = await asyncio.to_thread(get_market_data_service().get_candles, symbol, timeframe)
+        # Returned directly so orjson encodes the candle dataclasses natively,
+        # bypassing FastAPI's jsonable_encoder walk over every point
+        return _conditional_response(raw_request, ORJSONResponse({
             "symbol": symbol,
             "candles": candles,
             "timeframe": timeframe
-        }
+        }), vary="Accept")
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -93,26 +251,49 @@ async def get_market_data(symbol: str, timeframe: str = "1h"):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _run_backtest_sync(request_dict: dict) -> dict:
-    """Run backtest synchronously (for use in process pool).
+def _run_backtest_bytes(service: BacktestService, request: BacktestRequest) -> bytes:
+    """Run a validated backtest and return the serialized BacktestResponse.
 
-    Must be a top-level function for ProcessPoolExecutor pickling.
+    The status endpoint serves the bytes as-is without re-validating.
     """
-    from services.backtest_service import BacktestService
-    from services.market_data_service import MarketDataService
-    from api.models import BacktestRequest
+    return _BACKTEST_RESPONSE_ADAPTER.dump_json(service.run_backtest(request))
+
 
-    svc = BacktestService(MarketDataService())
-    req = BacktestRequest(**request_dict)
-    result = svc.run_backtest(req)
-    return result.model_dump()
+def _run_backtest_sync(request_dict: dict) -> bytes:
+    """RQ job entry point: validate the queued payload and run it."""
+    req = _BACKTEST_REQUEST_ADAPTER.validate_python(request_dict)
+    return _run_backtest_bytes(get_backtest_service(), req)
+
+
+# Thread pool for backtest computations. Polars kernels release the GIL, and
+# threads avoid pickling requests/results across process boundaries.
+_executor = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 2) * 2))
+
+
+def _status_payload(task_id: str, status: str, result: Optional[bytes] = None,
+                    error: Optional[str] = None) -> bytes:
+    """Serialize a BacktestStatusResponse, splicing in pre-encoded result bytes."""
+    envelope = orjson.dumps({"task_id": task_id, "status": status, "progress": None, "error": error})
+    if result is not None:
+        return envelope[:-1] + b',"result":' + result + b"}"
+    return envelope[:-1] + b',"result":null}'
 
 
 @router.post("/backtest", response_model=BacktestResponse)
-async def run_backtest(request: BacktestRequest):
-    """Run a backtest synchronously (original behavior, backward-compatible)."""
+async def run_backtest(raw_request: Request):
+    """Run a backtest and wait for the result (original behavior, backward-compatible).
+
+    The backtest runs on a worker thread so the event loop keeps serving
+    other requests while data loads and the engine runs.
+    """
+    request = await _parse_body(raw_request, _BACKTEST_REQUEST_ADAPTER)
+    cache_key = request_cache_key("backtest", request)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
     try:
-        return get_backtest_service().run_backtest(request)
+        result = await asyncio.to_thread(get_backtest_service().run_backtest, request)
+        return _json_response(_BACKTEST_RESPONSE_ADAPTER, result, cache_key)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
@@ -122,65 +303,224 @@ async def run_backtest(request: BacktestRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_POINTS = 5000
+
+
+def _iter_ndjson_backtest(result: BacktestResponse, chunk_points: int = NDJSON_CHUNK_POINTS):
+    """Yield a BacktestResponse as NDJSON lines, demultiplexed by "type".
+
+    Lines: one "meta" (symbol/strategy/metrics/status), then column batches
+    of at most chunk_points for "candles", "equity", "indicator" (with
+    "name") and "signals" (trade direction under "side"), then "end".
+    """
+    def batches(kind: str, columns: Dict[str, list], **extra):
+        total = len(columns["time"])
+        for start in range(0, total, chunk_points):
+            line = {"type": kind, **extra}
+            for name, values in columns.items():
+                line[name] = values[start:start + chunk_points]
+            yield orjson.dumps(line) + b"\n"
+
+    yield orjson.dumps({
+        "type": "meta",
+        "symbol": result.symbol,
+        "strategy": result.strategy,
+        "metrics": result.metrics,
+        "status": result.status,
+        "error": result.error,
+    }) + b"\n"
+    # dict(model) hands over the field lists themselves; model_dump would
+    # copy every column before it is sliced and encoded
+    yield from batches("candles", dict(result.candles))
+    yield from batches("equity", dict(result.equity_curve))
+    for name, series in result.indicators.items():
+        yield from batches("indicator", dict(series), name=name)
+    signals = result.signals
+    yield from batches("signals", {"time": signals.time, "side": signals.type, "price": signals.price})
+    yield b'{"type":"end"}\n'
+
+
+@router.post("/backtest/stream")
+async def stream_backtest_result(raw_request: Request):
+    """Run a backtest, then send the finished result as NDJSON column batches.
+
+    The backtest runs to completion before the first line is sent; only the
+    transfer is chunked. Clients can parse and render batch by batch instead
+    of holding one large JSON document, and the server encodes one batch at
+    a time. See _iter_ndjson_backtest for the line format.
+    """
+    request = await _parse_body(raw_request, _BACKTEST_REQUEST_ADAPTER)
+    try:
+        result = await asyncio.to_thread(get_backtest_service().run_backtest, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logging.error(f"Backtest execution failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(_iter_ndjson_backtest(result), media_type=NDJSON_MEDIA_TYPE)
+
+
 @router.post("/backtest/async", response_model=BacktestTaskResponse)
-async def run_backtest_async(request: BacktestRequest):
+async def run_backtest_async(raw_request: Request):
     """Submit a backtest for async execution and return immediately with a task_id.
 
-    The backtest runs in a separate process to avoid blocking the ASGI event loop.
-    Poll /backtest/status/{task_id} for results.
+    The backtest runs on a worker thread to avoid blocking the ASGI event loop.
+    Poll /backtest/status/{task_id} or subscribe to /backtest/stream/{task_id}
+    for results.
     """
+    request = await _parse_body(raw_request, _BACKTEST_REQUEST_ADAPTER)
     task_id = str(uuid.uuid4())
 
+    queue = get_task_queue()
+    if queue is not None:
+        # Enqueueing is a blocking Redis call: keep it off the event loop
+        job = await asyncio.to_thread(
+            queue.enqueue,
+            _run_backtest_sync,
+            request.model_dump(),
+            job_id=task_id,
+            job_timeout=BACKTEST_JOB_TIMEOUT_SECONDS,
+            result_ttl=TASK_RESULT_TTL_SECONDS,
+            failure_ttl=TASK_RESULT_TTL_SECONDS,
+        )
+        return _json_response(_TASK_RESPONSE_ADAPTER, BacktestTaskResponse(task_id=job.id))
+
+    _prune_task_store()
+
     # Store initial task state
-    _task_store[task_id] = {
+    task = {
         "status": "processing",
         "result": None,
         "error": None,
+        "created_at": time.time(),
+        "finished_at": None,
     }
+    _task_store[task_id] = task
+    _task_done[task_id] = asyncio.Event()
 
-    # Submit to process pool
-    loop = asyncio.get_event_loop()
+    # Submit to the thread pool. The request is already validated and the
+    # service is resolved here, on the event loop, not in the worker thread.
+    loop = asyncio.get_running_loop()
+    service = get_backtest_service()
 
     async def _run_task():
         try:
-            result_dict = await loop.run_in_executor(
+            result_bytes = await loop.run_in_executor(
                 _executor,
-                _run_backtest_sync,
-                request.model_dump(),
+                _run_backtest_bytes,
+                service,
+                request,
             )
-            _task_store[task_id]["status"] = "completed"
-            _task_store[task_id]["result"] = result_dict
+            task["status"] = "completed"
+            task["result"] = result_bytes
         except Exception as e:
             logging.error(f"Async backtest {task_id} failed: {e}", exc_info=True)
-            _task_store[task_id]["status"] = "failed"
-            _task_store[task_id]["error"] = str(e)
+            task["status"] = "failed"
+            task["error"] = str(e)
+        finally:
+            # Written through the local reference: the entry may have been evicted meanwhile
+            task["finished_at"] = time.time()
+            _task_done.pop(task_id).set()
 
     # Fire and forget — runs in background
     asyncio.ensure_future(_run_task())
 
-    return BacktestTaskResponse(task_id=task_id)
+    return _json_response(_TASK_RESPONSE_ADAPTER, BacktestTaskResponse(task_id=task_id))
+
+
+async def _lookup_task_status(task_id: str) -> Optional[Tuple[str, bytes]]:
+    """Return (status, serialized BacktestStatusResponse), or None if unknown.
+
+    RQ lookups are blocking Redis round-trips, so they run on a worker
+    thread; in-process tasks are read on the event loop that owns them.
+    """
+    queue = get_task_queue()
+    if queue is not None and task_id not in _task_store:
+        return await asyncio.to_thread(_get_queued_backtest_status, queue, task_id)
+
+    task = _task_store.get(task_id)
+    if task is None:
+        return None
+    _task_store.move_to_end(task_id)
+    return task["status"], _status_payload(task_id, task["status"], task["result"], task.get("error"))
 
 
 @router.get("/backtest/status/{task_id}", response_model=BacktestStatusResponse)
 async def get_backtest_status(task_id: str):
     """Poll the status of an async backtest task."""
-    if task_id not in _task_store:
+    current = await _lookup_task_status(task_id)
+    if current is None:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    return Response(content=current[1], media_type="application/json")
 
-    task = _task_store[task_id]
 
-    result = None
-    if task["result"]:
-        result = BacktestResponse(**task["result"])
+async def _wait_for_task(task_id: str, timeout: float) -> None:
+    """Block until an in-process task finishes, or sleep for queued (RQ) tasks."""
+    done = _task_done.get(task_id)
+    if done is None:
+        await asyncio.sleep(min(timeout, QUEUED_STATUS_POLL_SECONDS))
+        return
+    try:
+        await asyncio.wait_for(done.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+@router.get("/backtest/stream/{task_id}")
+async def stream_backtest_status(task_id: str):
+    """Stream status changes for an async backtest as Server-Sent Events.
+
+    Emits a `status` event (BacktestStatusResponse JSON) on every state
+    change and closes after the task completes or fails, replacing
+    repeated /backtest/status polling with one connection.
+    """
+    # Every lookup is awaited: for RQ tasks it is a Redis round-trip on a
+    # worker thread, so open streams never block the event loop
+    first = await _lookup_task_status(task_id)
+    if first is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    return BacktestStatusResponse(
-        task_id=task_id,
-        status=task["status"],
-        result=result,
-        error=task.get("error"),
+    async def events():
+        current: Optional[Tuple[str, bytes]] = first
+        last_status = None
+        while current is not None:
+            status, payload = current
+            if status != last_status:
+                yield b"event: status\ndata: " + payload + b"\n\n"
+                last_status = status
+            else:
+                yield b": keepalive\n\n"
+            if status != "processing":
+                return
+            await _wait_for_task(task_id, SSE_KEEPALIVE_SECONDS)
+            current = await _lookup_task_status(task_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+def _get_queued_backtest_status(queue, task_id: str) -> Optional[Tuple[str, bytes]]:
+    """Map an RQ job's state onto BacktestStatusResponse."""
+    from rq.exceptions import NoSuchJobError
+    from rq.job import Job
+
+    try:
+        job = Job.fetch(task_id, connection=queue.connection)
+    except NoSuchJobError:
+        return None
+
+    job_status = job.get_status()
+    if job_status == "finished":
+        return "completed", _status_payload(task_id, "completed", job.return_value())
+    if job_status in ("failed", "stopped", "canceled"):
+        return "failed", _status_payload(task_id, "failed", error=job.exc_info or f"Job {job_status}")
+    return "processing", _status_payload(task_id, "processing")
+
+
 def get_scanner_service() -> ScannerService:
     """Get or create the ScannerService singleton."""
     global _scanner_service
@@ -190,9 +530,15 @@ def get_scanner_service() -> ScannerService:
 
 
 @router.post("/scan", response_model=ScanResponse)
-async def run_scan(request: ScanRequest):
+async def run_scan(raw_request: Request):
+    request = await _parse_body(raw_request, _SCAN_REQUEST_ADAPTER)
+    cache_key = request_cache_key("scan", request)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
     try:
-        return await get_scanner_service().scan(request)
+        result = await get_scanner_service().scan(request)
+        return _json_response(_SCAN_RESPONSE_ADAPTER, result, cache_key)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -208,45 +554,49 @@ async def get_storage_provider():
 
 @router.post("/settings/storage")
 async def update_storage_provider(settings: StorageSettingsUpdate):
-    """Update storage provider and reload services."""
-    start_provider = os.environ.get("HERMES_STORAGE_PROVIDER", "local")
-    
-    if settings.provider not in ["local", "cloudflare_r2", "oracle_object_storage"]:
-        raise HTTPException(status_code=400, detail=f"Invalid provider: {settings.provider}")
-    
-    # Update environment variable for the process
-    os.environ["HERMES_STORAGE_PROVIDER"] = settings.provider
-    logging.info(f"Switching storage provider: {start_provider} -> {settings.provider}")
-    
-    try:
-        # Clear DataSettings cache
-        get_settings.cache_clear()
-        
-        # Reset singletons to force recreation with new settings
-        global _market_data_service, _backtest_service, _scanner_service
-        _market_data_service = None
-        _backtest_service = None
-        _scanner_service = None
-        
-        # Validate connection by attempting to list instruments
-        svc = get_market_data_service()
-        instruments = svc.list_instruments()
-        
+    """Update storage provider and reload services.
+
+    Replacement services are built and probed off the event loop, then
+    swapped in together, so concurrent requests keep using the old,
+    fully constructed services until the switch succeeds.
+    """
+    global _market_data_service, _backtest_service, _scanner_service
+
+    async with _storage_switch_lock:
+        start_provider = os.environ.get("HERMES_STORAGE_PROVIDER", "local")
+
+        # Update environment variable for the process
+        os.environ["HERMES_STORAGE_PROVIDER"] = settings.provider
+        logging.info(f"Switching storage provider: {start_provider} -> {settings.provider}")
+
+        try:
+            # Clear DataSettings cache
+            get_settings.cache_clear()
+
+            # Validate connection by attempting to list instruments
+            svc = await asyncio.to_thread(MarketDataService)
+            instruments = await asyncio.to_thread(svc.list_instruments)
+        except Exception as e:
+            # Revert on failure; the existing services were never touched
+            logging.error(f"Failed to switch provider: {e}")
+            os.environ["HERMES_STORAGE_PROVIDER"] = start_provider
+            get_settings.cache_clear()
+
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to switch provider: {str(e)}. Reverted to {start_provider}."
+            )
+
+        # Swap dependants in order: data -> backtest -> scanner
+        backtest_service = BacktestService(svc)
+        _market_data_service = svc
+        _backtest_service = backtest_service
+        _scanner_service = ScannerService(backtest_service)
+        _response_cache.clear()
+
         return {
             "status": "success",
             "provider": settings.provider,
             "message": f"Switched to {settings.provider}",
             "instrument_count": len(instruments)
         }
-    except Exception as e:
-        # Revert on failure
-        logging.error(f"Failed to switch provider: {e}")
-        os.environ["HERMES_STORAGE_PROVIDER"] = start_provider
-        get_settings.cache_clear()
-        _market_data_service = None # Reset again to be safe
-        
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to switch provider: {str(e)}. Reverted to {start_provider}."
-        )
-
@@ -0,0 +1,19 @@
+"""Optional Numba JIT compilation.
+
+Numba is not a hard dependency: without it, `njit` returns the function
+unchanged and the kernels run as plain Python with identical results.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the interpreted loop
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorate(fn):
+            return fn
+        return decorate
+
+__all__ = ["njit"]
@@ -0,0 +1,48 @@
+"""Position-sizing and stop-loss kernels shared by the portfolio engines.
+
+PortfolioManager calls them from Python; FastEventEngine calls them from
+inside its compiled loop, so both apply exactly the same arithmetic.
+"""
+
+import numpy as np
+
+from engine._njit import njit
+
+
+@njit(cache=True)
+def calc_qty_pct_equity(equity, price, pct_equity):
+    """Shares for a pct_equity allocation (at least 1)."""
+    qty = equity * pct_equity / price if price > 0 else 0.0
+    return max(1.0, float(round(qty)))
+
+
+@njit(cache=True)
+def calc_qty_atr(equity, pct_equity, price, stop_loss_pct):
+    """Shares risking pct_equity of equity over a stop_loss_pct move (at least 1)."""
+    risk_per_share = price * stop_loss_pct
+    qty = equity * pct_equity / risk_per_share if risk_per_share > 0 else 0.0
+    return max(1.0, float(round(qty)))
+
+
+@njit(cache=True)
+def check_stop(close, avg_entry_price, stop_loss_pct):
+    """True when the loss from the average entry exceeds the stop."""
+    return (close - avg_entry_price) / avg_entry_price < -stop_loss_pct
+
+
+@njit(cache=True)
+def check_stops_vec(closes, avg_entry_prices, quantities, stop_loss_pct, out_mask):
+    """Fill out_mask with the long positions whose stop is breached."""
+    for k in range(closes.shape[0]):
+        out_mask[k] = (
+            quantities[k] > 0
+            and avg_entry_prices[k] != 0
+            and (closes[k] - avg_entry_prices[k]) / avg_entry_prices[k] < -stop_loss_pct
+        )
+    return out_mask
+
+
+def stop_mask(closes, avg_entry_prices, quantities, stop_loss_pct):
+    """Boolean mask of breached stops (allocates the output for check_stops_vec)."""
+    out = np.empty(closes.shape[0], dtype=np.bool_)
+    return check_stops_vec(closes, avg_entry_prices, quantities, stop_loss_pct, out)
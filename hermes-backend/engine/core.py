@@ -1,7 +1,6 @@
 import polars as pl
 import numpy as np
 import logging
-from typing import cast
 from .strategy import Strategy
 
 class BacktestEngine:
@@ -56,43 +55,43 @@ class BacktestEngine:
         
         logging.info("Calculating equity curve...")
         
-        # Calculate Asset Returns (Close to Close)
-        # Note: For minute data, this is minute-to-minute return.
         # Calculate Asset Returns (Close to Close)
         # Note: For minute data, this is minute-to-minute return.
         # SAFETY: Handle Division by Zero or NaN results immediately.
         # If prev_close is 0 or NaN (should be filtered, but double check), result is Inf/NaN.
         # We fill invalid returns with 0.0 (Flat).
-        
-        df = df.with_columns([
+        market_return = (
             (pl.col("close") / pl.col("close").shift(1) - 1)
             .fill_nan(0.0)
             .fill_null(0.0)
-            .alias("market_return")
-        ])
+        )
         
         # Position Logic: Signal at T affects Return at T+1
-        df = df.with_columns([
-            pl.col("signal").shift(1).fill_null(0).alias("position")
-        ])
+        # fill_null (not shift's fill_value) on purpose: broadcast MTF signals
+        # are null before the first higher-timeframe bar and mean "flat"
+        position = pl.col("signal").shift(1).fill_null(0)
         
-        # Strategy Returns
-        # We handle both Nulls (shift artifact) and NaNs (div by zero potential)
         # Strategy Returns
         # We handle both Nulls (shift artifact) and NaNs (div by zero potential)
         # SAFETY: Ensure strategy return doesn't explode.
-        df = df.with_columns([
-            (pl.col("position") * pl.col("market_return"))
-            .fill_null(0.0)
-            .fill_nan(0.0)
-            .alias("strategy_return")
-        ])
+        strategy_return = (position * market_return).fill_null(0.0).fill_nan(0.0)
+        
+        # All three columns are derived in one lazy with_columns, so Polars
+        # shares the common subexpressions and scans the frame once instead
+        # of materializing an intermediate DataFrame per step.
+        df = df.lazy().with_columns([
+            market_return.alias("market_return"),
+            position.alias("position"),
+            strategy_return.alias("strategy_return"),
+        ]).collect()
         
         # Equity Curve
-        # Cumulative Product of (1 + return) * initial_cash
-        df = df.with_columns([
-            (self.initial_cash * (1 + pl.col("strategy_return")).cum_prod()).alias("equity")
-        ])
+        # Cumulative Product of (1 + return) * initial_cash, as one np.cumprod
+        # over a contiguous Float64 array (also when prices were loaded as
+        # Float32, so rounding does not accumulate over long series)
+        returns = df["strategy_return"].cast(pl.Float64).to_numpy()
+        equity = self.initial_cash * np.cumprod(1.0 + returns)
+        df = df.with_columns(pl.Series("equity", equity))
         
         return df
 
@@ -100,32 +99,29 @@ class BacktestEngine:
         """
         Calculates key performance metrics.
         """
-        total_return = (df["equity"][-1] / self.initial_cash) - 1
+        # Computed on contiguous float64 NumPy views: one accumulate/ufunc
+        # pass each instead of allocating intermediate Polars Series.
+        equity = df["equity"].to_numpy()
+        total_return = (equity[-1] / self.initial_cash) - 1
         
         # Max Drawdown
-        equity = df["equity"]
-        running_max = equity.cum_max()
-        drawdown = (equity - running_max) / running_max
-        max_drawdown = drawdown.min()
+        max_drawdown = float((equity / np.maximum.accumulate(equity) - 1.0).min())
         
         # Sharpe Ratio (Simplified for Minute Data)
         # We generalize to Annualized Sharpe
         # Minutes per year (trading) ~= 6.5 hours * 60 * 252 ~= 98280
         # This is a rough approximation.
-        returns = df["strategy_return"].drop_nulls()
-        if len(returns) > 0:
-            mean_ret = cast(float, returns.mean())
-            std_dev = cast(float, returns.std())
-            sharpe = 0.0
-            # Ensure not None and not zero
-            if mean_ret is not None and std_dev is not None and std_dev != 0:
-                sharpe = float((mean_ret / std_dev) * np.sqrt(252 * 375))
-        else:
-            sharpe = 0.0
+        returns = df["strategy_return"].to_numpy()
+        returns = returns[~np.isnan(returns)]
+        sharpe = 0.0
+        if returns.size > 1:
+            std_dev = returns.std(ddof=1)  # sample std, as Polars' Series.std
+            if std_dev != 0:
+                sharpe = float((returns.mean() / std_dev) * np.sqrt(252 * 375))
 
         return {
             "Total Return": f"{total_return:.2%}",
-            "Max Drawdown": f"{cast(float, max_drawdown or 0.0):.2%}",
+            "Max Drawdown": f"{max_drawdown:.2%}",
             "Sharpe Ratio": f"{sharpe:.2f}",
-            "Final Equity": f"{df['equity'][-1]:.2f}"
+            "Final Equity": f"{equity[-1]:.2f}"
         }
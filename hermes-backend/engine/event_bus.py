@@ -1,39 +1,86 @@
-from typing import Callable, List, Dict, Type
-from collections import defaultdict
+from typing import Callable, Deque, Dict, Iterable, Tuple, Type
+from collections import deque
+from itertools import groupby
 from .events import Event
-import queue
+
+Listener = Callable[[Event], None]
+
+_NO_LISTENERS: Tuple[Listener, ...] = ()
 
 class EventBus:
     """
     Simple Event Bus (Publisher/Subscriber).
+
+    The backtest loop is single-threaded, so events sit in a plain deque
+    rather than a locking queue.Queue. Listeners are kept as an immutable
+    tuple per event class, rebuilt on (un)subscribe, so delivery is a plain
+    loop over a tuple with no per-event branching.
     """
     def __init__(self):
-        self._listeners: Dict[Type[Event], List[Callable[[Event], None]]] = defaultdict(list)
-        self._queue = queue.Queue()
+        self._listeners: Dict[Type[Event], Tuple[Listener, ...]] = {}
+        self._queue: Deque[Event] = deque()
 
-    def subscribe(self, event_type: Type[Event], listener: Callable[[Event], None]):
+    def subscribe(self, event_type: Type[Event], listener: Listener):
         """Subscribe a listener to a specific event type."""
-        self._listeners[event_type].append(listener)
+        self._listeners[event_type] = self._listeners.get(event_type, _NO_LISTENERS) + (listener,)
+
+    def unsubscribe(self, event_type: Type[Event], listener: Listener):
+        """Remove a listener; unknown listeners are ignored."""
+        remaining = tuple(
+            existing for existing in self._listeners.get(event_type, _NO_LISTENERS)
+            if existing != listener
+        )
+        if remaining:
+            self._listeners[event_type] = remaining
+        else:
+            self._listeners.pop(event_type, None)
 
     def publish(self, event: Event):
         """Push event to queue."""
-        self._queue.put(event)
+        self._queue.append(event)
+
+    def publish_many(self, events: Iterable[Event]):
+        """Push a batch of events to the queue in one extend call."""
+        self._queue.extend(events)
+
+    def dispatch(self, event: Event):
+        """Deliver an event to its listeners immediately, bypassing the queue.
+
+        Used for the market event that starts each bar: the queue is empty at
+        that point, so enqueueing it only to dequeue it again is wasted work.
+        Events the listeners publish are still queued for process_all.
+        """
+        for listener in self._listeners.get(type(event), _NO_LISTENERS):
+            listener(event)
+
+    def dispatch_many(self, events: Iterable[Event]):
+        """Deliver a batch immediately, looking listeners up once per run of
+        same-typed events rather than once per event."""
+        listeners_for = self._listeners.get
+        for event_type, run in groupby(events, key=type):
+            listeners = listeners_for(event_type, _NO_LISTENERS)
+            for event in run:
+                for listener in listeners:
+                    listener(event)
 
     def process_next(self):
-        """Process the next event in the queue."""
-        if self._queue.empty():
+        """Process the next event in the queue.
+
+        Single-step helper (tests, debugging); the engine drains the queue
+        with process_all, which does not pay a call per event.
+        """
+        if not self._queue:
             return False
-            
-        event = self._queue.get()
-        event_type = type(event)
-        
-        if event_type in self._listeners:
-            for listener in self._listeners[event_type]:
-                listener(event)
-        
+
+        self.dispatch(self._queue.popleft())
         return True
 
     def process_all(self):
-        """Process all events currently in queue."""
-        while not self._queue.empty():
-            self.process_next()
+        """Process all events currently in queue (including ones published meanwhile)."""
+        pending = self._queue
+        listeners_for = self._listeners.get
+        # Inlined process_next: saves a method call per event
+        while pending:
+            event = pending.popleft()
+            for listener in listeners_for(type(event), _NO_LISTENERS):
+                listener(event)
@@ -24,15 +24,19 @@ class EventEngine:
         """
         logging.info("Starting Event Loop")
         
+        # Bound methods hoisted out of the per-bar loop
+        dispatch = self.bus.dispatch
+        process_all = self.bus.process_all
+        
         for event in data_iterator:
             if not self.continue_backtest:
                 break
                 
-            # Publish Market Event
-            self.bus.publish(event)
+            # Deliver Market Event straight to subscribers (no queue round-trip)
+            dispatch(event)
             
             # Process all resulting events (Signals, Orders, Fills)
-            self.bus.process_all()
+            process_all()
             
         logging.info("Event Loop Finished")
 
@@ -1,11 +1,19 @@
-from typing import Optional
+from typing import List, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 class Event:
-    """Base Event Class"""
-    pass
+    """
+    Base Event Class.
 
-@dataclass
+    Events are created per bar, order and fill, so subclasses are slotted
+    dataclasses: no per-instance __dict__, smaller objects and faster
+    attribute access in the event loop.
+    """
+    __slots__ = ()
+
+@dataclass(slots=True)
 class MarketEvent(Event):
     """
     Market Data Update Event.
@@ -19,7 +27,19 @@ class MarketEvent(Event):
     close: float
     volume: float
     
-@dataclass
+@dataclass(slots=True)
+class MarketBatchEvent(Event):
+    """
+    Market Data Update for several symbols at one timestamp.
+    symbol_ids index the universe registered with the PortfolioManager;
+    close is aligned with symbols/symbol_ids.
+    """
+    time: int
+    symbols: List[str]
+    symbol_ids: np.ndarray
+    close: np.ndarray
+
+@dataclass(slots=True)
 class SignalEvent(Event):
     """
     Signal generated by the Strategy.
@@ -30,7 +50,7 @@ class SignalEvent(Event):
     strength: float = 1.0
     strategy_id: str = "UNKNOWN"
 
-@dataclass
+@dataclass(slots=True)
 class OrderEvent(Event):
     """
     Order execution request.
@@ -42,15 +62,18 @@ class OrderEvent(Event):
     direction: str # "BUY", "SELL"
     limit_price: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class FillEvent(Event):
     """
     Order Fill Confirmation.
+
+    fill_cost (per-unit fill price) and commission are always floats;
+    execution handlers set them when the fill is built.
     """
     time: int
     symbol: str
     exchange: str
     quantity: float
     direction: str
-    fill_cost: Optional[float] = None
-    commission: Optional[float] = None
+    fill_cost: float
+    commission: float = 0.0
@@ -7,6 +7,8 @@ Replaces MockExecutionHandler with realistic order matching that considers:
 """
 
 import logging
+from math import inf, sqrt
+from typing import Callable
 
 from engine.event_bus import EventBus
 from engine.events import FillEvent, MarketEvent, OrderEvent
@@ -43,6 +45,7 @@ class VolumeAwareExecutionHandler:
         self.bus = bus
         self.slippage = slippage
         self.commission = commission
+        # Also binds _calculate_fill_quantity for this rate
         self.max_participation_rate = max_participation_rate
 
         # Track latest bar data
@@ -68,18 +71,38 @@ class VolumeAwareExecutionHandler:
         self.last_high = event.high
         self.last_low = event.low
 
-    def _calculate_fill_quantity(self, requested_qty: float) -> float:
-        """Calculate fillable quantity based on volume constraints.
+    @property
+    def max_participation_rate(self) -> float:
+        return self._max_participation_rate
 
-        Returns:
-            Actual quantity that can be filled (may be less than requested)
-        """
-        if self.last_volume <= 0:
-            # No volume data — fill full quantity (fallback)
-            return requested_qty
+    @max_participation_rate.setter
+    def max_participation_rate(self, rate: float) -> None:
+        # Fill sizing is specialized per rate; rebuild it on every change
+        self._max_participation_rate = rate
+        self._calculate_fill_quantity = self._make_fill_calc(rate)
 
-        max_fill = self.last_volume * self.max_participation_rate
-        return min(requested_qty, max(1.0, max_fill))
+    def _make_fill_calc(self, rate: float) -> Callable[[float], float]:
+        """Build the fill-quantity function for a participation rate.
+
+        The returned function takes the requested quantity and returns the
+        actual quantity that can be filled (may be less than requested).
+        """
+        if rate == 1.0:
+            # Full participation: the cap is the bar volume itself
+            def full_volume(requested_qty: float) -> float:
+                volume = self.last_volume
+                if volume <= 0:
+                    return requested_qty
+                return min(requested_qty, max(1.0, volume))
+            return full_volume
+
+        def volume_capped(requested_qty: float) -> float:
+            volume = self.last_volume
+            if volume <= 0:
+                # No volume data — fill full quantity (fallback)
+                return requested_qty
+            return min(requested_qty, max(1.0, volume * rate))
+        return volume_capped
 
     def _calculate_slippage(
         self,
@@ -96,26 +119,17 @@ class VolumeAwareExecutionHandler:
             Fill price after slippage
         """
         # Calculate participation rate for impact
-        if self.last_volume > 0:
-            participation = fill_qty / self.last_volume
-        else:
-            participation = 0.0
+        volume = self.last_volume
+        participation = fill_qty / volume if volume > 0 else 0.0
 
         # Square-root impact model: impact = slippage * sqrt(participation)
-        impact_factor = self.slippage * (participation ** 0.5) if participation > 0 else self.slippage
+        impact_factor = self.slippage * sqrt(participation) if participation > 0 else self.slippage
 
-        if direction == "BUY":
-            fill_price = base_price * (1 + impact_factor)
-            # Cap at bar high (can't fill above the high)
-            if self.last_high > 0:
-                fill_price = min(fill_price, self.last_high)
-        else:
-            fill_price = base_price * (1 - impact_factor)
-            # Floor at bar low (can't fill below the low)
-            if self.last_low > 0:
-                fill_price = max(fill_price, self.last_low)
-
-        return fill_price
+        # Buys pay up, sells give up; the fill stays inside the bar's
+        # [low, high] range (a bound of 0 means unknown and is ignored)
+        sign = 1.0 if direction == "BUY" else -1.0
+        fill_price = base_price * (1.0 + sign * impact_factor)
+        return min(self.last_high or inf, max(self.last_low or 0.0, fill_price))
 
     def on_order(self, event: OrderEvent) -> None:
         """Process an order event with volume-aware matching."""
@@ -126,13 +140,13 @@ class VolumeAwareExecutionHandler:
             # Check if limit price is executable
             if event.direction == "BUY" and event.limit_price < self.last_low:
                 logger.debug(
-                    f"Limit BUY order rejected: limit={event.limit_price} < low={self.last_low}"
+                    "Limit BUY order rejected: limit=%s < low=%s", event.limit_price, self.last_low
                 )
                 self.total_rejected += 1
                 return
             if event.direction == "SELL" and event.limit_price > self.last_high:
                 logger.debug(
-                    f"Limit SELL order rejected: limit={event.limit_price} > high={self.last_high}"
+                    "Limit SELL order rejected: limit=%s > high=%s", event.limit_price, self.last_high
                 )
                 self.total_rejected += 1
                 return
@@ -141,7 +155,7 @@ class VolumeAwareExecutionHandler:
             base_price = self.last_price
 
         if base_price <= 0:
-            logger.warning(f"Cannot fill order: no valid price for {event.symbol}")
+            logger.warning("Cannot fill order: no valid price for %s", event.symbol)
             self.total_rejected += 1
             return
 
@@ -152,9 +166,9 @@ class VolumeAwareExecutionHandler:
         if is_partial:
             self.total_partial_fills += 1
             logger.debug(
-                f"Partial fill for {event.symbol}: "
-                f"requested={event.quantity}, filled={fill_qty} "
-                f"(vol={self.last_volume}, rate={self.max_participation_rate})"
+                "Partial fill for %s: requested=%s, filled=%s (vol=%s, rate=%s)",
+                event.symbol, event.quantity, fill_qty,
+                self.last_volume, self.max_participation_rate,
             )
 
         # Calculate slippage-adjusted price
@@ -178,14 +192,23 @@ class VolumeAwareExecutionHandler:
 
     def stats(self) -> dict:
         """Get execution statistics."""
-        return {
-            "total_orders": self.total_orders,
-            "total_fills": self.total_fills,
-            "total_partial_fills": self.total_partial_fills,
-            "total_rejected": self.total_rejected,
-            "fill_rate": (
-                f"{self.total_fills / self.total_orders * 100:.1f}%"
-                if self.total_orders > 0
-                else "N/A"
-            ),
-        }
+        return execution_stats(
+            self.total_orders, self.total_fills, self.total_partial_fills, self.total_rejected
+        )
+
+
+def execution_stats(
+    total_orders: int, total_fills: int, total_partial_fills: int, total_rejected: int
+) -> dict:
+    """Execution statistics in the shape reported with event backtests."""
+    return {
+        "total_orders": total_orders,
+        "total_fills": total_fills,
+        "total_partial_fills": total_partial_fills,
+        "total_rejected": total_rejected,
+        "fill_rate": (
+            f"{total_fills / total_orders * 100:.1f}%"
+            if total_orders > 0
+            else "N/A"
+        ),
+    }
@@ -0,0 +1,250 @@
+"""Compiled fast path for event-driven backtests of signal-column strategies.
+
+EventEngine dispatches Python objects through the EventBus for every bar,
+which is flexible but interpreter-bound. When a strategy's decisions are
+already available as a vectorized `signal` column (target position, as
+produced by `Strategy.generate_signals`), the same portfolio and execution
+rules can run as one tight loop over NumPy arrays.
+
+The loop mirrors, for a single long-only symbol:
+- PortfolioManager: sizing, max-position limit, cash check, stop-loss
+- VolumeAwareExecutionHandler: participation cap, square-root impact,
+  high/low price bounds, per-unit commission
+
+It is JIT-compiled with Numba when available and otherwise runs as plain
+Python with identical results.
+"""
+
+from dataclasses import dataclass
+from math import inf, sqrt
+from typing import Optional
+
+import numpy as np
+import polars as pl
+
+from engine._njit import njit
+from engine._portfolio_kernels import calc_qty_atr, calc_qty_pct_equity, check_stop
+from engine.execution import execution_stats
+from engine.portfolio import RiskParams
+
+
+SIZING_METHODS = {"fixed": 0, "pct_equity": 1, "atr_based": 2}
+
+BUY = 1
+SELL = -1
+
+
+@njit(cache=True)
+def _execute(side, quantity, close, high, low, volume, slippage, commission, max_participation_rate):
+    """Fill one market order against a bar (VolumeAwareExecutionHandler rules).
+
+    Returns (fill_qty, fill_price, commission); fill_qty is 0.0 if rejected.
+    """
+    if close <= 0:
+        return 0.0, 0.0, 0.0
+
+    fill_qty = quantity
+    if volume > 0:
+        fill_qty = min(quantity, max(1.0, volume * max_participation_rate))
+
+    participation = fill_qty / volume if volume > 0 else 0.0
+    impact = slippage * sqrt(participation) if participation > 0 else slippage
+
+    price = close * (1.0 + side * impact)
+    price = min(high if high > 0 else inf, max(low if low > 0 else 0.0, price))
+
+    return fill_qty, price, commission * fill_qty
+
+
+@njit(cache=True)
+def _simulate(
+    close, high, low, volume, target,
+    initial_cash, sizing, fixed_quantity, pct_equity, max_position_pct, stop_loss_pct,
+    slippage, commission, max_participation_rate,
+):
+    """Run the bar loop; returns per-bar equity/cash, fill arrays and counters.
+
+    Within a bar, orders are created from the pre-fill state (signal first,
+    then stop-loss) and filled stop-first, matching the EventBus queue order.
+    """
+    n = close.shape[0]
+    equity_out = np.empty(n)
+    cash_out = np.empty(n)
+    # At most one signal order and one stop order per bar
+    fill_bar = np.empty(2 * n, np.int64)
+    fill_side = np.empty(2 * n, np.int64)
+    fill_qty = np.empty(2 * n)
+    fill_price = np.empty(2 * n)
+    fill_commission = np.empty(2 * n)
+    n_fills = 0
+    n_orders = 0
+    n_partial = 0
+    n_rejected = 0
+
+    cash = initial_cash
+    qty = 0.0
+    avg_price = 0.0
+    prev_target = 0.0
+
+    for t in range(n):
+        price = close[t]
+        equity = cash + qty * price
+
+        # 1. Signal -> order (PortfolioManager.on_signal)
+        order_side = 0
+        order_qty = 0.0
+        if target[t] > 0 and prev_target <= 0:
+            if qty == 0.0:
+                if sizing == 1:
+                    q = calc_qty_pct_equity(equity, price, pct_equity)
+                elif sizing == 2:
+                    q = calc_qty_atr(equity, pct_equity, price, stop_loss_pct)
+                else:
+                    q = fixed_quantity
+
+                max_additional = equity * max_position_pct
+                if max_additional <= 0:
+                    q = 0.0
+                else:
+                    max_qty = max_additional / price if price > 0 else 0.0
+                    q = min(q, max(1.0, round(max_qty)))
+
+                if q > 0 and price > 0:
+                    if q * price > cash:
+                        q = max(1.0, round(cash / price) - 1)
+                    order_side = BUY
+                    order_qty = q
+        elif target[t] <= 0 and prev_target > 0:
+            if qty > 0:
+                order_side = SELL
+                order_qty = qty
+        prev_target = target[t]
+
+        # 2. Stop-loss (PortfolioManager.on_bar)
+        stop_qty = 0.0
+        if qty > 0 and check_stop(price, avg_price, stop_loss_pct):
+            stop_qty = qty
+
+        # 3. Fills: stop order first, then the signal order
+        for k in range(2):
+            if k == 0:
+                side = SELL
+                q = stop_qty
+            else:
+                side = order_side
+                q = order_qty
+            if side == 0 or q <= 0:
+                continue
+
+            n_orders += 1
+            f_qty, f_price, f_comm = _execute(
+                side, q, price, high[t], low[t], volume[t],
+                slippage, commission, max_participation_rate,
+            )
+            if f_qty <= 0:
+                n_rejected += 1
+                continue
+            if f_qty < q:
+                n_partial += 1
+
+            if side == BUY:
+                cash -= f_qty * f_price + f_comm
+                new_qty = qty + f_qty
+                if new_qty > 0:
+                    avg_price = (avg_price * qty + f_price * f_qty) / new_qty
+                qty = new_qty
+            else:
+                cash += f_qty * f_price - f_comm
+                qty -= f_qty
+                if qty <= 0:
+                    qty = 0.0
+                    avg_price = 0.0
+
+            fill_bar[n_fills] = t
+            fill_side[n_fills] = side
+            fill_qty[n_fills] = f_qty
+            fill_price[n_fills] = f_price
+            fill_commission[n_fills] = f_comm
+            n_fills += 1
+
+        equity_out[t] = cash + qty * price
+        cash_out[t] = cash
+
+    return (
+        equity_out, cash_out,
+        fill_bar[:n_fills], fill_side[:n_fills], fill_qty[:n_fills],
+        fill_price[:n_fills], fill_commission[:n_fills],
+        n_orders, n_partial, n_rejected,
+    )
+
+
+@dataclass
+class FastEventResult:
+    """Output of FastEventEngine.run.
+
+    Attributes:
+        equity: Per-bar [timestamp, equity, cash] after the bar's fills
+        fills: [timestamp, direction, quantity, price, commission]
+        stats: Execution statistics, as VolumeAwareExecutionHandler.stats()
+    """
+    equity: pl.DataFrame
+    fills: pl.DataFrame
+    stats: dict
+
+
+class FastEventEngine:
+    """Event-driven backtest over arrays for strategies with a signal column.
+
+    Accepts the same inputs as the EventEngine setup in BacktestService
+    (cash, RiskParams, slippage, commission, participation rate) but
+    consumes a DataFrame with [timestamp, high, low, close, volume, signal].
+    A rising signal (<= 0 to > 0) acts as LONG, a falling one as EXIT.
+    """
+
+    def __init__(
+        self,
+        initial_cash: float = 100000.0,
+        risk_params: Optional[RiskParams] = None,
+        slippage: float = 0.001,
+        commission: float = 0.0,
+        max_participation_rate: float = 0.10,
+    ):
+        self.initial_cash = initial_cash
+        self.risk_params = risk_params or RiskParams()
+        self.slippage = slippage
+        self.commission = commission
+        self.max_participation_rate = max_participation_rate
+
+    def run(self, df: pl.DataFrame) -> FastEventResult:
+        if "signal" not in df.columns:
+            raise ValueError("FastEventEngine requires a 'signal' column.")
+
+        # Extract contiguous float64 arrays once
+        arrays = df.select(
+            pl.col(c).cast(pl.Float64).fill_null(0.0) for c in ("close", "high", "low", "volume", "signal")
+        )
+        close, high, low, volume, target = (arrays[c].to_numpy() for c in arrays.columns)
+
+        rp = self.risk_params
+        (
+            equity, cash, bars, sides, qty, price, commission,
+            n_orders, n_partial, n_rejected,
+        ) = _simulate(
+            close, high, low, volume, target,
+            float(self.initial_cash), SIZING_METHODS.get(rp.sizing_method, 0),
+            float(rp.fixed_quantity), float(rp.pct_equity), float(rp.max_position_pct),
+            float(rp.stop_loss_pct), float(self.slippage), float(self.commission),
+            float(self.max_participation_rate),
+        )
+
+        timestamps = df["timestamp"]
+        equity_df = pl.DataFrame({"timestamp": timestamps, "equity": equity, "cash": cash})
+        fills_df = pl.DataFrame({
+            "timestamp": timestamps.gather(bars),
+            "direction": np.where(sides == BUY, "BUY", "SELL"),
+            "quantity": qty,
+            "price": price,
+            "commission": commission,
+        })
+        stats = execution_stats(int(n_orders), len(fills_df), int(n_partial), int(n_rejected))
+        return FastEventResult(equity=equity_df, fills=fills_df, stats=stats)
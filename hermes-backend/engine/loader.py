@@ -1,14 +1,27 @@
 import os
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 import polars as pl
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import logging
 
+from hermes_data.providers import filter_date_range
+
+from .events import MarketEvent
+
+# Upper bound on concurrent per-symbol reads in iter_market_events
+MAX_PREFETCH_WORKERS = 32
+
 class DataLoader:
     """
     Efficiently loads stock data from Parquet files using Polars.
     """
     def __init__(self, data_dir: str):
+        """
+        Args:
+            data_dir: Directory holding one {SYMBOL}.parquet file per symbol
+        """
         self.data_dir = data_dir
         if not os.path.exists(data_dir):
             raise FileNotFoundError(f"Data directory not found: {data_dir}")
@@ -23,72 +36,151 @@ class DataLoader:
         Loads data for multiple symbols into a single stacked DataFrame.
         Schema: [timestamp, open, high, low, close, volume, oi, symbol]
         """
-        dfs = []
-        
+        paths = self._resolve_paths(symbols)
+        if not paths:
+            raise ValueError("No data loaded for any of the provided symbols.")
+
+        # One lazy scan over all files: Polars reads them in parallel under a
+        # single plan and pushes the filters into the Parquet reader.
+        # Sort by timestamp (crucial for backtesting)
+        # For a centralized event loop, (timestamp, symbol) is better.
+        combined_lazy = self._scan(paths, *self._parse_range(start_date, end_date)).sort(
+            ["timestamp", "symbol"]
+        )
+
+        logging.info(f"Materializing data for {len(paths)} symbols...")
+        # Streaming engine: the scan -> filter -> sort pipeline runs in
+        # batches, so peak memory stays bounded for large universes
+        final_df = combined_lazy.collect(engine="streaming")
+
+        logging.info(f"Loaded {len(final_df)} rows.")
+        return final_df
+
+    def iter_market_events(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Iterator[MarketEvent]:
+        """
+        Yields MarketEvents for multiple symbols in (timestamp, symbol) order.
+
+        Each symbol is loaded and guarded on its own, then the per-symbol
+        streams are k-way merged with heapq.merge. Files written by the
+        ingest pipeline are already time-ordered, so this replaces the
+        global sort of load_data with an O(N log S) merge for the event loop.
+        """
+        start_dt, end_dt = self._parse_range(start_date, end_date)
+
+        paths = sorted(self._resolve_paths(symbols))
+        if not paths:
+            return
+
+        # Per-symbol reads are independent: fan them out so footer reads and
+        # decoding of one file overlap IO on the others (Polars releases
+        # the GIL while collecting)
+        with ThreadPoolExecutor(max_workers=min(MAX_PREFETCH_WORKERS, len(paths))) as pool:
+            frames = list(pool.map(lambda path: self._load_bars(path, start_dt, end_dt), paths))
+
+        # Iterables are merged stably and paths are sorted by symbol, so
+        # timestamp ties break in symbol order, matching load_data
+        streams = [frame.iter_rows() for frame in frames]
+
+        for ts, symbol, open_, high, low, close, volume in heapq.merge(
+            *streams, key=lambda bar: bar[0]
+        ):
+            yield MarketEvent(
+                time=ts,
+                symbol=symbol,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume
+            )
+
+    def _load_bars(
+        self, path: str, start_dt: Optional[datetime], end_dt: Optional[datetime]
+    ) -> pl.DataFrame:
+        """One guarded symbol file as [epoch_s, symbol, o, h, l, c, v], time-ordered."""
+        lazy = self._scan([path], start_dt, end_dt)
+        if "volume" not in lazy.collect_schema().names():
+            lazy = lazy.with_columns(pl.lit(0.0).alias("volume"))
+        df = lazy.select(
+            pl.col("timestamp").dt.epoch("s"),
+            "symbol", "open", "high", "low", "close",
+            pl.col("volume").cast(pl.Float64).fill_null(0.0),
+        ).collect(engine="streaming")
+        # Only resort when a file is not already time-ordered
+        if not df["timestamp"].is_sorted():
+            df = df.sort("timestamp")
+        return df
+
+    def _resolve_paths(self, symbols: List[str]) -> List[str]:
+        """Parquet paths for the symbols that exist; missing ones are logged."""
+        paths = []
         for symbol in symbols:
             file_path = os.path.join(self.data_dir, f"{symbol}.parquet")
             if not os.path.exists(file_path):
                 logging.warning(f"Data for {symbol} not found at {file_path}")
                 continue
-            
-            # Lazy Scan
-            lazy_df = pl.scan_parquet(file_path)
-            
+            paths.append(file_path)
+        return paths
+
+    @staticmethod
+    def _parse_range(
+        start_date: Optional[str], end_date: Optional[str]
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Parses the YYYY-MM-DD bounds once per load."""
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+        return start_dt, end_dt
+
+    def _scan(
+        self,
+        paths: List[str],
+        start_dt: Optional[datetime] = None,
+        end_dt: Optional[datetime] = None
+    ) -> pl.LazyFrame:
+        """
+        Lazy, guarded scan with naive timestamps and a symbol column taken
+        from the file name.
+
+        The date range is applied to the raw timestamp column, before the
+        timezone normalization, so it is pushed into the Parquet reader.
+        """
+        lazy = pl.scan_parquet(paths, include_file_paths="__path__", hive_partitioning=False)
+
+        lazy = filter_date_range(lazy, start_dt, end_dt)
+
+        lazy = lazy.with_columns(
             # NORMALIZATION: Ensure timestamp is Naive (Wall Clock)
             # This handles UTC-aware parquet files by dropping timezone info
-            # matching the naive datetime objects from user input.
-            lazy_df = lazy_df.with_columns(
-                pl.col("timestamp").dt.replace_time_zone(None)
-            )
-            
-            # Filter by Date
-            if start_date:
-                s_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                lazy_df = lazy_df.filter(pl.col("timestamp") >= s_dt)
-            
-            if end_date:
-                e_dt = datetime.strptime(end_date, "%Y-%m-%d")
-                lazy_df = lazy_df.filter(pl.col("timestamp") <= e_dt)
-            
-            # Add Symbol Column (needed for stacked df)
-            lazy_df = lazy_df.with_columns(pl.lit(symbol).alias("symbol"))
-            
-            dfs.append(lazy_df)
-            
-        if not dfs:
-            raise ValueError("No data loaded for any of the provided symbols.")
-            
-        # Concat all lazy frames and collect
-        # This is very efficient in Polars
-        combined_lazy = pl.concat(dfs)
-        
-        # Sort by timestamp (crucial for backtesting)
-        # Note: Depending on strategy, we might sort by (symbol, timestamp) or (timestamp, symbol)
-        # For a centralized event loop, (timestamp, symbol) is better.
-        combined_lazy = combined_lazy.sort(["timestamp", "symbol"])
+            pl.col("timestamp").dt.replace_time_zone(None),
+            pl.col("__path__").str.extract(r"([^/\\]+)\.parquet$", 1).alias("symbol"),
+        ).drop("__path__")
 
         # --- DATA GUARD (Robustness) ---
         # 1. Filter out invalid prices (<= 0)
         # 2. Drop rows with Nulls in critical columns
         # This ensures AUTHENTICITY: we never backtest on fake/zero data.
-        
         logging.info("Applying Data Guard: Filtering invalid prices and nulls...")
-        combined_lazy = combined_lazy.filter(
-            (pl.col("close") > 0) & 
-            (pl.col("open") > 0) & 
-            (pl.col("high") > 0) & 
-            (pl.col("low") > 0)
-        ).filter(
+        return lazy.filter(self._guard_predicate()).drop_nulls(
+            subset=["close", "open", "high", "low"]
+        )
+
+    @staticmethod
+    def _guard_predicate() -> pl.Expr:
+        """Price and OHLC integrity checks as one predicate."""
+        return (
+            (pl.col("close") > 0)
+            & (pl.col("open") > 0)
+            & (pl.col("high") > 0)
+            & (pl.col("low") > 0)
             # Integrity Checks (High must be highest, Low must be lowest)
-            (pl.col("high") >= pl.col("low")) &
-            (pl.col("high") >= pl.col("open")) &
-            (pl.col("high") >= pl.col("close")) &
-            (pl.col("low") <= pl.col("open")) &
-            (pl.col("low") <= pl.col("close"))
-        ).drop_nulls(subset=["close", "open", "high", "low"])
-        
-        logging.info(f"Materializing data for {len(symbols)} symbols...")
-        final_df = combined_lazy.collect()
-        
-        logging.info(f"Loaded {len(final_df)} rows.")
-        return final_df
+            & (pl.col("high") >= pl.col("low"))
+            & (pl.col("high") >= pl.col("open"))
+            & (pl.col("high") >= pl.col("close"))
+            & (pl.col("low") <= pl.col("open"))
+            & (pl.col("low") <= pl.col("close"))
+        )
@@ -1,9 +1,16 @@
+from typing import List, Tuple, TypeVar, Union
+
+import numpy as np
 import polars as pl
 
-def resample_data(df: pl.DataFrame, interval: str = "1d") -> pl.DataFrame:
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+def resample_data(df: FrameT, interval: str = "1d") -> FrameT:
     """
     Resamples minute data to a higher timeframe.
     Input df must have 'timestamp', 'open', 'high', 'low', 'close', 'volume'.
+    A LazyFrame stays lazy, so sort + group_by_dynamic + aggregation (and
+    whatever the caller chains on) run as one plan and are collected once.
     """
     # Define aggregation rules
     # We use 'timestamp' as the grouping key via dynamic_group_by if needed, 
@@ -30,7 +37,7 @@ def resample_data(df: pl.DataFrame, interval: str = "1d") -> pl.DataFrame:
     )
     return q
 
-def merge_mtf(minute_df: pl.DataFrame, higher_tf_df: pl.DataFrame, suffix: str = "_htf") -> pl.DataFrame:
+def merge_mtf(minute_df: FrameT, higher_tf_df: Union[pl.DataFrame, pl.LazyFrame], suffix: str = "_htf") -> FrameT:
     """
     Merges higher timeframe data onto minute data.
     CRITICAL: Uses Forward Fill to ensure no lookahead bias.
@@ -43,24 +50,63 @@ def merge_mtf(minute_df: pl.DataFrame, higher_tf_df: pl.DataFrame, suffix: str =
     However, a simpler verifyable approach is:
     1. Upsample HTF data to Minute frequency (forward fill).
     2. Join on timestamp.
+
+    A lazy minute_df is joined lazily with join_asof (a lazy HTF frame is
+    kept lazy too); eager frames use the index alignment below.
     """
     
     # ALIGNMENT STRATEGY:
-    # 1. Rename columns in HTF
-    # Rename ALL columns except timestamp to avoid collisions
-    # Renaming logic
-    rename_map = {col: f"{col}{suffix}" for col in higher_tf_df.columns if col != "timestamp"}
-    htf_renamed = higher_tf_df.rename(rename_map)
-    
-    # 2. Join_asof (Left Join)
-    # Join minute_df with htf_renamed on timestamp.
-    # distinct strategy='backward' means: for a minute row, find the LATEST htf row that is <= minute_time.
+    # 1. Suffixed names for ALL HTF columns except timestamp, to avoid
+    # collisions. The columns are aliased while gathering below, so the HTF
+    # frame itself is never renamed.
+    htf_names = _suffixed_names(higher_tf_df.collect_schema().names(), suffix)
+
+    if isinstance(minute_df, pl.LazyFrame):
+        return minute_df.sort("timestamp").join_asof(
+            higher_tf_df.lazy().rename(dict(htf_names)).sort("timestamp"),
+            on="timestamp",
+            strategy="backward",
+        )
+    if isinstance(higher_tf_df, pl.LazyFrame):
+        higher_tf_df = higher_tf_df.collect()
+
+    # 2. Backward as-of alignment by index
+    # For a minute row, take the LATEST htf row that is <= minute_time.
     # This effectively forward fills the Daily bar onto the intraday minutes.
-    
-    merged = minute_df.sort("timestamp").join_asof(
-        htf_renamed.sort("timestamp"),
-        on="timestamp",
-        strategy="backward"
-    )
-    
+    # HTF timestamps are sorted, so the row index is a binary search
+    # (searchsorted side='right' - 1) and every HTF column is then gathered
+    # with the same indices, instead of a general join_asof.
+    # Minutes before the first HTF bar get -1 and stay null.
+    # resample_data output is already ordered, so the O(N) sortedness check
+    # normally saves the O(N log N) sort.
+    minute_df = _sorted_by_timestamp(minute_df)
+    higher_tf_df = _sorted_by_timestamp(higher_tf_df)
+
+    idx = np.searchsorted(
+        _timestamp_keys(higher_tf_df["timestamp"]),
+        _timestamp_keys(minute_df["timestamp"]),
+        side="right",
+    ) - 1
+    gather_idx = pl.Series(idx).set(pl.Series(idx < 0), None)
+
+    merged = minute_df.with_columns([
+        higher_tf_df[col].gather(gather_idx).alias(name) for col, name in htf_names
+    ])
+
     return merged
+
+def _suffixed_names(columns: List[str], suffix: str) -> List[Tuple[str, str]]:
+    """(column, suffixed name) pairs for every column except timestamp."""
+    return [(col, f"{col}{suffix}") for col in columns if col != "timestamp"]
+
+def _sorted_by_timestamp(df: pl.DataFrame) -> pl.DataFrame:
+    """Returns df ordered by timestamp, sorting only when it is not already."""
+    if df["timestamp"].is_sorted():
+        return df
+    return df.sort("timestamp")
+
+def _timestamp_keys(timestamps: pl.Series) -> np.ndarray:
+    """Integer sort keys for a timestamp column, in a common time unit."""
+    if isinstance(timestamps.dtype, pl.Datetime):
+        timestamps = timestamps.dt.cast_time_unit("us")
+    return timestamps.to_physical().to_numpy()
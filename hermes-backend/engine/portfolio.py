@@ -8,13 +8,25 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-from engine.events import FillEvent, OrderEvent, SignalEvent, MarketEvent
+import numpy as np
+import polars as pl
+
+from engine._portfolio_kernels import calc_qty_atr, calc_qty_pct_equity, check_stop, stop_mask
+from engine.events import FillEvent, OrderEvent, SignalEvent, MarketEvent, MarketBatchEvent
 from engine.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
+# Initial size of the per-symbol position arrays (doubled as needed)
+INITIAL_CAPACITY = 8
+# Initial size of the fill buffer (doubled as needed)
+INITIAL_FILL_CAPACITY = 4096
+
+FILL_DIRECTIONS = ("BUY", "SELL")
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(FILL_DIRECTIONS)}
 
-@dataclass
+
+@dataclass(slots=True)
 class RiskParams:
     """Risk management parameters for position sizing.
 
@@ -34,7 +46,7 @@ class RiskParams:
     stop_loss_pct: float = 0.05  # 5% stop loss
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Tracks an individual position."""
     symbol: str
@@ -52,6 +64,63 @@ class Position:
         return (price - self.avg_entry_price) * self.quantity
 
 
+class FillBuffer:
+    """Columnar, preallocated log of fills.
+
+    Each fill is a handful of typed array writes instead of a dict; the
+    arrays double when full. Symbols are stored as PortfolioManager ids.
+    """
+
+    _COLUMNS = (
+        ("time", np.int64), ("symbol_id", np.int32), ("direction", np.int8),
+        ("quantity", np.float64), ("price", np.float64), ("commission", np.float64),
+        ("cash_after", np.float64), ("equity_after", np.float64),
+    )
+
+    def __init__(self, capacity: int = INITIAL_FILL_CAPACITY):
+        self._columns = {name: np.empty(capacity, dtype) for name, dtype in self._COLUMNS}
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(
+        self, time: int, symbol_id: int, direction: str, quantity: float, price: float,
+        commission: float, cash_after: float, equity_after: float,
+    ) -> None:
+        n = self._n
+        columns = self._columns
+        if n == columns["time"].shape[0]:
+            for name, column in columns.items():
+                grown = np.empty(2 * n, column.dtype)
+                grown[:n] = column
+                columns[name] = grown
+        columns["time"][n] = time
+        columns["symbol_id"][n] = symbol_id
+        columns["direction"][n] = _DIRECTION_CODES[direction]
+        columns["quantity"][n] = quantity
+        columns["price"][n] = price
+        columns["commission"][n] = commission
+        columns["cash_after"][n] = cash_after
+        columns["equity_after"][n] = equity_after
+        self._n = n + 1
+
+    def to_frame(self, symbols: List[str], start: int = 0) -> pl.DataFrame:
+        """Fills from `start` on as [time, symbol, direction, quantity, price, commission, cash_after, equity_after]."""
+        n = self._n
+        c = {name: column[start:n] for name, column in self._columns.items()}
+        return pl.DataFrame({
+            "time": c["time"],
+            "symbol": pl.Series(symbols, dtype=pl.Utf8).gather(c["symbol_id"]),
+            "direction": pl.Series(FILL_DIRECTIONS, dtype=pl.Utf8).gather(c["direction"]),
+            "quantity": c["quantity"],
+            "price": c["price"],
+            "commission": c["commission"],
+            "cash_after": c["cash_after"],
+            "equity_after": c["equity_after"],
+        })
+
+
 class PortfolioManager:
     """Risk-aware Portfolio Manager for the event-driven engine.
 
@@ -59,6 +128,8 @@ class PortfolioManager:
     - Subscribes to SignalEvent: translates signals into sized OrderEvents
     - Subscribes to FillEvent: updates position and cash state
     - Subscribes to MarketEvent: tracks last price for mark-to-market
+    - Subscribes to MarketBatchEvent: the same for many symbols at once, with
+      a vectorized stop-loss check (ids from register_universe)
     - Tracks equity curve (mark-to-market on every bar)
     - Enforces risk limits (max position size, stop-loss)
     """
@@ -68,24 +139,47 @@ class PortfolioManager:
         bus: EventBus,
         initial_cash: float = 100000.0,
         risk_params: Optional[RiskParams] = None,
+        universe: Optional[List[str]] = None,
     ):
         self.bus = bus
         self.initial_cash = initial_cash
         self.cash = initial_cash
         self.risk_params = risk_params or RiskParams()
-
-        # Position tracking
-        self.positions: Dict[str, Position] = {}
-        self.last_prices: Dict[str, float] = {}
+        # Read on every bar; hoisted out of risk_params
+        self._stop_pct = self.risk_params.stop_loss_pct
+        # Sizing rule resolved once; unknown methods fall back to fixed
+        self._size_fn = {
+            "fixed": self._size_fixed,
+            "pct_equity": self._size_pct_equity,
+            "atr_based": self._size_atr,
+        }.get(self.risk_params.sizing_method, self._size_fixed)
+
+        # Position tracking: structure-of-arrays indexed by symbol id. Ids are
+        # assigned on first sight (or up front from `universe`) and the
+        # arrays grow by doubling. A NaN last price means "no bar seen yet".
+        self._symbol_ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        capacity = max(len(universe or ()), INITIAL_CAPACITY)
+        self._qty = np.zeros(capacity)
+        self._avg_entry = np.zeros(capacity)
+        self._total_cost = np.zeros(capacity)
+        self._realized_pnl = np.zeros(capacity)
+        self._last = np.full(capacity, np.nan)
+        # Sum of qty * mark price, kept in step with fills and bars
+        self._market_value = 0.0
+        if universe:
+            self.register_universe(universe)
 
         # Metrics tracking
         self.equity_history: List[Dict] = []
-        self.fills_log: List[Dict] = []
+        self._fills = FillBuffer()
+        self._fills_log: List[Dict] = []
 
         # Subscribe to events
         self.bus.subscribe(SignalEvent, self.on_signal)  # type: ignore
         self.bus.subscribe(FillEvent, self.on_fill)  # type: ignore
         self.bus.subscribe(MarketEvent, self.on_bar)  # type: ignore
+        self.bus.subscribe(MarketBatchEvent, self.on_bars)  # type: ignore
 
         logger.info(
             f"PortfolioManager initialized: cash={initial_cash}, "
@@ -94,55 +188,132 @@ class PortfolioManager:
 
     @property
     def equity(self) -> float:
-        """Total equity = cash + sum of position market values."""
-        total = self.cash
-        for sym, pos in self.positions.items():
-            price = self.last_prices.get(sym, pos.avg_entry_price)
-            total += pos.quantity * price
-        return total
-
-    def _get_position(self, symbol: str) -> Position:
-        """Get or create a position tracker for a symbol."""
-        if symbol not in self.positions:
-            self.positions[symbol] = Position(symbol=symbol)
-        return self.positions[symbol]
-
-    def _calculate_quantity(self, symbol: str, price: float) -> float:
-        """Calculate order quantity based on risk parameters."""
-        rp = self.risk_params
+        """Total equity = cash + sum of position market values.
+
+        Positions without a price yet are valued at their entry price. The
+        market value is maintained incrementally by on_fill/on_bar(s).
+        """
+        return self.cash + self._market_value
+
+    def _recompute_market_value(self) -> float:
+        """Market value rebuilt from the position arrays (drift check)."""
+        n = len(self._symbols)
+        last = self._last[:n]
+        prices = np.where(np.isnan(last), self._avg_entry[:n], last)
+        return float(self._qty[:n] @ prices)
+
+    def _mark(self, i: int) -> float:
+        """Contribution of one symbol to the market value."""
+        quantity = self._qty[i]
+        if quantity == 0.0:
+            return 0.0
+        last = self._last[i]
+        return float(quantity * (self._avg_entry[i] if np.isnan(last) else last))
 
-        if rp.sizing_method == "fixed":
-            return rp.fixed_quantity
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Read-only Position views, built on demand."""
+        return {
+            symbol: Position(
+                symbol=symbol,
+                quantity=float(self._qty[i]),
+                avg_entry_price=float(self._avg_entry[i]),
+                total_cost=float(self._total_cost[i]),
+                realized_pnl=float(self._realized_pnl[i]),
+            )
+            for symbol, i in self._symbol_ids.items()
+        }
 
-        elif rp.sizing_method == "pct_equity":
-            # Allocate pct_equity fraction of current equity
-            allocation = self.equity * rp.pct_equity
-            qty = allocation / price if price > 0 else 0
-            return max(1.0, round(qty))
+    @property
+    def last_prices(self) -> Dict[str, float]:
+        """Latest close per symbol that has seen a bar."""
+        return {
+            symbol: float(self._last[i])
+            for symbol, i in self._symbol_ids.items()
+            if not np.isnan(self._last[i])
+        }
 
-        elif rp.sizing_method == "atr_based":
-            # ATR-based sizing: risk_amount / (atr * multiplier)
-            # For now, use pct_equity as the risk budget
-            risk_amount = self.equity * rp.pct_equity
-            # In a full implementation, ATR would come from the strategy
-            # For now, use stop_loss_pct as a proxy for expected risk
-            risk_per_share = price * rp.stop_loss_pct
-            qty = risk_amount / risk_per_share if risk_per_share > 0 else 0
-            return max(1.0, round(qty))
+    @property
+    def fills(self) -> pl.DataFrame:
+        """All fills so far as a DataFrame (built from the columnar buffer)."""
+        return self._fills.to_frame(self._symbols)
 
-        return rp.fixed_quantity
+    @property
+    def fills_log(self) -> List[Dict]:
+        """All fills so far as a list of dicts (same rows as `fills`).
+
+        The same list is returned on every access; only fills added since the
+        last access are converted.
+        """
+        logged = len(self._fills_log)
+        if logged < len(self._fills):
+            self._fills_log.extend(self._fills.to_frame(self._symbols, start=logged).to_dicts())
+        return self._fills_log
+
+    def register_universe(self, symbols: List[str]) -> Dict[str, int]:
+        """Assign symbol ids up front (e.g. for MarketBatchEvent).
+
+        Returns:
+            Mapping of symbol -> id used in MarketBatchEvent.symbol_ids
+        """
+        return {symbol: self._symbol_id(symbol) for symbol in symbols}
+
+    def _symbol_id(self, symbol: str) -> int:
+        """Get or assign the array index for a symbol.
+
+        Symbols registered up front (universe / register_universe) take the
+        plain lookup path; assignment only happens for unseen symbols.
+        """
+        try:
+            return self._symbol_ids[symbol]
+        except KeyError:
+            pass
+        i = len(self._symbols)
+        if i == self._qty.shape[0]:
+            self._grow()
+        self._symbol_ids[symbol] = i
+        self._symbols.append(symbol)
+        return i
+
+    def _grow(self) -> None:
+        """Double the capacity of the position arrays."""
+        capacity = 2 * self._qty.shape[0]
+        for name, fill in (
+            ("_qty", 0.0), ("_avg_entry", 0.0), ("_total_cost", 0.0),
+            ("_realized_pnl", 0.0), ("_last", np.nan),
+        ):
+            old = getattr(self, name)
+            grown = np.full(capacity, fill)
+            grown[:old.shape[0]] = old
+            setattr(self, name, grown)
+
+    # Order sizing by risk_params.sizing_method (bound to _size_fn at init)
+
+    def _size_fixed(self, price: float) -> float:
+        return self.risk_params.fixed_quantity
+
+    def _size_pct_equity(self, price: float) -> float:
+        # Allocate pct_equity fraction of current equity
+        return calc_qty_pct_equity(self.equity, price, self.risk_params.pct_equity)
+
+    def _size_atr(self, price: float) -> float:
+        # ATR-based sizing: risk_amount / (atr * multiplier)
+        # For now, use pct_equity as the risk budget
+        # In a full implementation, ATR would come from the strategy
+        # For now, use stop_loss_pct as a proxy for expected risk
+        rp = self.risk_params
+        return calc_qty_atr(self.equity, rp.pct_equity, price, rp.stop_loss_pct)
 
     def _check_max_position_limit(self, symbol: str, quantity: float, price: float) -> float:
         """Enforce maximum position size as percentage of equity."""
         max_alloc = self.equity * self.risk_params.max_position_pct
-        current_pos = self._get_position(symbol)
-        current_value = current_pos.quantity * price
+        current_value = float(self._qty[self._symbol_id(symbol)]) * price
         max_additional = max_alloc - current_value
 
         if max_additional <= 0:
             logger.warning(
-                f"Position limit reached for {symbol}: "
-                f"current={current_value:.0f}, max={max_alloc:.0f}"
+                "Position limit reached for %s: current=%.0f, max=%.0f",
+                symbol, current_value, max_alloc,
             )
             return 0.0
 
@@ -151,14 +322,16 @@ class PortfolioManager:
 
     def on_signal(self, event: SignalEvent) -> None:
         """Handle signal events — generate risk-aware orders."""
-        position = self._get_position(event.symbol)
-        price = self.last_prices.get(event.symbol, 0.0)
+        i = self._symbol_id(event.symbol)
+        quantity = float(self._qty[i])
+        last = self._last[i]
+        price = 0.0 if np.isnan(last) else float(last)
 
         order = None
 
-        if event.signal_type == "LONG" and not position.is_open:
+        if event.signal_type == "LONG" and quantity == 0.0:
             # Calculate sized quantity
-            qty = self._calculate_quantity(event.symbol, price)
+            qty = self._size_fn(price)
             qty = self._check_max_position_limit(event.symbol, qty, price)
 
             if qty > 0 and price > 0:
@@ -167,7 +340,7 @@ class PortfolioManager:
                 if cost > self.cash:
                     qty = max(1.0, round(self.cash / price) - 1)
                     if qty <= 0:
-                        logger.warning(f"Insufficient cash for {event.symbol}")
+                        logger.warning("Insufficient cash for %s", event.symbol)
                         return
 
                 order = OrderEvent(
@@ -178,17 +351,17 @@ class PortfolioManager:
                     direction="BUY",
                 )
 
-        elif event.signal_type == "EXIT" and position.is_open and position.quantity > 0:
+        elif event.signal_type == "EXIT" and quantity > 0:
             order = OrderEvent(
                 time=event.time,
                 symbol=event.symbol,
                 order_type="MARKET",
-                quantity=position.quantity,
+                quantity=quantity,
                 direction="SELL",
             )
 
-        elif event.signal_type == "SHORT" and not position.is_open:
-            qty = self._calculate_quantity(event.symbol, price)
+        elif event.signal_type == "SHORT" and quantity == 0.0:
+            qty = self._size_fn(price)
             if qty > 0 and price > 0:
                 order = OrderEvent(
                     time=event.time,
@@ -203,70 +376,115 @@ class PortfolioManager:
 
     def on_fill(self, event: FillEvent) -> None:
         """Handle fill events — update portfolio state."""
-        position = self._get_position(event.symbol)
-        fill_price = event.fill_cost or 0.0
-        commission = event.commission or 0.0
+        i = self._symbol_id(event.symbol)
+        quantity = float(self._qty[i])
+        avg_entry = float(self._avg_entry[i])
+        old_mark = self._mark(i)
+        fill_price = event.fill_cost
+        commission = event.commission
 
         if event.direction == "BUY":
             total_cost = event.quantity * fill_price + commission
             self.cash -= total_cost
 
             # Update average entry
-            new_qty = position.quantity + event.quantity
+            new_qty = quantity + event.quantity
             if new_qty > 0:
-                position.avg_entry_price = (
-                    (position.avg_entry_price * position.quantity)
-                    + (fill_price * event.quantity)
+                self._avg_entry[i] = (
+                    (avg_entry * quantity) + (fill_price * event.quantity)
                 ) / new_qty
-            position.quantity = new_qty
-            position.total_cost += total_cost
+            self._qty[i] = new_qty
+            self._total_cost[i] += total_cost
 
         elif event.direction == "SELL":
             proceeds = event.quantity * fill_price - commission
             self.cash += proceeds
 
             # Realize P&L
-            pnl = (fill_price - position.avg_entry_price) * event.quantity - commission
-            position.realized_pnl += pnl
-            position.quantity -= event.quantity
-
-            if position.quantity <= 0:
-                position.quantity = 0.0
-                position.avg_entry_price = 0.0
-
-        self.fills_log.append({
-            "time": event.time,
-            "symbol": event.symbol,
-            "direction": event.direction,
-            "quantity": event.quantity,
-            "price": fill_price,
-            "commission": commission,
-            "cash_after": self.cash,
-            "equity_after": self.equity,
-        })
+            pnl = (fill_price - avg_entry) * event.quantity - commission
+            self._realized_pnl[i] += pnl
+            quantity -= event.quantity
+
+            if quantity <= 0:
+                quantity = 0.0
+                self._avg_entry[i] = 0.0
+            self._qty[i] = quantity
+
+        self._market_value += self._mark(i) - old_mark
+
+        self._fills.append(
+            event.time, i, event.direction, event.quantity, fill_price,
+            commission, self.cash, self.equity,
+        )
 
     def on_bar(self, event: MarketEvent) -> None:
         """Handle market events — update prices and check stops."""
-        self.last_prices[event.symbol] = event.close
+        i = self._symbol_id(event.symbol)
+        quantity = self._qty[i]
+        if quantity != 0.0:
+            # Re-mark the position: O(1) instead of revaluing the portfolio
+            self._market_value -= self._mark(i)
+            self._market_value += float(quantity * event.close)
+        self._last[i] = event.close
 
         # Check stop-loss
-        position = self._get_position(event.symbol)
-        if position.is_open and position.quantity > 0:
-            loss_pct = (event.close - position.avg_entry_price) / position.avg_entry_price
-            if loss_pct < -self.risk_params.stop_loss_pct:
+        if quantity > 0:
+            avg_entry = float(self._avg_entry[i])
+            if check_stop(event.close, avg_entry, self._stop_pct):
                 logger.info(
-                    f"Stop-loss triggered for {event.symbol}: "
-                    f"loss={loss_pct:.2%}, threshold={-self.risk_params.stop_loss_pct:.2%}"
+                    "Stop-loss triggered for %s: loss=%.2f%%, threshold=%.2f%%",
+                    event.symbol, (event.close - avg_entry) / avg_entry * 100, -self._stop_pct * 100,
                 )
                 stop_order = OrderEvent(
                     time=event.time,
                     symbol=event.symbol,
                     order_type="MARKET",
-                    quantity=position.quantity,
+                    quantity=float(quantity),
                     direction="SELL",
                 )
                 self.bus.publish(stop_order)
 
+    def on_bars(self, event: MarketBatchEvent) -> None:
+        """Handle batched market events — update prices and check stops.
+
+        The stop-loss test runs as one (JIT-compiled when Numba is installed)
+        kernel over the batch and orders are only built for the symbols that
+        trip it.
+        """
+        ids = event.symbol_ids
+        closes = event.close
+        qty = self._qty[ids]
+        avg_entry = self._avg_entry[ids]
+
+        # Re-mark the batch's positions (ids are unique within a batch)
+        last = self._last[ids]
+        old_marks = np.where(np.isnan(last), avg_entry, last)
+        self._market_value += float(qty @ (closes - old_marks))
+        self._last[ids] = closes
+
+        stop_pct = self._stop_pct
+        tripped = np.flatnonzero(stop_mask(closes, avg_entry, qty, stop_pct))
+
+        if not tripped.size:
+            return
+
+        orders = []
+        for k in tripped:
+            symbol = event.symbols[k]
+            loss_pct = (closes[k] - avg_entry[k]) / avg_entry[k]
+            logger.info(
+                "Stop-loss triggered for %s: loss=%.2f%%, threshold=%.2f%%",
+                symbol, loss_pct * 100, -stop_pct * 100,
+            )
+            orders.append(OrderEvent(
+                time=event.time,
+                symbol=symbol,
+                order_type="MARKET",
+                quantity=float(qty[k]),
+                direction="SELL",
+            ))
+        self.bus.publish_many(orders)
+
     def snapshot(self, time: int) -> None:
         """Record equity snapshot at a point in time."""
         self.equity_history.append({
@@ -1,12 +1,23 @@
-from abc import ABC, abstractmethod
 import polars as pl
 from .events import MarketEvent, FillEvent
 
-class Strategy(ABC):
+class Strategy:
     """
-    Abstract Base Class for Strategies.
+    Base Class for Strategies.
     Supports both Vectorized (Polars) and Event-Driven execution.
+
+    Subclasses override generate_signals, on_bar, or both. Purely
+    event-driven strategies can leave generate_signals alone; it only
+    raises if a vectorized run actually needs it.
+
+    Strategies whose decisions are fully described by generate_signals (no
+    on_bar state) set is_vectorizable = True; event-mode backtests then run
+    them through FastEventEngine instead of dispatching every bar.
     """
+    is_vectorizable: bool = False
+    # Parameters used when a caller has no user-supplied ones (CLI runs)
+    DEFAULT_PARAMS: dict = {}
+
     def __init__(self, params: dict | None = None):
         self.params = params or {}
         self.bus = None
@@ -14,7 +25,6 @@ class Strategy(ABC):
     def set_bus(self, bus):
         self.bus = bus
 
-    @abstractmethod
     def generate_signals(self, df: pl.DataFrame) -> pl.DataFrame:
         """
         Vectorized Logic.
@@ -26,7 +36,9 @@ class Strategy(ABC):
         
         The result should be the SAME length as the input.
         """
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement vectorized generate_signals"
+        )
 
     def on_bar(self, event: MarketEvent):
         """
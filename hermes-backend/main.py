@@ -1,5 +1,7 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 import os
 import sys
@@ -10,30 +12,44 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 from api.routes import router # noqa: E402
+from api.orjson_response import ORJSONResponse  # noqa: E402
 from middleware import CorrelationMiddleware  # noqa: E402
 from hermes_data.logging import configure_logging  # noqa: E402
+from hermes_data.config import get_settings  # noqa: E402
 
 # Configure structured logging
 configure_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 
-app = FastAPI(title="Hermes Backtest API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the cached data settings up front so the first request doesn't pay for it
+    get_settings()
+    yield
+
+
+app = FastAPI(
+    title="Hermes Backtest API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Use structured logging middleware
 app.add_middleware(CorrelationMiddleware)
 
-# CORS Configuration
-# Allow frontend (React) to access this API
-origins = [
-    "http://localhost",
-    "http://localhost:3000",
-    "http://localhost:5173", # Vite default
-    "*"
-]
+# Compress large JSON/Arrow payloads when the client sends Accept-Encoding: gzip
+# (SSE streams are excluded by Starlette so events are not buffered)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
+# CORS Configuration
+# Allow frontend (React) to access this API. The wildcard already covers the
+# local dev origins, and the frontend sends no cookies/credentials, so the
+# middleware can answer with a static "*" instead of echoing each Origin.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
+    allow_origins=["*"],
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -1,31 +1,88 @@
+import itertools
+import os
 import time
 import uuid
 import logging
-from typing import Callable, Awaitable, Any
-from starlette.requests import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from hermes_data.logging import set_correlation_id
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Any]]):
-        request_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+logger = logging.getLogger(__name__)
+
+_request_counter = itertools.count()
+_pid_hex = f"{os.getpid():x}"
+
+
+def _reset_after_fork():
+    global _pid_hex
+    _pid_hex = f"{os.getpid():x}"
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _next_request_id() -> str:
+    """Process-unique request ID: pid, per-process counter and clock.
+
+    Needs no urandom read or UUID object per request, and the nanosecond
+    timestamp keeps IDs distinct across restarts that reuse a pid.
+    """
+    return f"{_pid_hex}-{next(_request_counter):x}-{time.time_ns():x}"
+
+
+def _uuid_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+class CorrelationMiddleware:
+    """Tag each HTTP request with a correlation ID and log its duration.
+
+    Written as a plain ASGI middleware rather than on BaseHTTPMiddleware,
+    which runs every request through an extra task and memory streams. Here
+    the downstream app is awaited directly and only the response-start
+    message is touched to add the X-Correlation-ID header.
+
+    Generated IDs come from a cheap in-process counter; set
+    HERMES_UUID_REQUEST_IDS=1 (or pass uuid_ids=True) for RFC 4122 UUIDs.
+    """
+
+    def __init__(self, app: ASGIApp, uuid_ids: bool | None = None):
+        self.app = app
+        if uuid_ids is None:
+            uuid_ids = os.environ.get("HERMES_UUID_REQUEST_IDS", "").lower() in ("1", "true", "yes")
+        self._new_request_id = _uuid_request_id if uuid_ids else _next_request_id
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("X-Correlation-ID") or self._new_request_id()
         set_correlation_id(request_id)
-        
-        start_time = time.time()
-        
-        response = await call_next(request)
-        
-        process_time = (time.time() - start_time) * 1000
-        formatted_process_time = "{0:.2f}".format(process_time)
-        
-        logging.info({
-            "event": "request_processed",
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "process_time_ms": formatted_process_time,
-            "correlation_id": request_id,
-        })
-        
-        response.headers["X-Correlation-ID"] = request_id
-        return response
+        status_code = None
+
+        async def send_with_correlation_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Correlation-ID"] = request_id
+            await send(message)
+
+        # Monotonic integer clock: immune to wall-clock jumps, no float math
+        start_ns = time.perf_counter_ns()
+
+        await self.app(scope, receive, send_with_correlation_id)
+
+        if logger.isEnabledFor(logging.INFO):
+            # Elapsed time in hundredths of a millisecond, rendered as "ms.xx"
+            elapsed = (time.perf_counter_ns() - start_ns) // 10_000
+            formatted_process_time = "%d.%02d" % divmod(elapsed, 100)
+
+            logger.info({
+                "event": "request_processed",
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "process_time_ms": formatted_process_time,
+                "correlation_id": request_id,
+            })
@@ -1,6 +1,14 @@
-import csv
 import os
-from collections import defaultdict
+import re
+
+import polars as pl
+
+# Characters outside this set are replaced in output file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+def segment_filename(segment):
+    """Map a segment name (e.g. 'NFO-OPT', 'BCD:FUT') to a safe file stem."""
+    return _UNSAFE_FILENAME_CHARS.sub('_', segment)
 
 def split_instruments():
     input_path = 'data/instruments/master_instruments.csv'
@@ -10,47 +18,30 @@ def split_instruments():
         print(f"Error: {input_path} not found.")
         return
 
-    # Use a dictionary to keep file handles open or buffer lines
-    # Since the file might be large, let's read once and append to lists, then write.
-    # Or cleaner: read line by line, categorize, write to specific files. 
-    # To avoid opening too many files, we can group in memory (if fits) or re-open/append.
-    # Given 185k lines, memory is fine (~15MB).
-
-    print("Reading master instruments file...")
-    data_by_segment = defaultdict(list)
-    headers = []
-
-    with open(input_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        try:
-            headers = next(reader)
-        except StopIteration:
-            return
-
-        # Find segment index
-        try:
-            segment_idx = headers.index('segment')
-        except ValueError:
-            print("Error: 'segment' column not found.")
-            return
-
-        for row in reader:
-            if len(row) > segment_idx:
-                segment = row[segment_idx]
-                data_by_segment[segment].append(row)
-
-    print(f"Found {len(data_by_segment)} segments.")
-
-    for segment, rows in data_by_segment.items():
-        # Sanitize segment name for filename
-        filename = "".join([c if c.isalnum() or c in ('-','_') else '_' for c in segment])
-        out_file = os.path.join(output_dir, f"{filename}.csv")
-        
-        print(f"Writing {len(rows)} rows to {out_file}...")
-        with open(out_file, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(rows)
+    # Every field is read as a string so values round-trip unchanged
+    lf = pl.scan_csv(input_path, infer_schema=False)
+
+    if 'segment' not in lf.collect_schema().names():
+        print("Error: 'segment' column not found.")
+        return
+
+    lf = lf.filter(pl.col('segment').is_not_null())
+
+    # Discover the segments first, then stream each one straight to its own
+    # file; peak memory stays flat regardless of the master file size
+    segments = (
+        lf.select(pl.col('segment').unique(maintain_order=True))
+        .collect(engine="streaming")
+        .to_series()
+        .to_list()
+    )
+    print(f"Found {len(segments)} segments.")
+
+    for segment in segments:
+        out_file = os.path.join(output_dir, f"{segment_filename(segment)}.csv")
+
+        print(f"Writing {out_file}...")
+        lf.filter(pl.col('segment') == segment).sink_csv(out_file, engine="streaming")
 
     print("Done splitting instruments.")
 
@@ -1,7 +1,6 @@
 import sys
 import os
 import argparse
-import inspect
 
 # Add parent directory to path so we can import 'engine' and 'strategies'
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,18 +9,10 @@ sys.path.append(parent_dir)
 
 from engine.loader import DataLoader # noqa: E402
 from engine.core import BacktestEngine # noqa: E402
-import strategies # noqa: E402
-
-def get_available_strategies():
-    """Dynamically find all Strategy subclasses in the strategies module"""
-    return {
-        name: cls for name, cls in inspect.getmembers(strategies, inspect.isclass)
-        # simplistic check, ideally check issubclass(cls, Strategy) but Strategy is in engine
-        if name != "Strategy"
-    }
+from strategies import STRATEGIES # noqa: E402
 
 def main():
-    avail_strategies = get_available_strategies()
+    avail_strategies = STRATEGIES
     
     parser = argparse.ArgumentParser(description="Hermes Backtest Verification")
     parser.add_argument("--symbol", type=str, required=True, help="Stock Symbol")
@@ -49,21 +40,7 @@ def main():
     # 2. Setup Strategy
     strategy_cls = avail_strategies[args.strategy]
     
-    # Default params per strategy (simplistic for verification)
-    params = {}
-    if args.strategy == "SMACrossover":
-        params = {"fast_period": 50, "slow_period": 200}
-    elif args.strategy == "RSIStrategy":
-        params = {"period": 14, "overbought": 70, "oversold": 30}
-    elif args.strategy == "BollingerBandsStrategy":
-        params = {"period": 20, "std_dev": 2.0}
-    elif args.strategy == "MACDStrategy":
-        params = {"fast_period": 12, "slow_period": 26, "signal_period": 9}
-    elif args.strategy == "MTFTrendFollowingStrategy":
-        # No specific params for this demo class, it has hardcoded logic in generate_signals
-        params = {}
-        
-    strategy = strategy_cls(params=params)
+    strategy = strategy_cls(params=dict(strategy_cls.DEFAULT_PARAMS))
     
     # 3. Run Engine
     engine = BacktestEngine(initial_cash=100000.0)
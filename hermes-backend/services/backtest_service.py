@@ -1,24 +1,175 @@
-import inspect
 import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 import polars as pl
-from typing import Dict, Type, List
-from api.models import BacktestRequest, BacktestResponse, ChartPoint, SignalPoint, CandlePoint, IndicatorPoint
+from typing import Dict, List, Optional, Tuple, Type
+from hermes_data import DataProvider, DataService, DataSettings
+from api.models import BacktestRequest, BacktestResponse, CandleSeries, ChartSeries, SignalSeries
 from engine.core import BacktestEngine
 from engine.strategy import Strategy
-import strategies
+from strategies import STRATEGIES, canonical_strategy_name
 from services.market_data_service import MarketDataService
+from services.signal_cache import SignalCache, signal_cache_key
+
+
+def _trade_type(is_buy: pl.Expr) -> pl.Expr:
+    """Label trades "buy"/"sell" column-wise from a boolean expression."""
+    return pl.when(is_buy).then(pl.lit("buy")).otherwise(pl.lit("sell")).alias("type")
+
+
+# Engine bookkeeping columns: neither candles nor indicators
+_NON_INDICATOR_COLS = frozenset({
+    "timestamp", "open", "high", "low", "close", "volume",
+    "signal", "position", "strategy_return", "market_return", "equity", "trade_action",
+})
+
+
+def _indicator_columns(schema: pl.Schema) -> List[str]:
+    """Float columns a strategy added, i.e. the indicators to chart."""
+    return [
+        c for c, dtype in schema.items()
+        if c not in _NON_INDICATOR_COLS and dtype in (pl.Float64, pl.Float32)
+    ]
+
+
+def _chart_frame(
+    result_lf: pl.LazyFrame,
+    indicator_cols: List[str],
+    every: str = "1h",
+    indicators_lf: Optional[pl.LazyFrame] = None,
+) -> pl.LazyFrame:
+    """Hourly candles, equity and indicators: only the rendered columns.
+
+    Projects before group_by_dynamic so symbol, position, returns and other
+    engine columns are never read or aggregated. Rows with any null are
+    dropped, as in MarketDataService.resample_data.
+
+    With indicators_lf (timestamp + indicator_cols on a coarser, sorted
+    grid), indicators are not read from result_lf: each hour takes the
+    indicator row in force at its last bar, i.e. the value a minute-level
+    forward fill would have shown there.
+    """
+    own_cols = [] if indicators_lf is not None else indicator_cols
+    chart_lf = (
+        result_lf.select(["timestamp", "open", "high", "low", "close", "volume", "equity", *own_cols])
+        .group_by_dynamic("timestamp", every=every)
+        .agg(
+            pl.col("open").first(),
+            pl.col("high").max(),
+            pl.col("low").min(),
+            pl.col("close").last(),
+            pl.col("volume").sum(),
+            pl.col("equity").last(),
+            *[pl.col(c).last() for c in own_cols],
+            *([pl.col("timestamp").last().alias("_last_bar")] if indicators_lf is not None else []),
+        )
+    )
+    if indicators_lf is not None:
+        chart_lf = chart_lf.join_asof(
+            indicators_lf.select(pl.col("timestamp").alias("_last_bar"), *indicator_cols),
+            on="_last_bar",
+            strategy="backward",
+        ).drop("_last_bar")
+    return chart_lf.drop_nulls()
+
+
+def _signal_series(trades_df: pl.DataFrame) -> SignalSeries:
+    """Signal markers from a [time, type, price] frame, as parallel lists.
+
+    The response series here are built with model_construct: their lists
+    come from typed Polars columns, so per-element validation is skipped.
+    """
+    return SignalSeries.model_construct(
+        time=trades_df["time"].to_list(),
+        type=trades_df["type"].to_list(),
+        price=trades_df["price"].to_list(),
+    )
+
+
+# Service instance owned by each run_backtests_batch worker process. Data
+# caches are process-local, so every worker starts cold and warms its own.
+_batch_worker_service: Optional["BacktestService"] = None
+
+
+def _init_batch_worker(
+    settings: DataSettings,
+    provider: Optional[DataProvider],
+    signal_cache_limits: Tuple[int, int, float],
+) -> None:
+    """Build the worker's service from the parent service's data config.
+
+    provider is None when the parent's provider cannot be pickled; the
+    worker then builds it from the same settings.
+    """
+    global _batch_worker_service
+    data_service = DataService(provider=provider, settings=settings)
+    _batch_worker_service = BacktestService(
+        MarketDataService(data_service=data_service), SignalCache(*signal_cache_limits)
+    )
+
+
+def _run_batch_backtest(request: BacktestRequest) -> BacktestResponse:
+    assert _batch_worker_service is not None, "batch worker not initialized"
+    return _batch_worker_service.run_backtest(request)
+
 
 class BacktestService:
-    def __init__(self, market_data_service: MarketDataService):
+    def __init__(self, market_data_service: MarketDataService, signal_cache: Optional[SignalCache] = None):
         self.market_data_service = market_data_service
+        self.signal_cache = signal_cache if signal_cache is not None else SignalCache()
 
     def get_strategies(self) -> Dict[str, Type[Strategy]]:
-        return {
-            name: cls for name, cls in inspect.getmembers(strategies, inspect.isclass)
-            if name != "Strategy"
-        }
+        return STRATEGIES
+
+    def run_backtests_batch(
+        self, requests: List[BacktestRequest], max_workers: Optional[int] = None
+    ) -> List[BacktestResponse]:
+        """Run independent backtests (symbols, parameter sweeps) on all cores.
+
+        Each request runs in a worker process with its own BacktestService,
+        so the GIL is not shared. Workers read data through this service's
+        data settings and provider (rebuilt from the settings if it cannot
+        be pickled) and use the same signal cache limits. Workers are
+        spawned rather than forked: forking after Polars has started its
+        thread pool can deadlock. Results come back in request order; the
+        first failure is raised.
+
+        Args:
+            requests: Backtests to run
+            max_workers: Worker processes (default: CPU count). With one
+                worker, or a single request, they run in this process on
+                this service instead.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(requests))
+        if workers <= 1:
+            return [self.run_backtest(request) for request in requests]
+
+        data_service = self.market_data_service.data_service
+        provider: Optional[DataProvider] = data_service.provider
+        try:
+            pickle.dumps(provider)
+        except Exception:
+            provider = None
+        cache = self.signal_cache
+        initargs = (data_service.settings, provider, (cache.max_entries, cache.max_bytes, cache.ttl_seconds))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=initargs,
+        ) as pool:
+            return list(pool.map(_run_batch_backtest, requests))
 
     def run_backtest(self, request: BacktestRequest) -> BacktestResponse:
+        # Strategy names are matched case-insensitively ("rsistrategy")
+        strategy_name = canonical_strategy_name(request.strategy)
+        if strategy_name != request.strategy:
+            request = request.model_copy(update={"strategy": strategy_name})
+
         logging.info(f"Running backtest for {request.symbol} with {request.strategy}")
         
         # 1. Load Data using the data service (provides caching)
@@ -31,6 +182,13 @@ class BacktestService:
         except Exception as e:
             raise ValueError(f"Data load failed for {request.symbol}: {str(e)}")
 
+        # Single-symbol data arrives time-ordered: flag it so the resample,
+        # join_asof and sorts below take Polars' sorted fast paths
+        if df["timestamp"].is_sorted():
+            df = df.set_sorted("timestamp")
+        else:
+            df = df.sort("timestamp")
+
         # 2. Get Strategy Class
         avail_strategies = self.get_strategies()
         if request.strategy not in avail_strategies:
@@ -54,22 +212,34 @@ class BacktestService:
         
         execution_df = df
         
-        # If analysis timeframe is different from raw data (1m), we resample
-        # Note: We assume raw data is 1m. If request.timeframe is > 1m, we resample for analysis.
-        # If analysis timeframe is different from raw data (1m), we resample
-        # Note: We assume raw data is 1m. If request.timeframe is > 1m, we resample for analysis.
-        if request.timeframe != "1m":
-            logging.info(f"Resampling data to {request.timeframe} for strategy analysis...")
-            analysis_df = self.market_data_service.resample_data(execution_df, interval=request.timeframe)
-        else:
-            analysis_df = execution_df 
+        # Signals for a closed date range are reused across requests that only
+        # differ in execution settings (e.g. initial cash): skip resample + strategy
+        signal_key = signal_cache_key(request)
+        strategy_result_df = self.signal_cache.get(signal_key) if signal_key is not None else None
+
+        if strategy_result_df is None:
+            # If analysis timeframe is different from raw data (1m), we resample
+            # Note: We assume raw data is 1m. If request.timeframe is > 1m, we resample for analysis.
+            if request.timeframe != "1m":
+                logging.info(f"Resampling data to {request.timeframe} for strategy analysis...")
+                # Strategies take an eager frame, so this is the one collect before them
+                analysis_df = self.market_data_service.resample_data(
+                    execution_df.lazy(), interval=request.timeframe
+                ).collect()
+            else:
+                analysis_df = execution_df
+
+            # Run Strategy on Analysis DF
+            logging.info("Running strategy on analysis data...")
+            strategy_result_df = strategy.generate_signals(analysis_df)
+            if signal_key is not None:
+                self.signal_cache.put(signal_key, strategy_result_df)
+
+        # Higher-timeframe indicators, kept at analysis resolution for the chart
+        indicators_lf: Optional[pl.LazyFrame] = None
 
-        # Run Strategy on Analysis DF
-        logging.info("Running strategy on analysis data...")
-        strategy_result_df = strategy.generate_signals(analysis_df)
-        
         if request.timeframe != "1m":
-            # Broadcast signals and indicators back to execution (1m) dataframe
+            # Broadcast signals back to execution (1m) dataframe
             # We use join_asof to forward-fill the higher timeframe signals to the minute data
             logging.info("Broadcasting signals to execution timeframe (1m)...")
             
@@ -88,18 +258,47 @@ class BacktestService:
             # If we join this signal to 10:05 minute data, we are peeking into the future.
             # We must SHIFT the signals by 1 period so they become available only at the START of the next bar (11:00).
             
-            shifted_strategy = strategy_result_df.select(
+            # Both sides are time-ordered by construction (the loaded frame is
+            # sorted above, resampled bars come out of group_by_dynamic in
+            # order), so they are flagged sorted rather than re-sorted
+            if logging.getLogger().isEnabledFor(logging.DEBUG) and not strategy_result_df["timestamp"].is_sorted():
+                raise ValueError(f"Strategy '{request.strategy}' returned bars out of time order")
+
+            shifted_strategy = strategy_result_df.lazy().select(
                 [pl.col("timestamp")] + 
                 [pl.col(c).shift(1) for c in broadcast_cols]
+            ).set_sorted("timestamp")
+
+            # Float indicators are only charted, never read by the engine: rather
+            # than forward-filling them onto every minute bar they stay on the
+            # analysis grid and are joined onto the hourly chart frame instead
+            indicator_cols = _indicator_columns(strategy_result_df.schema)
+            indicators_lf = shifted_strategy.select(["timestamp", *indicator_cols])
+            shifted_strategy = shifted_strategy.select(
+                ["timestamp"] + [c for c in broadcast_cols if c not in indicator_cols]
             )
 
+            # Integer columns (the signal, flags) are copied onto every minute
+            # bar: narrow them losslessly first, e.g. an Int32 0/1 signal to
+            # Int8. Prices stay Float64, Float32 would round them.
+            narrowed = [
+                strategy_result_df[c].shrink_dtype()
+                for c in broadcast_cols
+                if c not in indicator_cols and strategy_result_df.schema[c].is_integer()
+            ]
+            if narrowed:
+                shifted_strategy = shifted_strategy.with_columns(
+                    pl.col(s.name).cast(s.dtype) for s in narrowed
+                )
+
             # Polars join_asof
-            # backward strategy: for a time t in execution, find the latest time t' <= t in analysis
-            execution_df = execution_df.sort("timestamp").join_asof(
-                shifted_strategy.sort("timestamp"),
+            # backward strategy: for a time t in execution, find the latest time t' <= t in analysis.
+            # Shift, sorts and join run as one lazy plan with a single collect.
+            execution_df = execution_df.lazy().set_sorted("timestamp").join_asof(
+                shifted_strategy,
                 on="timestamp",
                 strategy="backward"
-            )
+            ).collect()
         else:
             execution_df = strategy_result_df
 
@@ -117,10 +316,23 @@ class BacktestService:
         from services.metrics_service import MetricsService
         metrics = MetricsService.calculate_metrics(result_df["equity"], request.initial_cash)
         
-        # 6. Optimize for Visualization (Downsampling)
-        chart_df = self.market_data_service.resample_data(result_df, interval="1h")
+        # 6. Optimize for Visualization (Downsampling) and extract trades.
+        # Both plans read result_df and run together in one collect_all.
+        result_lf = result_df.lazy()
+        if indicators_lf is not None:
+            chart_lf = _chart_frame(result_lf, indicator_cols, indicators_lf=indicators_lf)
+        else:
+            chart_lf = _chart_frame(result_lf, _indicator_columns(result_df.schema))
+        trades_lf = result_lf.with_columns(
+            (pl.col("position") - pl.col("position").shift(1, fill_value=0)).alias("trade_action")
+        ).filter(pl.col("trade_action") != 0).select([
+            pl.col("timestamp").dt.epoch("s").alias("time"),
+            _trade_type(pl.col("trade_action") > 0),
+            pl.col("close").alias("price"),
+        ])
+        chart_df, trades_df = pl.collect_all([chart_lf, trades_lf])
 
-        return self._format_response(request, metrics, result_df, chart_df)
+        return self._format_response(request, metrics, chart_df, trades_df)
 
     def _run_event_backtest(self, request, df, strategy_cls):
         from engine.event_engine import EventEngine
@@ -128,15 +340,6 @@ class BacktestService:
         from engine.portfolio import PortfolioManager, RiskParams
         from engine.execution import VolumeAwareExecutionHandler
         
-        # Setup Engine
-        engine = EventEngine()
-        bus = engine.bus
-        
-        # Setup Strategy
-        strategy = strategy_cls(params=request.params)
-        strategy.set_bus(bus)
-        engine.register_strategy(strategy)
-
         # Map API RiskParams to engine RiskParams
         risk_params = RiskParams(
             sizing_method=request.risk_params.sizing_method,
@@ -146,12 +349,24 @@ class BacktestService:
             max_position_pct=request.risk_params.max_position_pct,
             stop_loss_pct=request.risk_params.stop_loss_pct,
         )
+
+        # Setup Strategy
+        strategy = strategy_cls(params=request.params)
+        if strategy.is_vectorizable:
+            return self._run_fast_event_backtest(request, df, strategy, risk_params)
+
+        # Setup Engine
+        engine = EventEngine()
+        bus = engine.bus
+        strategy.set_bus(bus)
+        engine.register_strategy(strategy)
         
         # Setup Portfolio Manager (subscribes to Signal, Fill, Market events)
         portfolio = PortfolioManager(
             bus=bus,
             initial_cash=request.initial_cash,
             risk_params=risk_params,
+            universe=[request.symbol],
         )
 
         # Setup Volume-Aware Execution Handler
@@ -162,57 +377,73 @@ class BacktestService:
             max_participation_rate=0.10,
         )
         
-        # Collect visualization data
-        candles = []
-        signals_viz = []
-        
-        # Data Generator
-        rows = df.rows(named=True)
-        
+        # Data Generator: columns are pulled out of Polars once as plain lists
+        # and zipped, so the per-bar cost is one MarketEvent and no row or
+        # dict materialization. Hour-boundary bars are located up front; the
+        # generator replays the bars between consecutive boundaries in runs
+        # and snapshots after each run, so the per-bar loop has no check.
+        bars = df.select(
+            pl.col("timestamp").dt.epoch("s").alias("time"), "open", "high", "low", "close", "volume"
+        )
+        is_hourly = bars["time"] % 3600 == 0
+        hour_idx = is_hourly.arg_true().to_list()
+        columns = [bars[name].to_list() for name in bars.columns]
+        times = columns[0]
+        symbol = request.symbol
+
         def data_gen():
-            for row in rows:
-                ts = int(row["timestamp"].timestamp())
-                evt = MarketEvent(
-                    time=ts,
-                    symbol=request.symbol,
-                    open=row["open"],
-                    high=row["high"],
-                    low=row["low"],
-                    close=row["close"],
-                    volume=row["volume"]
-                )
-                yield evt
-                
-                # Record equity snapshot every hour
-                if ts % 3600 == 0:
-                    portfolio.snapshot(ts)
-                    candles.append(CandlePoint(
-                        time=ts, open=row["open"], high=row["high"],
-                        low=row["low"], close=row["close"], volume=row["volume"]
-                    ))
+            rows = zip(*columns)
+            start = 0
+            for stop in hour_idx + [len(times)]:
+                for ts, open_, high, low, close, volume in islice(rows, stop + 1 - start):
+                    yield MarketEvent(
+                        time=ts,
+                        symbol=symbol,
+                        open=open_,
+                        high=high,
+                        low=low,
+                        close=close,
+                        volume=volume
+                    )
+                start = stop + 1
+
+                # Record equity snapshot every hour (after the boundary bar)
+                if stop < len(times):
+                    portfolio.snapshot(times[stop])
 
         engine.run(data_gen())
+
+        # Hourly candles, selected column-wise with the same mask
+        hourly_bars = bars.filter(is_hourly)
+        candles = CandleSeries.model_construct(
+            time=hourly_bars["time"].to_list(),
+            open=hourly_bars["open"].to_list(),
+            high=hourly_bars["high"].to_list(),
+            low=hourly_bars["low"].to_list(),
+            close=hourly_bars["close"].to_list(),
+            volume=hourly_bars["volume"].to_list(),
+        )
         
         # Build equity curve from portfolio snapshots
-        equity_curve = [
-            ChartPoint(time=snap["time"], value=snap["equity"])
-            for snap in portfolio.equity_history
-        ]
+        equity_curve = ChartSeries.model_construct(
+            time=[snap["time"] for snap in portfolio.equity_history],
+            value=[snap["equity"] for snap in portfolio.equity_history],
+        )
         
-        # Build signal markers from fills log
-        for fill in portfolio.fills_log:
-            sig_type = "buy" if fill["direction"] == "BUY" else "sell"
-            signals_viz.append(SignalPoint(
-                time=int(fill["time"]),
-                type=sig_type,
-                price=fill["price"],
-            ))
+        # Build signal markers from fills log: buy/sell labelling is done by
+        # Polars over the whole column rather than a Python branch per fill
+        fills_df = portfolio.fills
+        signals_viz = _signal_series(fills_df.select(
+            pl.col("time").cast(pl.Int64),
+            _trade_type(pl.col("direction") == "BUY"),
+            "price",
+        ))
         
         # Calculate Metrics
         from services.metrics_service import MetricsService
         equity_values = [p["equity"] for p in portfolio.equity_history]
         metrics = MetricsService.calculate_metrics(
-            equity_values, request.initial_cash, fills=portfolio.fills_log
+            equity_values, request.initial_cash, fills=fills_df
         )
         metrics["Status"] = "Event Backtest Completed"
         metrics["Sizing Method"] = risk_params.sizing_method
@@ -228,52 +459,100 @@ class BacktestService:
             indicators={}
         )
 
-    def _format_response(self, request, metrics, result_df, chart_df):
-         # Identify Indicator Columns
-        exclude_cols = {"timestamp", "open", "high", "low", "close", "volume", "signal", "position", "strategy_return", "market_return", "equity", "trade_action"}
-        indicator_cols = [c for c in result_df.columns if c not in exclude_cols and result_df[c].dtype in [pl.Float64, pl.Float32]]
+    def _run_fast_event_backtest(self, request, df, strategy, risk_params):
+        """Event-mode backtest for vectorizable strategies.
+
+        Signals come from one generate_signals pass and the portfolio and
+        execution rules run in FastEventEngine's array loop; the response
+        has the same shape as the bus-driven path (hourly snapshots).
+        """
+        from engine.fast_event_engine import FastEventEngine
+        from services.metrics_service import MetricsService
+
+        signals_df = strategy.generate_signals(df)
+        result = FastEventEngine(
+            initial_cash=request.initial_cash,
+            risk_params=risk_params,
+            slippage=request.slippage,
+            commission=request.commission,
+            max_participation_rate=0.10,
+        ).run(signals_df)
+
+        # Equity snapshots and candles on the hour, as PortfolioManager.snapshot
+        hourly = pl.concat(
+            [signals_df.select("open", "high", "low", "close", "volume"), result.equity],
+            how="horizontal",
+        ).with_columns(
+            pl.col("timestamp").dt.epoch("s").alias("time")
+        ).filter(pl.col("time") % 3600 == 0)
+        time_list = hourly["time"].to_list()
+
+        fills = result.fills.select(
+            pl.col("timestamp").dt.epoch("s").alias("time"),
+            "direction", "quantity", "price", "commission",
+        )
+        signals_viz = _signal_series(
+            fills.select("time", _trade_type(pl.col("direction") == "BUY"), "price")
+        )
+
+        metrics = MetricsService.calculate_metrics(
+            hourly["equity"], request.initial_cash, fills=fills
+        )
+        metrics["Status"] = "Event Backtest Completed"
+        metrics["Sizing Method"] = risk_params.sizing_method
+        metrics["Execution Stats"] = result.stats
+
+        return BacktestResponse(
+            symbol=request.symbol,
+            strategy=request.strategy,
+            metrics=metrics,
+            equity_curve=ChartSeries.model_construct(time=time_list, value=hourly["equity"].to_list()),
+            signals=signals_viz,
+            candles=CandleSeries.model_construct(
+                time=time_list,
+                open=hourly["open"].to_list(),
+                high=hourly["high"].to_list(),
+                low=hourly["low"].to_list(),
+                close=hourly["close"].to_list(),
+                volume=hourly["volume"].to_list(),
+            ),
+            indicators={}
+        )
+
+    def _format_response(self, request, metrics, chart_df, trades_df):
+        # Identify Indicator Columns (one schema lookup, no per-column Series access)
+        indicator_cols = _indicator_columns(chart_df.schema)
         
         # Convert to Output Models
-        chart_rows = chart_df.rows(named=True)
-        
-        eq_curve = []
-        candles = []
-        indicators: Dict[str, List[IndicatorPoint]] = {}
-        for col in indicator_cols:
-            indicators[col] = []
-            
-        for row in chart_rows:
-            ts = int(row["timestamp"].timestamp())
-            
-            # Equity Curve
-            eq_curve.append(ChartPoint(time=ts, value=row["equity"]))
-            
-            # Candles
-            candles.append(CandlePoint(
-                time=ts,
-                open=row["open"],
-                high=row["high"],
-                low=row["low"],
-                close=row["close"],
-                volume=row["volume"]
-            ))
-            
-            # Indicators
-            for col in indicator_cols:
-                if row[col] is not None:
-                    indicators[col].append(IndicatorPoint(time=ts, value=row[col]))
+        time_list = chart_df["timestamp"].dt.epoch("s").to_list()
+
+        eq_curve = ChartSeries.model_construct(time=time_list, value=chart_df["equity"].to_list())
+
+        # Candles and indicators are emitted column-wise straight from Polars
+        candles = CandleSeries.model_construct(
+            time=time_list,
+            open=chart_df["open"].to_list(),
+            high=chart_df["high"].to_list(),
+            low=chart_df["low"].to_list(),
+            close=chart_df["close"].to_list(),
+            volume=chart_df["volume"].to_list(),
+        )
+
+        # Null/NaN-free time/value lists for every indicator in a single
+        # select; is_not_nan is null for null cells, so one mask drops both
+        epoch = pl.col("timestamp").dt.epoch("s")
+        valid = {c: pl.col(c).is_not_nan() for c in indicator_cols}
+        series = chart_df.select(
+            [epoch.filter(valid[c]).implode().alias(f"{c}.time") for c in indicator_cols]
+            + [pl.col(c).filter(valid[c]).implode().alias(f"{c}.value") for c in indicator_cols]
+        ).row(0, named=True) if indicator_cols else {}
+        indicators: Dict[str, ChartSeries] = {
+            c: ChartSeries.model_construct(time=series[f"{c}.time"], value=series[f"{c}.value"])
+            for c in indicator_cols
+        }
             
-        # Extract Signals (Trades)
-        trades_df = result_df.with_columns([
-            (pl.col("position") - pl.col("position").shift(1).fill_null(0)).alias("trade_action")
-        ]).filter(pl.col("trade_action") != 0).select(["timestamp", "trade_action", "close"])
-        
-        signals = []
-        t_rows = trades_df.rows(named=True)
-        for row in t_rows:
-            ts = row["timestamp"].timestamp()
-            action = "buy" if row["trade_action"] > 0 else "sell"
-            signals.append(SignalPoint(time=int(ts), type=action, price=row["close"]))
+        # Signals (Trades)
+        signals = _signal_series(trades_df)
 
         return BacktestResponse(
             symbol=request.symbol,
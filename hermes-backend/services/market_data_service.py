@@ -4,8 +4,11 @@ This service now uses hermes_data.DataService internally while maintaining
 backward compatibility with the existing API.
 """
 
+import io
 import logging
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, TypeVar
 
 import polars as pl
 
@@ -14,6 +17,13 @@ from api.models import CandlePoint
 # Import from the new hermes-data package
 from hermes_data import DataService
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+# Short-lived caches absorb dashboard poll storms without serving stale data for long
+INSTRUMENTS_CACHE_TTL_SECONDS = 60.0
+CANDLES_CACHE_TTL_SECONDS = 30.0
+CANDLES_CACHE_MAX_ENTRIES = 32
+
 
 class MarketDataService:
     """Service for accessing market data.
@@ -42,6 +52,10 @@ class MarketDataService:
             )
         
         self._data_service = data_service or DataService()
+        self._instruments_cache: Optional[Tuple[float, List[str]]] = None
+        self._candles_cache: Dict[Tuple[str, str], Tuple[float, List[CandlePoint]]] = {}
+        # Routes call get_candles from worker threads (asyncio.to_thread)
+        self._candles_lock = threading.Lock()
 
     @property
     def data_service(self) -> DataService:
@@ -59,14 +73,30 @@ class MarketDataService:
     def list_instruments(self) -> List[str]:
         """List all available instrument symbols.
         
+        Results are cached for INSTRUMENTS_CACHE_TTL_SECONDS; failures are
+        not cached.
+        
         Returns:
             Sorted list of symbol names
         """
+        now = time.monotonic()
+        if self._instruments_cache is not None:
+            cached_at, instruments = self._instruments_cache
+            if now - cached_at < INSTRUMENTS_CACHE_TTL_SECONDS:
+                return list(instruments)
         try:
-            return self._data_service.list_instruments()
+            instruments = self._data_service.list_instruments()
         except Exception as e:
             logging.warning(f"Could not list instruments: {str(e)}")
             return []
+        self._instruments_cache = (now, instruments)
+        return list(instruments)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached instrument lists and candles (e.g. after a registry sync)."""
+        self._instruments_cache = None
+        with self._candles_lock:
+            self._candles_cache.clear()
 
     def load_and_resample(
         self,
@@ -101,38 +131,70 @@ class MarketDataService:
             timeframe: Resample interval
             
         Returns:
-            List of CandlePoint objects
+            List of CandlePoint objects (cached briefly per symbol/timeframe;
+            each call gets its own list)
         """
+        symbol = symbol.upper()
+        key = (symbol, timeframe)
+        now = time.monotonic()
+        with self._candles_lock:
+            cached = self._candles_cache.get(key)
+        if cached is not None and now - cached[0] < CANDLES_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
         chart_df = self.load_and_resample(symbol, timeframe)
 
-        # Convert to CandlePoint list
-        candles = []
-        rows = chart_df.rows(named=True)
-        for row in rows:
-            ts = int(row["timestamp"].timestamp())
-            candles.append(
-                CandlePoint(
-                    time=ts,
-                    open=row["open"],
-                    high=row["high"],
-                    low=row["low"],
-                    close=row["close"],
-                    volume=row["volume"],
-                )
-            )
-        return candles
+        # Convert to CandlePoint list: columns are materialized by Polars in
+        # bulk and zipped positionally (order matches the dataclass fields)
+        columns = chart_df.select(
+            pl.col("timestamp").dt.epoch("s"),
+            "open", "high", "low", "close", "volume",
+        ).get_columns()
+        candles = list(map(CandlePoint, *(col.to_list() for col in columns)))
+
+        with self._candles_lock:
+            if key not in self._candles_cache and len(self._candles_cache) >= CANDLES_CACHE_MAX_ENTRIES:
+                self._candles_cache.pop(next(iter(self._candles_cache)))
+            self._candles_cache[key] = (now, candles)
+        return list(candles)
+
+    def get_candles_arrow(self, symbol: str, timeframe: str = "1h") -> bytes:
+        """Get candles for a symbol as an Arrow IPC stream.
+        
+        Columns match CandlePoint (time as epoch seconds, OHLCV as float64),
+        so clients can read the arrays without parsing JSON.
+        
+        Args:
+            symbol: Instrument symbol
+            timeframe: Resample interval
+            
+        Returns:
+            Arrow IPC stream bytes
+        """
+        chart_df = self.load_and_resample(symbol, timeframe).select(
+            pl.col("timestamp").dt.epoch("s").alias("time"),
+            "open", "high", "low", "close", "volume",
+        )
+        buffer = io.BytesIO()
+        chart_df.write_ipc_stream(buffer)
+        return buffer.getvalue()
 
     @staticmethod
-    def resample_data(df: pl.DataFrame, interval: str = "1h") -> pl.DataFrame:
+    def resample_data(df: FrameT, interval: str = "1h") -> FrameT:
         """Downsample datasets to specified interval for visualization.
         
+        Accepts either a DataFrame or a LazyFrame; a LazyFrame stays lazy so
+        callers can fuse the resample into a larger plan and collect once.
+        
         Args:
-            df: Input DataFrame with OHLCV data
+            df: Input DataFrame/LazyFrame with OHLCV data
             interval: Resample interval (e.g., "1h", "4h", "1d")
             
         Returns:
-            Resampled DataFrame
+            Resampled frame of the same kind as the input
         """
+        schema = df.collect_schema()
+
         # Define aggregation dict for basic OHLCV
         agg_dict = {
             "open": pl.col("open").first(),
@@ -144,7 +206,7 @@ class MarketDataService:
         }
 
         # If equity/indicators exist, add them
-        if "equity" in df.columns:
+        if "equity" in schema:
             agg_dict["equity"] = pl.col("equity").last()
 
         # Add other float columns as indicators
@@ -161,8 +223,8 @@ class MarketDataService:
             "equity",
             "trade_action",
         }
-        for col in df.columns:
-            if col not in exclude and df[col].dtype in [pl.Float64, pl.Float32]:
+        for col, dtype in schema.items():
+            if col not in exclude and dtype in [pl.Float64, pl.Float32]:
                 agg_dict[col] = pl.col(col).last()
 
         return (
@@ -1,13 +1,13 @@
 import numpy as np
 import polars as pl
-from typing import Dict, List, Optional, Union, cast
+from typing import Dict, List, Optional, Union
 
 class MetricsService:
     @staticmethod
     def calculate_metrics(
         equity_curve: Union[List[float], pl.Series],
         initial_cash: float,
-        fills: Optional[List[Dict]] = None,
+        fills: Optional[Union[List[Dict], pl.DataFrame]] = None,
     ) -> Dict[str, str]:
         """
         Calculates standardized performance metrics from an equity curve.
@@ -15,12 +15,16 @@ class MetricsService:
         Args:
             equity_curve: List of equity values over time
             initial_cash: Starting capital
-            fills: Optional list of fill dicts from PortfolioManager for trade-level metrics
+            fills: Optional fills (DataFrame or list of fill dicts) from PortfolioManager
+                for trade-level metrics
         """
-        if isinstance(equity_curve, list):
-            equity_curve = pl.Series("equity", equity_curve)
+        # Work on a contiguous float64 NumPy view; no intermediate Series
+        if isinstance(equity_curve, pl.Series):
+            equity = equity_curve.to_numpy()
+        else:
+            equity = np.asarray(equity_curve, dtype=np.float64)
             
-        if len(equity_curve) < 2:
+        if len(equity) < 2:
             return {
                 "Total Return": "0.00%",
                 "Max Drawdown": "0.00%",
@@ -33,69 +37,55 @@ class MetricsService:
             }
 
         # 1. Total Return
-        final_equity = equity_curve[-1]
+        final_equity = float(equity[-1])
         total_return = (final_equity / initial_cash) - 1
 
         # 2. Max Drawdown
-        running_max = equity_curve.cum_max()
-        drawdown = (equity_curve - running_max) / running_max
-        max_drawdown = drawdown.min()
+        max_drawdown = float((equity / np.maximum.accumulate(equity) - 1.0).min())
 
         # 3. Sharpe Ratio
-        # Calculate returns from equity curve
-        returns = equity_curve.diff() / equity_curve.shift(1)
-        returns = returns.drop_nulls().fill_nan(0.0)
+        # Calculate returns from equity curve (0/0 is treated as a flat bar)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(equity) / equity[:-1]
+        returns[np.isnan(returns)] = 0.0
         
         sharpe = 0.0
-        if len(returns) > 0:
-            # Polars mean() returns a float or None for Series
-            raw_mean = returns.mean()
-            raw_std = returns.std()
-            
-            mean_ret = float(raw_mean) if raw_mean is not None else 0.0 # type: ignore
-            std_dev = float(raw_std) if raw_std is not None else 0.0 # type: ignore
-            
+        if returns.size > 1:
+            std_dev = returns.std(ddof=1)  # sample std, as Polars' Series.std
             # Annualize
-            if raw_mean is not None and raw_std is not None and std_dev != 0:
-                sharpe = (mean_ret / std_dev) * np.sqrt(252 * 375)
+            if std_dev != 0:
+                sharpe = float((returns.mean() / std_dev) * np.sqrt(252 * 375))
 
         metrics: Dict[str, str] = {
             "Total Return": f"{total_return:.2%}",
-            "Max Drawdown": f"{cast(float, max_drawdown or 0.0):.2%}",
+            "Max Drawdown": f"{max_drawdown:.2%}",
             "Sharpe Ratio": f"{sharpe:.2f}",
             "Final Equity": f"{final_equity:.2f}",
         }
 
         # 4. Trade-level metrics (from PortfolioManager fills)
-        if fills and len(fills) > 0:
-            # Build round-trip trades from fills
-            buy_fills = [f for f in fills if f.get("direction") == "BUY"]
-            sell_fills = [f for f in fills if f.get("direction") == "SELL"]
+        if fills is not None and len(fills) > 0:
+            # Build round-trip trades from fills: the i-th BUY pairs with the
+            # i-th SELL, evaluated column-wise rather than per fill dict
+            fills_df = fills if isinstance(fills, pl.DataFrame) else pl.DataFrame(fills)
+            buy_fills = fills_df.filter(pl.col("direction") == "BUY")
+            sell_fills = fills_df.filter(pl.col("direction") == "SELL")
             
-            total_trades = min(len(buy_fills), len(sell_fills))
+            total_trades = min(buy_fills.height, sell_fills.height)
             metrics["Total Trades"] = str(total_trades)
             
             if total_trades > 0:
                 # Calculate P&L per round-trip
-                winning_trades = 0
-                gross_profit = 0.0
-                gross_loss = 0.0
-                max_capital_in_trade = 0.0
-                
-                for i in range(total_trades):
-                    buy_price = buy_fills[i].get("price", 0)
-                    sell_price = sell_fills[i].get("price", 0)
-                    qty = buy_fills[i].get("quantity", 0)
-                    trade_pnl = (sell_price - buy_price) * qty
-                    trade_capital = buy_price * qty
-                    
-                    if trade_pnl > 0:
-                        winning_trades += 1
-                        gross_profit += trade_pnl
-                    else:
-                        gross_loss += abs(trade_pnl)
-                    
-                    max_capital_in_trade = max(max_capital_in_trade, trade_capital)
+                buy_price = buy_fills["price"].head(total_trades).to_numpy()
+                sell_price = sell_fills["price"].head(total_trades).to_numpy()
+                qty = buy_fills["quantity"].head(total_trades).to_numpy()
+                trade_pnl = (sell_price - buy_price) * qty
+                wins = trade_pnl > 0
+
+                winning_trades = int(wins.sum())
+                gross_profit = float(trade_pnl[wins].sum())
+                gross_loss = float(np.abs(trade_pnl[~wins]).sum())
+                max_capital_in_trade = max(0.0, float((buy_price * qty).max()))
                 
                 win_rate = winning_trades / total_trades
                 metrics["Win Rate"] = f"{win_rate:.1%}"
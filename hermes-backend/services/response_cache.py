@@ -0,0 +1,61 @@
+"""In-process LRU cache for serialized API responses.
+
+Identical backtest/scan requests (dashboard polls, parameter sweeps) are
+served from pre-encoded JSON bytes instead of being recomputed.
+"""
+
+import hashlib
+from datetime import date
+from typing import Optional
+
+import orjson
+from pydantic import BaseModel
+
+from services.bounded_cache import BoundedCache
+
+# Defaults: bounded by entry count, total bytes and age
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RESPONSE_CACHE_TTL_SECONDS = 15 * 60
+
+
+def has_closed_date_range(request: BaseModel) -> bool:
+    """True if the request's end_date lies strictly in the past.
+
+    Results for an open range (no end_date, or one reaching today) change
+    as new bars are ingested, so they must not be served from the cache.
+    """
+    end_date = getattr(request, "end_date", None)
+    if not end_date:
+        return False
+    try:
+        return date.fromisoformat(end_date) < date.today()
+    except ValueError:
+        return False
+
+
+def request_cache_key(namespace: str, request: BaseModel) -> Optional[str]:
+    """Canonical hash of a request model (key order independent).
+
+    Returns None for requests whose results can still change (open-ended
+    date range); those are always recomputed.
+    """
+    if not has_closed_date_range(request):
+        return None
+    payload = orjson.dumps(
+        {"ns": namespace, "req": request.model_dump(mode="json")},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class ResponseCache(BoundedCache[bytes]):
+    """Thread-safe LRU of response bytes with TTL and a total size cap."""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        super().__init__(len, max_entries, max_bytes, ttl_seconds)
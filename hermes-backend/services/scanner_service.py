@@ -10,6 +10,7 @@ import asyncio
 import hashlib
 import json
 import logging
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -22,6 +23,7 @@ from api.models import (
 )
 from services.backtest_service import BacktestService
 from services.market_data_service import MarketDataService
+from strategies import canonical_strategy_name
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,11 @@ class ScannerService:
         """Run strategy across multiple symbols concurrently."""
         start_time = time.time()
 
+        # Strategy names are matched case-insensitively ("rsistrategy")
+        strategy_name = canonical_strategy_name(request.strategy)
+        if strategy_name != request.strategy:
+            request = request.model_copy(update={"strategy": strategy_name})
+
         # 1. Validate strategy exists
         avail_strategies = self.backtest_service.get_strategies()
         if request.strategy not in avail_strategies:
@@ -79,7 +86,7 @@ class ScannerService:
 
         # 2. Resolve symbol list
         if request.symbols:
-            symbols = list(set(s.upper() for s in request.symbols))
+            symbols = list(set(sys.intern(s.upper()) for s in request.symbols))
         else:
             symbols = self.market_data_service.list_instruments()
 
@@ -121,8 +128,19 @@ class ScannerService:
         fresh_results: List[ScanResult] = []
         if symbols_to_compute:
             sem = asyncio.Semaphore(request.max_concurrency)
+            # Validate the shared request fields once; each symbol gets a cheap copy
+            template = BacktestRequest(
+                symbol="",
+                strategy=request.strategy,
+                params=request.params,
+                initial_cash=request.initial_cash,
+                mode=request.mode,
+                timeframe=request.timeframe,
+                start_date=request.start_date,
+                end_date=request.end_date,
+            )
             tasks = [
-                self._backtest_symbol(sym, request, sem)
+                self._backtest_symbol(sym, template, sem)
                 for sym in symbols_to_compute
             ]
             fresh_results = await asyncio.gather(*tasks)
@@ -164,22 +182,13 @@ class ScannerService:
     async def _backtest_symbol(
         self,
         symbol: str,
-        request: ScanRequest,
+        template: BacktestRequest,
         sem: asyncio.Semaphore,
     ) -> ScanResult:
         """Backtest one symbol. Never raises — catches all exceptions."""
         async with sem:
             try:
-                backtest_req = BacktestRequest(
-                    symbol=symbol,
-                    strategy=request.strategy,
-                    params=request.params,
-                    initial_cash=request.initial_cash,
-                    mode=request.mode,
-                    timeframe=request.timeframe,
-                    start_date=request.start_date,
-                    end_date=request.end_date,
-                )
+                backtest_req = template.model_copy(update={"symbol": symbol})
 
                 # Run in executor to avoid blocking the event loop
                 loop = asyncio.get_event_loop()
@@ -192,11 +201,10 @@ class ScannerService:
                 # Extract last signal
                 last_signal = None
                 last_signal_time = None
-                signal_count = len(result.signals)
-                if result.signals:
-                    last = result.signals[-1]
-                    last_signal = last.type
-                    last_signal_time = last.time
+                signal_count = len(result.signals.time)
+                if signal_count:
+                    last_signal = result.signals.type[-1]
+                    last_signal_time = result.signals.time[-1]
 
                 return ScanResult(
                     symbol=symbol,
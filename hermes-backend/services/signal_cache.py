@@ -0,0 +1,65 @@
+"""In-process LRU cache for strategy signal frames.
+
+Parameter sweeps re-run the same strategy and parameters on the same bars
+with different execution settings, such as the initial cash. The
+generate_signals output only depends on the bars and the strategy, so it is
+kept here and reused instead of being recomputed.
+"""
+
+import hashlib
+from typing import Optional
+
+import orjson
+import polars as pl
+
+from api.models import BacktestRequest
+from services.bounded_cache import BoundedCache
+from services.response_cache import has_closed_date_range
+
+# Defaults: bounded by entry count, total estimated frame size and age (a
+# closed range can still be backfilled or corrected)
+SIGNAL_CACHE_MAX_ENTRIES = 64
+SIGNAL_CACHE_MAX_BYTES = 512 * 1024 * 1024
+SIGNAL_CACHE_TTL_SECONDS = 15 * 60
+
+
+def signal_cache_key(request: BacktestRequest) -> Optional[str]:
+    """Hash of the request fields that determine the strategy's signals.
+
+    Returns None for open-ended date ranges: their bars still change as new
+    data is ingested.
+    """
+    if not has_closed_date_range(request):
+        return None
+    payload = orjson.dumps(
+        {
+            "symbol": request.symbol.upper(),
+            "strategy": request.strategy,
+            "params": request.params,
+            "start_date": request.start_date,
+            "end_date": request.end_date,
+            "timeframe": request.timeframe,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _frame_bytes(frame: pl.DataFrame) -> int:
+    return int(frame.estimated_size())
+
+
+class SignalCache(BoundedCache[pl.DataFrame]):
+    """Thread-safe LRU of signal DataFrames with TTL and a total size cap.
+
+    Frames are shared, not copied: Polars operations return new frames, so
+    callers cannot mutate a cached entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SIGNAL_CACHE_MAX_ENTRIES,
+        max_bytes: int = SIGNAL_CACHE_MAX_BYTES,
+        ttl_seconds: float = SIGNAL_CACHE_TTL_SECONDS,
+    ):
+        super().__init__(_frame_bytes, max_entries, max_bytes, ttl_seconds)
@@ -1,13 +1,44 @@
+from typing import Dict, Type
+
+from engine.strategy import Strategy
 from .sma_cross import SMACrossover
 from .rsi import RSIStrategy
 from .bollinger import BollingerBandsStrategy
 from .macd import MACDStrategy
 from .mtf_trend_following import MTFTrendFollowingStrategy
 
+# Name -> class registry, built once at import
+STRATEGIES: Dict[str, Type[Strategy]] = {
+    cls.__name__: cls
+    for cls in (
+        SMACrossover,
+        RSIStrategy,
+        BollingerBandsStrategy,
+        MACDStrategy,
+        MTFTrendFollowingStrategy,
+    )
+}
+
+# Lower-cased index so user-supplied names resolve case-insensitively
+_STRATEGY_NAMES_BY_LOWER = {name.lower(): name for name in STRATEGIES}
+
+
+def canonical_strategy_name(name: str) -> str:
+    """Registered spelling of a strategy name ("rsistrategy" -> "RSIStrategy").
+
+    Unknown names are returned unchanged so callers report them as missing.
+    """
+    if name in STRATEGIES:
+        return name
+    return _STRATEGY_NAMES_BY_LOWER.get(name.lower(), name)
+
+
 __all__ = [
     "SMACrossover", 
     "RSIStrategy", 
     "BollingerBandsStrategy",
     "MACDStrategy",
-    "MTFTrendFollowingStrategy"
+    "MTFTrendFollowingStrategy",
+    "STRATEGIES",
+    "canonical_strategy_name",
 ]
@@ -9,6 +9,9 @@ class BollingerBandsStrategy(Strategy):
     - Buy when Close crosses below Lower Band (Oversold)
     - Sell when Close crosses above Upper Band (Overbought)
     """
+    is_vectorizable = True
+    DEFAULT_PARAMS = {"period": 20, "std_dev": 2.0}
+
     def generate_signals(self, df: pl.DataFrame) -> pl.DataFrame:
         period = self.params.get("period", 20)
         std_dev_multiplier = self.params.get("std_dev", 2.0)
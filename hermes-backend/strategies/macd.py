@@ -11,6 +11,9 @@ class MACDStrategy(Strategy):
     - Buy when MACD crosses ABOVE Signal Line
     - Sell when MACD crosses BELOW Signal Line
     """
+    is_vectorizable = True
+    DEFAULT_PARAMS = {"fast_period": 12, "slow_period": 26, "signal_period": 9}
+
     def generate_signals(self, df: pl.DataFrame) -> pl.DataFrame:
         fast_period = self.params.get("fast_period", 12)
         slow_period = self.params.get("slow_period", 26)
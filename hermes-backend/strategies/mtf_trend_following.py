@@ -9,21 +9,24 @@ class MTFTrendFollowingStrategy(Strategy):
     2. Calculates Daily Trend (SMA 50 > SMA 200).
     3. Trades Minute RSI Dips ONLY if Daily Trend is Bullish.
     """
+    is_vectorizable = True
+
     def generate_signals(self, df: pl.DataFrame) -> pl.DataFrame:
         # 1. Resample to Daily
-        daily_df = resample_data(df, interval="1d")
+        # Lazy so the sort, resample and trend columns run as one plan
+        daily_lf = resample_data(df.lazy(), interval="1d")
         
         # 2. Calculate Daily Indicators (Trend)
-        daily_df = daily_df.with_columns([
+        daily_df = daily_lf.with_columns([
             pl.col("close").rolling_mean(window_size=50).alias("sma_50"),
             pl.col("close").rolling_mean(window_size=200).alias("sma_200")
         ]).with_columns([
             (pl.col("sma_50") > pl.col("sma_200")).alias("bullish_trend")
-        ])
+        ]).select(["timestamp", "bullish_trend"]).collect()
         
         # 3. Merge Daily Data back to Minute
         # Result columns: bullish_trend_htf
-        df_merged = merge_mtf(df, daily_df.select(["timestamp", "bullish_trend"]), suffix="_htf")
+        df_merged = merge_mtf(df, daily_df, suffix="_htf")
         
         # 4. Calculate Minute Indicators (RSI)
         # Reuse logic or efficient calc
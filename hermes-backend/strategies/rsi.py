@@ -12,6 +12,8 @@ class RSIStrategy(Strategy):
     - Buy when RSI < oversold (default 30) -> Mean Reversion Buy
     - Sell when RSI > overbought (default 70) -> Mean Reversion Sell
     """
+    DEFAULT_PARAMS = {"period": 14, "overbought": 70, "oversold": 30}
+
     def __init__(self, params: dict | None = None):
         super().__init__(params)
         self.period = self.params.get("period", 14)
@@ -10,6 +10,9 @@ class SMACrossover(Strategy):
     Long when Fast SMA > Slow SMA.
     Flat otherwise.
     """
+    is_vectorizable = True
+    DEFAULT_PARAMS = {"fast_period": 50, "slow_period": 200}
+
     def generate_signals(self, df: pl.DataFrame) -> pl.DataFrame:
         fast_window = self.params.get("fast_period", 50)
         slow_window = self.params.get("slow_period", 200)
@@ -1,5 +1,8 @@
 """Tests for API routes."""
 
+import os
+import time
+from collections import OrderedDict
 from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
 import pytest
@@ -16,10 +19,12 @@ def reset_service_singletons():
     routes_module._market_data_service = None
     routes_module._backtest_service = None
     routes_module._scanner_service = None
+    routes_module._response_cache.clear()
     yield
     routes_module._market_data_service = None
     routes_module._backtest_service = None
     routes_module._scanner_service = None
+    routes_module._response_cache.clear()
 
 
 def test_health_check():
@@ -29,6 +34,45 @@ def test_health_check():
     assert response.json() == {"status": "Hermes API is running"}
 
 
+def test_correlation_id_header(caplog):
+    """Correlation IDs are echoed back or generated, and timing is logged in ms."""
+    import logging
+
+    response = client.get("/", headers={"X-Correlation-ID": "abc-123"})
+    assert response.headers["X-Correlation-ID"] == "abc-123"
+
+    with caplog.at_level(logging.INFO, logger="middleware"):
+        generated = client.get("/").headers["X-Correlation-ID"]
+    pid, seq, started = generated.split("-")
+    assert int(pid, 16) == os.getpid() and int(seq, 16) >= 0 and int(started, 16) > 0
+    record = [r.msg for r in caplog.records if r.name == "middleware"][-1]
+    assert record["correlation_id"] == generated
+    assert record["status_code"] == 200 and record["path"] == "/"
+    assert float(record["process_time_ms"]) >= 0
+    assert client.get("/").headers["X-Correlation-ID"] != generated
+
+
+def test_correlation_id_uuid_option():
+    """uuid_ids=True generates RFC 4122 UUIDs instead of counter IDs."""
+    import uuid
+    from fastapi import FastAPI
+    from middleware import CorrelationMiddleware
+
+    uuid_app = FastAPI()
+    uuid_app.add_middleware(CorrelationMiddleware, uuid_ids=True)
+    uuid_app.get("/")(lambda: {})
+
+    generated = TestClient(uuid_app).get("/").headers["X-Correlation-ID"]
+    assert uuid.UUID(hex=generated).version == 4
+
+
+def test_cors_wildcard_origin():
+    """Any origin is allowed with a static wildcard (no credentials)."""
+    response = client.get("/", headers={"Origin": "http://localhost:5173"})
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in response.headers
+
+
 def test_backtest_rsi(mock_market_data_service):
     """Test backtest endpoint with RSI strategy."""
     import api.routes as routes_module
@@ -53,6 +97,90 @@ def test_backtest_rsi(mock_market_data_service):
     assert data["symbol"] == "TEST_SYM"
 
 
+def test_backtest_columnar_payload(mock_market_data_service):
+    """Test candles and indicators are returned as aligned columns."""
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+    routes_module._backtest_service = BacktestService(mock_market_data_service)
+
+    payload = {
+        "symbol": "TEST_SYM",
+        "strategy": "RSIStrategy",
+        "params": {"period": 14},
+        "timeframe": "1m",
+    }
+    response = client.post("/backtest", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+
+    candles = data["candles"]
+    assert set(candles) == {"time", "open", "high", "low", "close", "volume"}
+    assert len(candles["time"]) > 0
+    assert all(len(candles[k]) == len(candles["time"]) for k in candles)
+    assert candles["time"] == sorted(candles["time"])
+
+    assert "rsi" in data["indicators"]
+    rsi = data["indicators"]["rsi"]
+    assert len(rsi["time"]) == len(rsi["value"])
+
+
+def test_backtest_bypasses_jsonable_encoder(mock_market_data_service, monkeypatch):
+    """Test large responses are encoded directly, never via jsonable_encoder."""
+    import fastapi.routing
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+
+    routes_module._backtest_service = BacktestService(mock_market_data_service)
+    routes_module._market_data_service = mock_market_data_service
+
+    def fail(*args, **kwargs):
+        raise AssertionError("jsonable_encoder should not be used")
+
+    monkeypatch.setattr(fastapi.routing, "jsonable_encoder", fail)
+
+    payload = {"symbol": "TEST_SYM", "strategy": "RSIStrategy", "timeframe": "1m"}
+    assert client.post("/backtest", json=payload).status_code == 200
+    assert client.get("/data/TEST_SYM?timeframe=1h").status_code == 200
+
+
+def test_backtest_repeat_served_from_cache(mock_market_data_service):
+    """Test an identical backtest request is answered from the response cache."""
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+
+    service = BacktestService(mock_market_data_service)
+    routes_module._backtest_service = service
+
+    payload = {
+        "symbol": "TEST_SYM", "strategy": "RSIStrategy", "params": {"period": 14}, "end_date": "2023-12-31",
+    }
+    first = client.post("/backtest", json=payload)
+    assert first.status_code == 200
+
+    routes_module._backtest_service = MagicMock()
+    second = client.post("/backtest", json=dict(reversed(list(payload.items()))))
+    assert second.status_code == 200
+    assert second.content == first.content
+    routes_module._backtest_service.run_backtest.assert_not_called()
+
+
+def test_backtest_open_date_range_is_not_cached(mock_market_data_service):
+    """Requests without a past end_date are recomputed so newly ingested bars show up."""
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+
+    service = BacktestService(mock_market_data_service)
+    spy = MagicMock(wraps=service.run_backtest)
+    service.run_backtest = spy
+    routes_module._backtest_service = service
+
+    payload = {"symbol": "TEST_SYM", "strategy": "RSIStrategy", "params": {"period": 14}}
+    assert client.post("/backtest", json=payload).status_code == 200
+    assert client.post("/backtest", json=payload).status_code == 200
+    assert spy.call_count == 2
+    assert routes_module._response_cache.stats()["entries"] == 0
+
+
 def test_backtest_invalid_strategy(mock_market_data_service):
     """Test backtest with non-existent strategy returns 400."""
     import api.routes as routes_module
@@ -70,6 +198,20 @@ def test_backtest_invalid_strategy(mock_market_data_service):
     assert response.status_code == 400
 
 
+def test_backtest_strategy_name_is_case_insensitive(mock_market_data_service):
+    """Strategy names resolve to their registered spelling regardless of case."""
+    import api.routes as routes_module
+    routes_module._market_data_service = mock_market_data_service
+
+    from services.backtest_service import BacktestService
+    routes_module._backtest_service = BacktestService(mock_market_data_service)
+
+    payload = {"symbol": "TEST_SYM", "strategy": "rsistrategy", "params": {"period": 5}}
+    response = client.post("/backtest", json=payload)
+    assert response.status_code == 200
+    assert response.json()["strategy"] == "RSIStrategy"
+
+
 def test_backtest_missing_params():
     """Test backtest with missing required fields returns 422."""
     payload = {"symbol": "TEST_SYM"}  # Missing strategy
@@ -77,6 +219,33 @@ def test_backtest_missing_params():
     assert response.status_code == 422
 
 
+def test_backtest_rejects_unknown_timeframe():
+    """Test an unsupported timeframe or mode fails validation with 422."""
+    base = {"symbol": "X", "strategy": "RSIStrategy"}
+    assert client.post("/backtest", json={**base, "timeframe": "7m"}).status_code == 422
+    assert client.post("/backtest", json={**base, "mode": "turbo"}).status_code == 422
+
+
+def test_request_identifiers_are_interned():
+    """Test repeated symbol/strategy strings resolve to the same object."""
+    from api.models import BacktestRequest, ScanRequest
+    a = BacktestRequest.model_validate_json(b'{"symbol": "RELIANCE", "strategy": "RSIStrategy"}')
+    b = BacktestRequest.model_validate_json(b'{"symbol": "RELIANCE", "strategy": "RSIStrategy"}')
+    assert a.symbol is b.symbol
+    assert a.strategy is b.strategy
+    scan = ScanRequest.model_validate_json(b'{"strategy": "RSIStrategy", "symbols": ["RELIANCE"]}')
+    assert scan.symbols[0] is a.symbol
+
+
+def test_backtest_malformed_json():
+    """Test backtest with a body that is not valid JSON returns 422."""
+    response = client.post(
+        "/backtest", content=b"{not json", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
 def test_list_instruments(mock_market_data_service):
     """Test instruments list endpoint."""
     import api.routes as routes_module
@@ -101,6 +270,101 @@ def test_get_market_data(mock_market_data_service):
     assert "candles" in data
 
 
+def test_get_market_data_gzip(mock_market_data_service):
+    """Test large responses are gzip-compressed when the client accepts it."""
+    import api.routes as routes_module
+    routes_module._market_data_service = mock_market_data_service
+
+    response = client.get("/data/TEST_SYM?timeframe=1m", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["candles"]) == 200
+
+    plain = client.get("/data/TEST_SYM?timeframe=1m", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+def test_get_market_data_arrow(mock_market_data_service):
+    """Test market data endpoint returns an Arrow IPC stream on request."""
+    import io
+    import polars as pl
+    import api.routes as routes_module
+    routes_module._market_data_service = mock_market_data_service
+
+    json_candles = client.get("/data/TEST_SYM?timeframe=1h").json()["candles"]
+
+    response = client.get("/data/TEST_SYM?timeframe=1h&format=arrow")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    df = pl.read_ipc_stream(io.BytesIO(response.content))
+    assert df.columns == ["time", "open", "high", "low", "close", "volume"]
+    assert df.to_dicts() == json_candles
+
+    negotiated = client.get(
+        "/data/TEST_SYM?timeframe=1h", headers={"Accept": "application/vnd.apache.arrow.stream"}
+    )
+    assert negotiated.content == response.content
+
+
+def test_read_endpoints_revalidate_with_etag(mock_market_data_service):
+    """Test /instruments and /data answer a matching If-None-Match with 304."""
+    import api.routes as routes_module
+    routes_module._market_data_service = mock_market_data_service
+
+    for url in ("/instruments", "/data/TEST_SYM?timeframe=1h", "/data/TEST_SYM?timeframe=1h&format=arrow"):
+        first = client.get(url)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=60"
+
+        revalidated = client.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+        assert client.get(url, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    json_etag = client.get("/data/TEST_SYM?timeframe=1h").headers["etag"]
+    arrow = client.get("/data/TEST_SYM?timeframe=1h&format=arrow")
+    assert arrow.headers["etag"] != json_etag
+    assert "Accept" in arrow.headers["vary"]
+
+
+def test_blocking_work_runs_off_the_event_loop(mock_market_data_service):
+    """Test data loading and backtests are not executed on the event loop thread."""
+    import asyncio
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+
+    on_loop = []
+
+    def record(fn):
+        def wrapper(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(fn.__name__)
+            except RuntimeError:
+                pass
+            return fn(*args, **kwargs)
+        wrapper.__name__ = fn.__name__
+        return wrapper
+
+    svc = mock_market_data_service
+    for name in ("list_instruments", "get_candles", "get_candles_arrow"):
+        setattr(svc, name, record(getattr(svc, name)))
+    backtest = BacktestService(svc)
+    backtest.run_backtest = record(backtest.run_backtest)
+    routes_module._market_data_service = svc
+    routes_module._backtest_service = backtest
+
+    assert client.get("/instruments").status_code == 200
+    assert client.get("/data/TEST_SYM").status_code == 200
+    assert client.get("/data/TEST_SYM?format=arrow").status_code == 200
+    payload = {"symbol": "TEST_SYM", "strategy": "RSIStrategy", "params": {"period": 5}}
+    assert client.post("/backtest", json=payload).status_code == 200
+    assert client.post("/backtest/stream", json=payload).status_code == 200
+    assert on_loop == []
+
+
 def test_get_market_data_not_found():
     """Test market data endpoint with non-existent symbol."""
     mock_service = MagicMock()
@@ -111,3 +375,316 @@ def test_get_market_data_not_found():
     
     response = client.get("/data/NONEXISTENT")
     assert response.status_code == 404
+
+
+def test_backtest_status_unknown_task():
+    """Test polling an unknown task id returns 404."""
+    response = client.get("/backtest/status/does-not-exist")
+    assert response.status_code == 404
+
+
+def test_task_queue_disabled_without_redis_url(monkeypatch):
+    """Test async backtests fall back to in-process tasks without Redis."""
+    import api.routes as routes_module
+    monkeypatch.delenv("HERMES_REDIS_URL", raising=False)
+    assert routes_module.get_task_queue() is None
+
+
+def test_queued_status_lookup_runs_off_event_loop(monkeypatch):
+    """Test RQ status lookups (blocking Redis calls) run on a worker thread."""
+    import asyncio
+    import api.routes as routes_module
+
+    looked_up = []
+
+    def fake_queued_status(queue, task_id):
+        try:
+            asyncio.get_running_loop()
+            looked_up.append("event loop")
+        except RuntimeError:
+            looked_up.append("worker thread")
+        return "processing", routes_module._status_payload(task_id, "processing")
+
+    monkeypatch.setattr(routes_module, "get_task_queue", lambda: object())
+    monkeypatch.setattr(routes_module, "_get_queued_backtest_status", fake_queued_status)
+
+    response = client.get("/backtest/status/queued")
+    assert response.status_code == 200
+    assert response.json()["status"] == "processing"
+    assert looked_up == ["worker thread"]
+
+
+def test_prune_task_store_evicts_expired_results(monkeypatch):
+    """Test finished in-process tasks are evicted after the TTL."""
+    import api.routes as routes_module
+    now = 10_000.0
+    monkeypatch.setattr(routes_module.time, "time", lambda: now)
+    monkeypatch.setattr(routes_module, "_task_store", OrderedDict({
+        "old": {"status": "completed", "finished_at": now - routes_module.TASK_RESULT_TTL_SECONDS - 1},
+        "fresh": {"status": "completed", "finished_at": now - 1},
+        "running": {"status": "processing", "finished_at": None},
+    }))
+    routes_module._prune_task_store()
+    assert set(routes_module._task_store) == {"fresh", "running"}
+
+
+def test_backtest_status_serves_stored_result_bytes(monkeypatch):
+    """Test a completed task's pre-serialized result is returned verbatim."""
+    import api.routes as routes_module
+    from api.models import BacktestResponse, BacktestStatusResponse
+
+    result = BacktestResponse(symbol="TEST_SYM", strategy="RSIStrategy", metrics={})
+    monkeypatch.setattr(routes_module, "_task_store", OrderedDict({
+        "done": {
+            "status": "completed",
+            "result": result.model_dump_json().encode(),
+            "error": None,
+            "finished_at": 0.0,
+        },
+    }))
+
+    response = client.get("/backtest/status/done")
+    assert response.status_code == 200
+    status = BacktestStatusResponse.model_validate_json(response.content)
+    assert status.status == "completed"
+    assert status.result == result
+
+
+def test_orjson_response_serializes_numpy():
+    """Test the default response class encodes NumPy values natively."""
+    import numpy as np
+    from api.orjson_response import ORJSONResponse
+
+    response = ORJSONResponse({"values": np.array([1.5, 2.5]), "scalar": np.float64(3.0)})
+    assert response.body == b'{"values":[1.5,2.5],"scalar":3.0}'
+
+
+def test_orjson_response_handles_models_and_naive_datetimes():
+    """Test pydantic models are dumped and naive datetimes are emitted as UTC."""
+    from datetime import datetime
+    from api.models import ChartSeries
+    from api.orjson_response import ORJSONResponse
+
+    response = ORJSONResponse({"at": datetime(2024, 1, 1), "series": ChartSeries(time=[1], value=[2.0])})
+    assert response.body == b'{"at":"2024-01-01T00:00:00+00:00","series":{"time":[1],"value":[2.0]}}'
+
+
+def test_update_storage_provider_rejects_unknown_provider():
+    """Test an unknown storage provider is rejected by schema validation."""
+    response = client.post("/settings/storage", json={"provider": "ftp"})
+    assert response.status_code == 422
+
+
+def test_backtest_stream_unknown_task():
+    """Test streaming an unknown task id returns 404."""
+    response = client.get("/backtest/stream/does-not-exist")
+    assert response.status_code == 404
+
+
+def test_backtest_stream_queued_lookups_run_off_event_loop(monkeypatch):
+    """Test SSE polling of an RQ task does one off-loop lookup per poll."""
+    import asyncio
+    import api.routes as routes_module
+
+    statuses = iter(["processing", "completed"])
+    looked_up = []
+
+    def fake_queued_status(queue, task_id):
+        try:
+            asyncio.get_running_loop()
+            looked_up.append("event loop")
+        except RuntimeError:
+            looked_up.append("worker thread")
+        status = next(statuses)
+        return status, routes_module._status_payload(task_id, status)
+
+    async def fake_wait(task_id, timeout):
+        pass
+
+    monkeypatch.setattr(routes_module, "get_task_queue", lambda: object())
+    monkeypatch.setattr(routes_module, "_get_queued_backtest_status", fake_queued_status)
+    monkeypatch.setattr(routes_module, "_wait_for_task", fake_wait)
+
+    response = client.get("/backtest/stream/queued")
+    assert response.status_code == 200
+    events = [e for e in response.text.split("\n\n") if e.startswith("event: status")]
+    assert len(events) == 2
+    assert looked_up == ["worker thread", "worker thread"]
+
+
+def test_backtest_stream_emits_final_status(monkeypatch):
+    """Test the SSE stream pushes the completed status and closes."""
+    import asyncio
+    import api.routes as routes_module
+
+    monkeypatch.setattr(routes_module, "_task_store", OrderedDict({
+        "running": {"status": "processing", "result": None, "error": None, "finished_at": None},
+    }))
+    done = asyncio.Event()
+    monkeypatch.setattr(routes_module, "_task_done", {"running": done})
+
+    async def fake_wait(task_id, timeout):
+        routes_module._task_store[task_id].update(status="failed", error="boom", finished_at=0.0)
+
+    monkeypatch.setattr(routes_module, "_wait_for_task", fake_wait)
+
+    response = client.get("/backtest/stream/running")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [e for e in response.text.split("\n\n") if e.startswith("event: status")]
+    assert len(events) == 2
+    assert '"status":"processing"' in events[0]
+    assert '"status":"failed"' in events[1]
+    assert '"error":"boom"' in events[1]
+
+
+def test_run_backtest_sync_reuses_backtest_service(mock_market_data_service):
+    """Test executor-side backtests reuse the shared service singleton."""
+    import api.routes as routes_module
+    from api.models import BacktestResponse
+    from services.backtest_service import BacktestService
+
+    routes_module._backtest_service = BacktestService(mock_market_data_service)
+
+    payload = routes_module._run_backtest_sync({"symbol": "TEST_SYM", "strategy": "RSIStrategy"})
+    assert BacktestResponse.model_validate_json(payload).symbol == "TEST_SYM"
+
+
+def test_backtest_service_singleton_created_once_across_threads(monkeypatch):
+    """Test concurrent first calls from worker threads share one service."""
+    import threading
+    import time as time_module
+    import api.routes as routes_module
+
+    class SlowService:
+        def __init__(self, market_data_service):
+            time_module.sleep(0.05)
+
+    monkeypatch.setattr(routes_module, "BacktestService", SlowService)
+    monkeypatch.setattr(routes_module, "_backtest_service", None)
+    monkeypatch.setattr(routes_module, "_market_data_service", object())
+
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(routes_module.get_backtest_service())) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(service) for service in seen}) == 1
+
+
+def test_backtest_async_runs_validated_request(mock_market_data_service, monkeypatch):
+    """Test in-process async backtests complete from the validated request."""
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+
+    monkeypatch.delenv("HERMES_REDIS_URL", raising=False)
+    routes_module._backtest_service = BacktestService(mock_market_data_service)
+
+    # One portal (event loop) for all requests so the background task survives
+    with TestClient(app) as session:
+        submitted = session.post("/backtest/async", json={"symbol": "TEST_SYM", "strategy": "RSIStrategy"})
+        task_id = submitted.json()["task_id"]
+        for _ in range(100):
+            status = session.get(f"/backtest/status/{task_id}").json()
+            if status["status"] != "processing":
+                break
+            time.sleep(0.05)
+    assert status["status"] == "completed"
+    assert status["result"]["symbol"] == "TEST_SYM"
+
+
+def test_update_storage_provider_swaps_services(monkeypatch, tmp_path):
+    """Test a successful switch installs a fresh, fully wired service chain."""
+    import api.routes as routes_module
+    monkeypatch.setenv("HERMES_STORAGE_PROVIDER", "local")
+    monkeypatch.setenv("HERMES_DATA_DIR", str(tmp_path))
+    old_service = routes_module.get_market_data_service()
+
+    response = client.post("/settings/storage", json={"provider": "local"})
+    assert response.status_code == 200
+    assert response.json()["instrument_count"] == 0
+    assert routes_module._market_data_service is not old_service
+    assert routes_module._backtest_service.market_data_service is routes_module._market_data_service
+    assert routes_module._scanner_service.backtest_service is routes_module._backtest_service
+
+
+def test_update_storage_provider_failure_keeps_services(monkeypatch):
+    """Test a failed switch reverts the provider and keeps existing services."""
+    import api.routes as routes_module
+    monkeypatch.setenv("HERMES_STORAGE_PROVIDER", "local")
+    existing = MagicMock()
+    routes_module._market_data_service = existing
+
+    def broken_service():
+        raise RuntimeError("no credentials")
+
+    monkeypatch.setattr(routes_module, "MarketDataService", broken_service)
+
+    response = client.post("/settings/storage", json={"provider": "cloudflare_r2"})
+    assert response.status_code == 500
+    assert "Reverted to local" in response.json()["detail"]
+    assert routes_module._market_data_service is existing
+    assert routes_module.os.environ["HERMES_STORAGE_PROVIDER"] == "local"
+
+
+def test_prune_task_store_caps_size(monkeypatch):
+    """Test the store is capped, evicting finished tasks before running ones."""
+    import api.routes as routes_module
+    monkeypatch.setattr(routes_module, "MAX_STORED_TASKS", 2)
+    monkeypatch.setattr(routes_module, "_task_store", OrderedDict({
+        "running-old": {"status": "processing", "finished_at": None},
+        "done-old": {"status": "completed", "finished_at": routes_module.time.time()},
+        "done-new": {"status": "completed", "finished_at": routes_module.time.time()},
+    }))
+    routes_module._prune_task_store()
+    assert list(routes_module._task_store) == ["running-old", "done-new"]
+
+
+def test_backtest_ndjson_stream(mock_market_data_service):
+    """Test the NDJSON stream carries the same data as /backtest in batches."""
+    import json
+    import api.routes as routes_module
+    from services.backtest_service import BacktestService
+
+    routes_module._backtest_service = BacktestService(mock_market_data_service)
+    payload = {"symbol": "TEST_SYM", "strategy": "RSIStrategy", "params": {"period": 5}, "timeframe": "1m"}
+    full = client.post("/backtest", json=payload).json()
+
+    response = client.post("/backtest/stream", json=payload)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert lines[0]["type"] == "meta"
+    assert lines[0]["metrics"] == full["metrics"]
+    assert lines[-1] == {"type": "end"}
+    candle_times = [t for line in lines if line["type"] == "candles" for t in line["time"]]
+    assert candle_times == full["candles"]["time"]
+    rsi = [line for line in lines if line["type"] == "indicator" and line["name"] == "rsi"]
+    assert rsi and rsi[0]["value"] == full["indicators"]["rsi"]["value"]
+
+
+def test_ndjson_batches_respect_chunk_size():
+    """Test long series are split into batches of at most chunk_points."""
+    import json
+    import api.routes as routes_module
+    from api.models import BacktestResponse, ChartSeries
+
+    result = BacktestResponse(
+        symbol="X", strategy="S", metrics={}, equity_curve=ChartSeries(time=list(range(5)), value=[1.0] * 5)
+    )
+    lines = [json.loads(line) for line in routes_module._iter_ndjson_backtest(result, chunk_points=2)]
+    equity = [line for line in lines if line["type"] == "equity"]
+    assert [len(line["time"]) for line in equity] == [2, 2, 1]
+
+
+def test_openapi_documents_market_data_schema():
+    """Test /data advertises MarketDataResponse (with CandlePoint) in OpenAPI."""
+    schema = client.get("/openapi.json").json()
+    ok = schema["paths"]["/data/{symbol}"]["get"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"]["$ref"].endswith("/MarketDataResponse")
+    assert set(schema["components"]["schemas"]["CandlePoint"]["properties"]) == {
+        "time", "open", "high", "low", "close", "volume"
+    }
@@ -26,6 +26,9 @@ class TestBacktestServiceEventMode:
         assert result.symbol == "TEST_SYM"
         assert "metrics" in result.model_dump()
         assert "equity_curve" in result.model_dump()
+        # Hourly candles line up with the hourly equity snapshots
+        assert result.candles.time and result.candles.time == result.equity_curve.time
+        assert all(t % 3600 == 0 for t in result.candles.time)
 
     def test_event_mode_with_signals(self, mock_market_data_service):
         """Test event mode generates signals."""
@@ -46,6 +49,61 @@ class TestBacktestServiceEventMode:
         # Event mode should complete and return response
         assert result.symbol == "TEST_SYM"
 
+    def test_event_mode_signals_match_fills(self, mock_market_data_service):
+        """Test event-mode signal markers are labelled from the fills log."""
+        from unittest.mock import patch
+        from services.backtest_service import BacktestService
+        from api.models import BacktestRequest
+        from engine.portfolio import PortfolioManager
+
+        portfolios = []
+        original_init = PortfolioManager.__init__
+
+        def capture_init(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+            portfolios.append(self)
+
+        service = BacktestService(mock_market_data_service)
+        request = BacktestRequest(
+            symbol="TEST_SYM",
+            strategy="RSIStrategy",
+            params={"period": 3, "oversold": 40, "overbought": 60},
+            mode="event",
+        )
+        with patch.object(PortfolioManager, "__init__", capture_init):
+            result = service.run_backtest(request)
+
+        log = portfolios[0].fills_log
+        assert log
+        assert result.signals.time == [int(f["time"]) for f in log]
+        assert result.signals.type == ["buy" if f["direction"] == "BUY" else "sell" for f in log]
+        assert result.signals.price == [f["price"] for f in log]
+
+    def test_event_mode_vectorizable_strategy(self, mock_market_data_service):
+        """Test vectorizable strategies run event mode through FastEventEngine."""
+        from unittest.mock import patch
+        from services.backtest_service import BacktestService
+        from api.models import BacktestRequest
+        from engine.event_engine import EventEngine
+
+        service = BacktestService(mock_market_data_service)
+        request = BacktestRequest(
+            symbol="TEST_SYM",
+            strategy="SMACrossover",
+            params={"fast_period": 3, "slow_period": 10},
+            mode="event",
+        )
+        with patch.object(EventEngine, "run") as bus_run:
+            result = service.run_backtest(request)
+
+        bus_run.assert_not_called()
+        # Hourly snapshots over 200 minutes starting 10:00
+        assert len(result.equity_curve.time) == 4
+        assert result.candles.time == result.equity_curve.time
+        stats = result.metrics["Execution Stats"]
+        assert stats["total_fills"] == len(result.signals.time) > 0
+        assert set(result.signals.type) <= {"buy", "sell"}
+
     def test_get_strategies(self, mock_market_data_service):
         """Test getting available strategies."""
         from services.backtest_service import BacktestService
@@ -57,6 +115,8 @@ class TestBacktestServiceEventMode:
         assert "MACDStrategy" in strategies
         assert "BollingerBandsStrategy" in strategies
         assert "SMACrossover" in strategies
+        # Discovery runs once per process and is shared across instances
+        assert BacktestService(mock_market_data_service).get_strategies() is strategies
 
     def test_backtest_data_load_error(self, mock_market_data_service):
         """Test backtest with data load failure."""
@@ -94,3 +154,206 @@ class TestBacktestServiceEventMode:
         
         with pytest.raises(ValueError, match="not found"):
             service.run_backtest(request)
+
+
+class TestBacktestServiceVectorOutput:
+    """Tests for the columnar chart payload built from Polars columns."""
+
+    def test_series_use_utc_epoch_seconds(self, mock_market_data_service, sample_ohlcv_df):
+        """Chart, equity and signal times are UTC epoch seconds of the bars."""
+        from datetime import timezone
+        from services.backtest_service import BacktestService
+        from api.models import BacktestRequest
+
+        service = BacktestService(mock_market_data_service)
+        result = service.run_backtest(
+            BacktestRequest(symbol="TEST_SYM", strategy="RSIStrategy", params={"period": 5}, timeframe="1m")
+        )
+
+        first_bar = sample_ohlcv_df["timestamp"][0].replace(tzinfo=timezone.utc)
+        hour_start = int(first_bar.replace(minute=0).timestamp())
+        assert result.candles.time[0] == hour_start
+        assert result.equity_curve.time == result.candles.time
+        assert all(isinstance(t, int) for t in result.candles.time)
+
+        bar_times = {int(ts.replace(tzinfo=timezone.utc).timestamp()) for ts in sample_ohlcv_df["timestamp"]}
+        assert set(result.signals.time) <= bar_times
+        assert len(result.signals.time) == len(result.signals.type) == len(result.signals.price)
+
+    def test_indicators_drop_null_points_per_column(self, mock_market_data_service):
+        """Each indicator keeps only its own non-null, non-NaN points, aligned to bar times."""
+        from datetime import datetime
+        import polars as pl
+        from services.backtest_service import BacktestService
+        from api.models import BacktestRequest
+
+        chart_df = pl.DataFrame({
+            "timestamp": [datetime(2024, 1, 1, h) for h in range(3)],
+            "open": [1.0] * 3, "high": [1.0] * 3, "low": [1.0] * 3, "close": [1.0] * 3,
+            "volume": [1.0] * 3, "equity": [100.0] * 3,
+            "rsi": [None, 40.0, 60.0],
+            "sma": [1.5, None, 2.5],
+            "ratio": [float("nan"), 0.5, None],
+            "signal": [0.0, 1.0, 0.0],
+        })
+        trades_df = pl.DataFrame(schema={"time": pl.Int64, "type": pl.Utf8, "price": pl.Float64})
+
+        response = BacktestService(mock_market_data_service)._format_response(
+            BacktestRequest(symbol="X", strategy="RSIStrategy"), {}, chart_df, trades_df
+        )
+
+        hour = 3600
+        base = 1704067200
+        assert set(response.indicators) == {"rsi", "sma", "ratio"}
+        assert response.indicators["rsi"].time == [base + hour, base + 2 * hour]
+        assert response.indicators["rsi"].value == [40.0, 60.0]
+        assert response.indicators["sma"].time == [base, base + 2 * hour]
+        assert response.indicators["sma"].value == [1.5, 2.5]
+        assert response.indicators["ratio"].time == [base + hour]
+        assert response.indicators["ratio"].value == [0.5]
+
+    def test_chart_frame_projects_rendered_columns(self, sample_ohlcv_df):
+        """Hourly chart frame matches resample_data on the rendered columns only."""
+        import polars as pl
+        from polars.testing import assert_frame_equal
+        from services.backtest_service import _chart_frame, _indicator_columns
+        from services.market_data_service import MarketDataService
+
+        result_df = sample_ohlcv_df.with_columns(
+            pl.col("close").rolling_mean(5).alias("sma"),
+            pl.col("close").alias("equity"),
+            pl.lit(1.0).alias("position"),
+            pl.lit(0.0).alias("market_return"),
+        )
+        indicator_cols = _indicator_columns(result_df.schema)
+        assert indicator_cols == ["sma"]
+
+        chart_df = _chart_frame(result_df.lazy(), indicator_cols).collect()
+        rendered = ["timestamp", "open", "high", "low", "close", "volume", "equity", "sma"]
+        assert chart_df.columns == rendered
+        expected = MarketDataService.resample_data(result_df, interval="1h").select(rendered)
+        assert_frame_equal(chart_df, expected)
+
+    def test_chart_frame_joins_coarse_indicators(self, sample_ohlcv_df):
+        """Indicators on the analysis grid chart like a minute-level forward fill."""
+        from datetime import datetime
+        import polars as pl
+        from polars.testing import assert_frame_equal
+        from services.backtest_service import _chart_frame
+
+        # 15m analysis bars starting 10:00; the first one has no value yet
+        indicators = pl.DataFrame({
+            "timestamp": [datetime(2023, 1, 1, 10 + q // 4, 15 * (q % 4)) for q in range(14)],
+            "sma": [None] + [float(q) for q in range(1, 14)],
+        })
+        result_df = sample_ohlcv_df.with_columns(pl.col("close").alias("equity"))
+
+        broadcast = result_df.join_asof(indicators, on="timestamp", strategy="backward")
+        expected = _chart_frame(broadcast.lazy(), ["sma"]).collect()
+        chart_df = _chart_frame(result_df.lazy(), ["sma"], indicators_lf=indicators.lazy()).collect()
+
+        assert_frame_equal(chart_df, expected)
+        assert chart_df["sma"].to_list() == [3.0, 7.0, 11.0, 13.0]
+
+    def test_unordered_strategy_output_caught_at_debug(self, mock_market_data_service, monkeypatch, caplog):
+        """Out-of-order analysis bars are reported when DEBUG logging is on."""
+        import logging
+        from api.models import BacktestRequest
+        from services.backtest_service import BacktestService
+        from strategies import STRATEGIES
+        from strategies.rsi import RSIStrategy
+
+        class ReversedRSI(RSIStrategy):
+            def generate_signals(self, df):
+                return super().generate_signals(df).reverse()
+
+        monkeypatch.setitem(STRATEGIES, "ReversedRSI", ReversedRSI)
+        request = BacktestRequest(symbol="TEST_SYM", strategy="ReversedRSI", params={"period": 2}, timeframe="15m")
+
+        caplog.set_level(logging.DEBUG)
+        with pytest.raises(ValueError, match="out of time order"):
+            BacktestService(mock_market_data_service).run_backtest(request)
+
+    def test_mtf_broadcast_narrows_integer_signal(self, mock_market_data_service, monkeypatch):
+        """The broadcast signal is narrowed; prices and indicators keep Float64."""
+        import polars as pl
+        from api.models import BacktestRequest
+        from engine.core import BacktestEngine
+        from services.backtest_service import BacktestService
+
+        seen = {}
+        original_run = BacktestEngine.run
+
+        def run(self, strategy, data):
+            seen["schema"] = data.schema
+            return original_run(self, strategy, data)
+
+        monkeypatch.setattr(BacktestEngine, "run", run)
+        BacktestService(mock_market_data_service).run_backtest(
+            BacktestRequest(symbol="TEST_SYM", strategy="RSIStrategy", params={"period": 2}, timeframe="15m")
+        )
+
+        assert seen["schema"]["signal"] == pl.Int8
+        assert seen["schema"]["close"] == pl.Float64
+        assert "rsi" not in seen["schema"]
+
+    def test_signals_reused_across_initial_cash(self, mock_market_data_service, monkeypatch):
+        """A sweep over initial cash runs the strategy once for a closed range."""
+        from api.models import BacktestRequest
+        from services.backtest_service import BacktestService
+        from strategies.rsi import RSIStrategy
+
+        calls = []
+        original = RSIStrategy.generate_signals
+
+        def generate_signals(self, df):
+            calls.append(df.height)
+            return original(self, df)
+
+        monkeypatch.setattr(RSIStrategy, "generate_signals", generate_signals)
+        service = BacktestService(mock_market_data_service)
+        base = dict(
+            symbol="TEST_SYM", strategy="RSIStrategy", params={"period": 5}, end_date="2023-12-31", timeframe="1m"
+        )
+
+        small = service.run_backtest(BacktestRequest(**base, initial_cash=1000.0))
+        large = service.run_backtest(BacktestRequest(**base, initial_cash=2000.0))
+
+        assert len(calls) == 1
+        assert service.signal_cache.stats()["hits"] == 1
+        assert large.signals == small.signals
+        assert large.equity_curve.value[-1] == pytest.approx(2 * small.equity_curve.value[-1])
+
+
+class TestBacktestServiceBatch:
+    """Tests for run_backtests_batch."""
+
+    def _requests(self):
+        from api.models import BacktestRequest
+
+        return [
+            BacktestRequest(symbol="TEST_SYM", strategy="RSIStrategy", params={"period": period})
+            for period in (5, 7, 9)
+        ]
+
+    def test_batch_in_process_matches_single_runs(self, mock_market_data_service):
+        from services.backtest_service import BacktestService
+
+        service = BacktestService(mock_market_data_service)
+        requests = self._requests()
+
+        results = service.run_backtests_batch(requests, max_workers=1)
+
+        assert [r.metrics for r in results] == [service.run_backtest(r).metrics for r in requests]
+
+    def test_batch_process_pool_preserves_order(self, mock_market_data_service, monkeypatch):
+        from services.backtest_service import BacktestService
+
+        # Workers must use the service's own data config, not the environment
+        monkeypatch.setenv("HERMES_DATA_DIR", "/nonexistent")
+        service = BacktestService(mock_market_data_service)
+        requests = self._requests()
+
+        results = service.run_backtests_batch(requests, max_workers=2)
+
+        assert [r.metrics for r in results] == [service.run_backtest(r).metrics for r in requests]
@@ -49,6 +49,35 @@ def test_engine_run(engine, sample_ohlcv_df):
     last_equity = result_df["equity"][-1]
     assert last_equity > 0
 
+def test_engine_run_matches_stepwise_returns(engine):
+    """Fused columns equal the step-by-step definitions, including bad prices."""
+    data = pl.DataFrame({
+        "close": [100.0, 101.0, 99.0, 102.0, 0.0, 0.0],
+        "signal": [1, 0, 1, 1, 1, 0],
+    })
+    result_df = engine.run(BuyAndHoldStrategy(), data)
+
+    close = data["close"].to_list()
+    signal = data["signal"].to_list()
+    equity = 10000.0
+    for i in range(len(close)):
+        market = 0.0 if i == 0 or close[i - 1] == 0 else close[i] / close[i - 1] - 1
+        position = 0 if i == 0 else signal[i - 1]
+        equity *= 1 + position * market
+        assert result_df["market_return"][i] == pytest.approx(market)
+        assert result_df["position"][i] == position
+        assert result_df["equity"][i] == pytest.approx(equity)
+
+def test_engine_run_float32_prices_compound_in_float64(engine):
+    data = pl.DataFrame({
+        "close": [100.0, 101.0, 99.5, 102.25],
+        "signal": [1, 1, 1, 1],
+    }).with_columns(pl.col("close").cast(pl.Float32))
+    result_df = engine.run(BuyAndHoldStrategy(), data)
+
+    assert result_df.schema["equity"] == pl.Float64
+    assert result_df["equity"][-1] == pytest.approx(10000.0 * 102.25 / 100.0)
+
 def test_metrics_calculation(engine):
     # Mock result DF
     # Equity: 100, 110, 99, 120
@@ -75,6 +104,11 @@ def test_metrics_calculation(engine):
     # 12k -> 0
     assert metrics["Max Drawdown"] == "-10.00%"
 
+    # Sharpe: sample mean/std of strategy_return, annualized over 252 * 375 bars
+    returns = df["strategy_return"]
+    expected_sharpe = returns.mean() / returns.std() * (252 * 375) ** 0.5
+    assert metrics["Sharpe Ratio"] == f"{expected_sharpe:.2f}"
+
 def test_engine_validation_error(engine, sample_ohlcv_df):
     class BadStrategy(Strategy):
         def generate_signals(self, df):
@@ -83,3 +117,11 @@ def test_engine_validation_error(engine, sample_ohlcv_df):
     strat = BadStrategy()
     with pytest.raises(ValueError, match="Strategy must output a DataFrame with a 'signal' column"):
         engine.run(strat, sample_ohlcv_df)
+
+def test_event_only_strategy_has_no_vectorized_mode(engine, sample_ohlcv_df):
+    class EventOnlyStrategy(Strategy):
+        def on_bar(self, event):
+            pass
+
+    with pytest.raises(NotImplementedError, match="EventOnlyStrategy"):
+        engine.run(EventOnlyStrategy(), sample_ohlcv_df)
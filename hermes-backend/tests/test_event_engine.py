@@ -1,8 +1,9 @@
 from engine.event_bus import EventBus
 from engine.event_engine import EventEngine
-from engine.events import MarketEvent
+from engine.events import FillEvent, MarketEvent
 from engine.strategy import Strategy
 from unittest.mock import MagicMock
+import pytest
 
 class MockStrategy(Strategy):
     def generate_signals(self, df):
@@ -24,6 +25,50 @@ def test_event_bus_publish_subscribe():
     
     mock_listener.assert_called_once_with(event)
 
+def test_event_bus_process_all_drains_in_fifo_order():
+    bus = EventBus()
+    seen = []
+
+    def on_market(event):
+        seen.append(event.time)
+        # Events published by a listener are processed in the same drain
+        if event.time == 1:
+            bus.publish(MarketEvent(time=3, symbol="TEST", open=10, high=11, low=9, close=10, volume=100))
+
+    bus.subscribe(MarketEvent, on_market)
+    for t in (1, 2):
+        bus.publish(MarketEvent(time=t, symbol="TEST", open=10, high=11, low=9, close=10, volume=100))
+
+    bus.process_all()
+
+    assert seen == [1, 2, 3]
+    assert bus.process_next() is False
+
+def test_event_bus_ignores_unsubscribed_event_types():
+    bus = EventBus()
+    bus.subscribe(MarketEvent, MagicMock())
+
+    bus.publish(FillEvent(time=1, symbol="TEST", exchange="X", quantity=1, direction="BUY", fill_cost=10.0))
+
+    assert bus.process_next() is True
+    # Dispatch looks listeners up without creating empty entries
+    assert FillEvent not in bus._listeners
+
+def test_event_bus_dispatch_bypasses_queue():
+    bus = EventBus()
+    fills = []
+    fill = FillEvent(time=1, symbol="TEST", exchange="X", quantity=1, direction="BUY", fill_cost=10.0)
+    bus.subscribe(MarketEvent, lambda event: bus.publish(fill))
+    bus.subscribe(FillEvent, fills.append)
+
+    bus.dispatch(MarketEvent(time=1, symbol="TEST", open=10, high=11, low=9, close=10, volume=100))
+
+    # The market event was delivered directly; its follow-up waits in the queue
+    assert fills == []
+    bus.process_all()
+    assert fills == [fill]
+    assert bus.process_next() is False
+
 def test_event_engine_flow():
     engine = EventEngine()
     strategy = MockStrategy()
@@ -42,3 +87,85 @@ def test_event_engine_flow():
     engine.run(data_gen())
     
     assert strategy.on_bar.call_count == 2
+
+def test_volume_aware_slippage_direction_and_bar_bounds():
+    from engine.execution import VolumeAwareExecutionHandler
+
+    handler = VolumeAwareExecutionHandler(EventBus(), slippage=0.01)
+    handler.on_bar(MarketEvent(time=1, symbol="A", open=100, high=100.5, low=99.0, close=100, volume=400))
+
+    # sqrt(100 / 400) * 1% = 0.5% impact, signed by direction
+    assert handler._calculate_slippage(100.0, 100, "BUY") == pytest.approx(100.5)
+    assert handler._calculate_slippage(100.0, 100, "SELL") == pytest.approx(99.5)
+    # Large orders are clamped to the bar's high/low
+    assert handler._calculate_slippage(100.0, 400, "BUY") == 100.5
+    assert handler._calculate_slippage(100.0, 10000, "SELL") == 99.0
+
+    # Unknown high/low (0) leaves the price unbounded
+    handler.on_bar(MarketEvent(time=2, symbol="A", open=100, high=0, low=0, close=100, volume=0))
+    assert handler._calculate_slippage(100.0, 5, "BUY") == pytest.approx(101.0)
+    assert handler._calculate_slippage(100.0, 5, "SELL") == pytest.approx(99.0)
+
+def test_events_are_slotted():
+    fill = FillEvent(time=1, symbol="A", exchange="X", quantity=1.0, direction="BUY", fill_cost=10.0)
+
+    assert not hasattr(fill, "__dict__")
+    with pytest.raises(AttributeError):
+        fill.unknown = 1
+
+def test_volume_aware_fill_quantity_specialization():
+    from engine.execution import VolumeAwareExecutionHandler
+
+    bar = MarketEvent(time=1, symbol="A", open=100, high=101, low=99, close=100, volume=500)
+
+    capped = VolumeAwareExecutionHandler(EventBus(), max_participation_rate=0.1)
+    capped.on_bar(bar)
+    assert capped._calculate_fill_quantity(80) == 50
+    assert capped._calculate_fill_quantity(20) == 20
+
+    full = VolumeAwareExecutionHandler(EventBus(), max_participation_rate=1.0)
+    full.on_bar(bar)
+    assert full._calculate_fill_quantity(10000) == 500
+    assert full._calculate_fill_quantity(80) == 80
+
+    # Changing the rate rebuilds the specialized calculator
+    capped.max_participation_rate = 1.0
+    assert capped._calculate_fill_quantity(80) == 80
+    capped.max_participation_rate = 0.02
+    assert capped._calculate_fill_quantity(80) == 10
+
+def test_event_bus_unsubscribe():
+    bus = EventBus()
+    first, second = MagicMock(), MagicMock()
+    bus.subscribe(MarketEvent, first)
+    bus.subscribe(MarketEvent, second)
+
+    bus.unsubscribe(MarketEvent, first)
+    bus.dispatch(MarketEvent(time=1, symbol="TEST", open=10, high=11, low=9, close=10, volume=100))
+
+    first.assert_not_called()
+    second.assert_called_once()
+    bus.unsubscribe(MarketEvent, second)
+    assert MarketEvent not in bus._listeners
+
+def test_event_bus_batched_publish_and_dispatch():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(MarketEvent, lambda e: seen.append(("bar", e.time)))
+    bus.subscribe(FillEvent, lambda e: seen.append(("fill", e.time)))
+
+    def bar(t):
+        return MarketEvent(time=t, symbol="TEST", open=10, high=11, low=9, close=10, volume=100)
+
+    def fill(t):
+        return FillEvent(time=t, symbol="TEST", exchange="X", quantity=1, direction="BUY", fill_cost=10.0)
+
+    # Mixed batches keep their order across type runs
+    bus.dispatch_many([bar(1), bar(2), fill(3), bar(4)])
+    assert seen == [("bar", 1), ("bar", 2), ("fill", 3), ("bar", 4)]
+
+    seen.clear()
+    bus.publish_many([fill(5), bar(6)])
+    assert seen == []
+    bus.process_all()
+    assert seen == [("fill", 5), ("bar", 6)]
@@ -0,0 +1,90 @@
+"""Tests for the array-based FastEventEngine."""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from engine.event_engine import EventEngine
+from engine.events import MarketEvent, SignalEvent
+from engine.execution import VolumeAwareExecutionHandler
+from engine.fast_event_engine import FastEventEngine
+from engine.portfolio import PortfolioManager, RiskParams
+from engine.strategy import Strategy
+
+
+class ReplaySignalStrategy(Strategy):
+    """Publishes LONG/EXIT on transitions of a precomputed signal list."""
+
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = iter(signals)
+        self.prev = 0
+
+    def generate_signals(self, df):
+        return df
+
+    def on_bar(self, event: MarketEvent):
+        assert self.bus is not None, "strategy must be attached to a bus"
+        current = next(self.signals)
+        if current > 0 and self.prev <= 0:
+            self.bus.publish(SignalEvent(time=event.time, symbol=event.symbol, signal_type="LONG"))
+        elif current <= 0 and self.prev > 0:
+            self.bus.publish(SignalEvent(time=event.time, symbol=event.symbol, signal_type="EXIT"))
+        self.prev = current
+
+
+def _bars(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    signal = (np.sin(np.arange(n) / 9.0) > 0.2).astype(int)
+    return pl.DataFrame({
+        "timestamp": np.arange(n, dtype=np.int64) * 60,
+        "open": close,
+        "high": close * 1.004,
+        "low": close * 0.996,
+        "close": close,
+        "volume": rng.integers(0, 3000, n).astype(float),
+        "signal": signal,
+    })
+
+
+def _run_event_engine(df, risk_params, slippage, commission):
+    engine = EventEngine()
+    strategy = ReplaySignalStrategy(df["signal"].to_list())
+    strategy.set_bus(engine.bus)
+    engine.register_strategy(strategy)
+    portfolio = PortfolioManager(bus=engine.bus, initial_cash=100000.0, risk_params=risk_params)
+    VolumeAwareExecutionHandler(bus=engine.bus, slippage=slippage, commission=commission)
+
+    equity = []
+
+    def bars():
+        for ts, o, h, lo, c, v in df.select("timestamp", "open", "high", "low", "close", "volume").iter_rows():
+            yield MarketEvent(time=ts, symbol="SYM", open=o, high=h, low=lo, close=c, volume=v)
+            equity.append(portfolio.equity)
+
+    engine.run(bars())
+    return portfolio.fills_log, equity
+
+
+@pytest.mark.parametrize("sizing", ["fixed", "pct_equity", "atr_based"])
+def test_fast_engine_matches_event_engine(sizing):
+    df = _bars()
+    risk_params = RiskParams(sizing_method=sizing, fixed_quantity=50, stop_loss_pct=0.01)
+
+    fills_log, equity = _run_event_engine(df, risk_params, slippage=0.002, commission=0.01)
+    result = FastEventEngine(
+        initial_cash=100000.0, risk_params=risk_params, slippage=0.002, commission=0.01
+    ).run(df)
+
+    assert len(fills_log) > 2
+    assert result.fills["timestamp"].to_list() == [f["time"] for f in fills_log]
+    assert result.fills["direction"].to_list() == [f["direction"] for f in fills_log]
+    assert result.fills["quantity"].to_list() == pytest.approx([f["quantity"] for f in fills_log])
+    assert result.fills["price"].to_list() == pytest.approx([f["price"] for f in fills_log])
+    assert result.equity["equity"].to_list() == pytest.approx(equity)
+
+
+def test_fast_engine_requires_signal_column():
+    with pytest.raises(ValueError, match="signal"):
+        FastEventEngine().run(_bars().drop("signal"))
@@ -81,3 +81,54 @@ def test_loader_date_filtering(temp_data_dir):
     assert len(res2) == 2
     assert res2["timestamp"][-1].date() == datetime(2023, 1, 2).date()
 
+
+def test_loader_iter_market_events_merges_symbols(temp_data_dir):
+    for symbol, hours in (("BBB", [0, 2, 4]), ("AAA", [0, 1, 4])):
+        pl.DataFrame({
+            "timestamp": [datetime(2023, 1, 1, h) for h in hours],
+            "open": [10.0] * 3,
+            "high": [12.0] * 3,
+            "low": [9.0] * 3,
+            "close": [11.0] * 3,
+            "volume": [100, 200, 300],
+        }).write_parquet(os.path.join(temp_data_dir, f"{symbol}.parquet"))
+
+    loader = DataLoader(data_dir=temp_data_dir)
+    events = list(loader.iter_market_events(["BBB", "AAA", "MISSING"]))
+
+    assert [(e.time, e.symbol) for e in events] == [
+        (t, s) for t, s in loader.load_data(["BBB", "AAA"]).select(
+            pl.col("timestamp").dt.epoch("s"), "symbol"
+        ).iter_rows()
+    ]
+    assert [e.symbol for e in events[:3]] == ["AAA", "BBB", "AAA"]
+    assert events[0].volume == 100.0
+
+def test_loader_iter_market_events_no_files(temp_data_dir):
+    loader = DataLoader(data_dir=temp_data_dir)
+    assert list(loader.iter_market_events(["MISSING"])) == []
+
+def test_loader_date_range_pushed_into_scan(temp_data_dir):
+    pl.DataFrame({
+        "timestamp": pl.datetime_range(
+            datetime(2023, 1, 1), datetime(2023, 1, 5), "1h", eager=True, time_zone="Asia/Kolkata"
+        ),
+        "open": 10.0,
+        "high": 12.0,
+        "low": 9.0,
+        "close": 11.0,
+    }).write_parquet(os.path.join(temp_data_dir, "TZ.parquet"), row_group_size=24)
+
+    loader = DataLoader(data_dir=temp_data_dir)
+    df = loader.load_data(["TZ"], start_date="2023-01-02", end_date="2023-01-03")
+
+    # Bounds are wall-clock times in the file's zone
+    assert df["timestamp"].min() == datetime(2023, 1, 2)
+    assert df["timestamp"].max() == datetime(2023, 1, 3)
+    assert len(df) == 25
+
+    plan = loader._scan(
+        [os.path.join(temp_data_dir, "TZ.parquet")], datetime(2023, 1, 2), datetime(2023, 1, 3)
+    ).explain()
+    selection = next(line for line in plan.splitlines() if "SELECTION" in line)
+    assert 'col("timestamp").is_between' in selection
@@ -0,0 +1,67 @@
+"""Tests for MarketDataService caching."""
+
+from unittest.mock import MagicMock
+
+
+def test_list_instruments_is_cached(mock_market_data_service, monkeypatch):
+    """Repeated calls within the TTL hit the cache, not storage."""
+    spy = MagicMock(wraps=mock_market_data_service.data_service.list_instruments)
+    monkeypatch.setattr(mock_market_data_service.data_service, "list_instruments", spy)
+
+    first = mock_market_data_service.list_instruments()
+    second = mock_market_data_service.list_instruments()
+    assert first == second == ["TEST_SYM"]
+    assert spy.call_count == 1
+
+    mock_market_data_service.invalidate_cache()
+    mock_market_data_service.list_instruments()
+    assert spy.call_count == 2
+
+
+def test_list_instruments_failure_not_cached(mock_market_data_service, monkeypatch):
+    """A storage error returns [] without poisoning the cache."""
+    failing = MagicMock(side_effect=OSError("unreachable"))
+    monkeypatch.setattr(mock_market_data_service.data_service, "list_instruments", failing)
+    assert mock_market_data_service.list_instruments() == []
+
+    monkeypatch.setattr(mock_market_data_service.data_service, "list_instruments", lambda: ["A"])
+    assert mock_market_data_service.list_instruments() == ["A"]
+
+
+def test_get_candles_is_cached(mock_market_data_service, monkeypatch):
+    """Candles for the same symbol/timeframe are reused within the TTL."""
+    spy = MagicMock(wraps=mock_market_data_service.load_and_resample)
+    monkeypatch.setattr(mock_market_data_service, "load_and_resample", spy)
+
+    first = mock_market_data_service.get_candles("TEST_SYM", "1h")
+    second = mock_market_data_service.get_candles("test_sym", "1h")
+    assert first == second
+    assert spy.call_count == 1
+    # Loads use the same normalized symbol as the cache key
+    spy.assert_called_once_with("TEST_SYM", "1h")
+
+    # Callers get their own list; mutating it does not touch the cache
+    second.clear()
+    assert mock_market_data_service.get_candles("TEST_SYM", "1h") == first
+    assert spy.call_count == 1
+
+    mock_market_data_service.get_candles("TEST_SYM", "5m")
+    assert spy.call_count == 2
+
+
+def test_get_candles_cache_is_thread_safe(mock_market_data_service, monkeypatch):
+    """Concurrent loads that evict entries neither raise nor overfill the cache."""
+    from concurrent.futures import ThreadPoolExecutor
+    import services.market_data_service as mds
+
+    monkeypatch.setattr(mds, "CANDLES_CACHE_MAX_ENTRIES", 2)
+    timeframes = ["1m", "5m", "15m", "30m", "1h", "4h"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(
+            lambda i: mock_market_data_service.get_candles("TEST_SYM", timeframes[i % len(timeframes)]),
+            range(48),
+        ))
+
+    assert all(results)
+    assert len(mock_market_data_service._candles_cache) <= 2
@@ -0,0 +1,51 @@
+"""Tests for MetricsService."""
+
+import polars as pl
+
+from services.metrics_service import MetricsService
+
+
+def test_drawdown_and_return_from_equity_curve():
+    """Max drawdown is measured from the running peak."""
+    metrics = MetricsService.calculate_metrics([10000.0, 11000.0, 9900.0, 12000.0], 10000.0)
+
+    assert metrics["Total Return"] == "20.00%"
+    assert metrics["Max Drawdown"] == "-10.00%"
+    assert metrics["Final Equity"] == "12000.00"
+    assert metrics["Total Trades"] == "0"
+
+
+def test_list_and_series_inputs_agree():
+    """A plain list and a Polars Series produce identical metrics."""
+    curve = [100.0, 101.0, 100.5, 102.0, 101.0, 103.5]
+
+    assert MetricsService.calculate_metrics(curve, 100.0) == MetricsService.calculate_metrics(
+        pl.Series("equity", curve), 100.0
+    )
+
+
+def test_flat_or_short_curves_have_zero_sharpe():
+    """Sharpe is 0 when returns have no spread or there are too few of them."""
+    assert MetricsService.calculate_metrics([100.0, 100.0, 100.0], 100.0)["Sharpe Ratio"] == "0.00"
+    assert MetricsService.calculate_metrics([100.0, 110.0], 100.0)["Sharpe Ratio"] == "0.00"
+    assert MetricsService.calculate_metrics([100.0], 100.0)["Max Drawdown"] == "0.00%"
+
+
+def test_trade_metrics_pair_buys_with_sells():
+    """Round trips pair the i-th BUY with the i-th SELL; dicts and frames agree."""
+    fills = [
+        {"direction": "BUY", "price": 100.0, "quantity": 10.0},
+        {"direction": "SELL", "price": 110.0, "quantity": 10.0},
+        {"direction": "BUY", "price": 105.0, "quantity": 20.0},
+        {"direction": "SELL", "price": 100.0, "quantity": 20.0},
+        {"direction": "BUY", "price": 90.0, "quantity": 5.0},
+    ]
+    curve = [10000.0, 10100.0, 10000.0]
+
+    metrics = MetricsService.calculate_metrics(curve, 10000.0, fills=fills)
+
+    assert metrics["Total Trades"] == "2"
+    assert metrics["Win Rate"] == "50.0%"
+    assert metrics["Profit Factor"] == "1.00"
+    assert metrics["Max Capital at Risk"] == "21.0%"
+    assert MetricsService.calculate_metrics(curve, 10000.0, fills=pl.DataFrame(fills)) == metrics
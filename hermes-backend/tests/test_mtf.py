@@ -35,3 +35,56 @@ def test_mtf_strategy(sample_ohlcv_df):
     # default RSI period 14. Data is 5 rows. RSI will be null.
     
     pass
+
+def test_merge_mtf_matches_join_asof():
+    from datetime import datetime, timedelta
+    from engine.mtf_utils import merge_mtf
+
+    minute_df = pl.DataFrame({
+        "timestamp": [datetime(2023, 1, 1) + timedelta(minutes=7 * i) for i in range(600)][::-1],
+        "close": [float(i) for i in range(600)],
+    })
+    daily_df = pl.DataFrame({
+        "timestamp": [datetime(2023, 1, 1, 5) + timedelta(days=i) for i in range(3)],
+        "bullish_trend": [True, False, True],
+    })
+
+    merged = merge_mtf(minute_df, daily_df, suffix="_htf")
+    expected = minute_df.sort("timestamp").join_asof(
+        daily_df.rename({"bullish_trend": "bullish_trend_htf"}),
+        on="timestamp",
+        strategy="backward",
+    )
+
+    assert merged.equals(expected)
+    # Minutes before the first daily bar have no HTF value (no lookahead)
+    assert merged["bullish_trend_htf"][0] is None
+
+def test_merge_mtf_unsorted_htf():
+    from datetime import datetime
+    from engine.mtf_utils import merge_mtf
+
+    minute_df = pl.DataFrame({
+        "timestamp": [datetime(2023, 1, 1, 12), datetime(2023, 1, 2, 12)],
+    })
+    daily_df = pl.DataFrame({
+        "timestamp": [datetime(2023, 1, 2), datetime(2023, 1, 1)],
+        "close": [2.0, 1.0],
+    })
+
+    merged = merge_mtf(minute_df, daily_df, suffix="_d")
+
+    assert merged.columns == ["timestamp", "close_d"]
+    assert merged["close_d"].to_list() == [1.0, 2.0]
+
+def test_mtf_lazy_frames_stay_lazy(sample_ohlcv_df):
+    from engine.mtf_utils import merge_mtf, resample_data
+
+    daily = resample_data(sample_ohlcv_df.lazy(), interval="1d")
+    assert isinstance(daily, pl.LazyFrame)
+
+    merged = merge_mtf(sample_ohlcv_df.lazy(), daily.select(["timestamp", "close"]))
+    assert isinstance(merged, pl.LazyFrame)
+
+    eager = merge_mtf(sample_ohlcv_df, resample_data(sample_ohlcv_df).select(["timestamp", "close"]))
+    assert merged.collect().equals(eager)
@@ -1,3 +1,4 @@
+import pytest
 
 from engine.portfolio import PortfolioManager
 from engine.event_bus import EventBus
@@ -18,3 +19,151 @@ def test_portfolio_manager_basic():
     portfolio.on_signal(signal)
     
     assert portfolio.cash == 100000.0  # Cash drops on fill, not signal
+
+def test_portfolio_manager_batched_stop_loss():
+    import numpy as np
+    from engine.events import FillEvent, MarketBatchEvent, OrderEvent
+    from engine.portfolio import RiskParams
+
+    bus = EventBus()
+    portfolio = PortfolioManager(bus=bus, initial_cash=100000.0, risk_params=RiskParams(stop_loss_pct=0.05))
+    ids = portfolio.register_universe(["AAA", "BBB", "CCC"])
+
+    for symbol in ("AAA", "BBB"):
+        portfolio.on_fill(FillEvent(
+            time=1, symbol=symbol, exchange="X", quantity=10.0, direction="BUY", fill_cost=100.0, commission=0.0
+        ))
+
+    orders = []
+    bus.subscribe(OrderEvent, orders.append)
+    bus.dispatch(MarketBatchEvent(
+        time=2,
+        symbols=["AAA", "BBB", "CCC"],
+        symbol_ids=np.array([ids["AAA"], ids["BBB"], ids["CCC"]]),
+        close=np.array([90.0, 99.0, 50.0]),
+    ))
+    bus.process_all()
+
+    # Only AAA breaches the 5% stop; CCC has no position
+    assert [(o.symbol, o.direction, o.quantity) for o in orders] == [("AAA", "SELL", 10.0)]
+    assert portfolio.last_prices == {"AAA": 90.0, "BBB": 99.0, "CCC": 50.0}
+
+def test_portfolio_manager_position_arrays_grow():
+    from engine.events import FillEvent, MarketEvent
+
+    portfolio = PortfolioManager(bus=EventBus(), initial_cash=100000.0)
+    symbols = [f"S{i}" for i in range(20)]
+    for symbol in symbols:
+        portfolio.on_fill(FillEvent(
+            time=1, symbol=symbol, exchange="X", quantity=2.0, direction="BUY", fill_cost=50.0, commission=1.0
+        ))
+
+    # No bar yet: positions are valued at their entry price
+    assert portfolio.equity == pytest.approx(100000.0 - 20 * 1.0)
+
+    portfolio.on_bar(MarketEvent(time=2, symbol="S19", open=60, high=60, low=60, close=60.0, volume=1))
+    assert portfolio.equity == pytest.approx(100000.0 - 20 * 1.0 + 2 * 10.0)
+
+    position = portfolio.positions["S19"]
+    assert (position.quantity, position.avg_entry_price, position.total_cost) == (2.0, 50.0, 101.0)
+    assert portfolio.last_prices == {"S19": 60.0}
+
+def test_portfolio_manager_fill_buffer_grows():
+    from engine.events import FillEvent
+    from engine.portfolio import FillBuffer
+
+    portfolio = PortfolioManager(bus=EventBus(), initial_cash=100000.0)
+    portfolio._fills = FillBuffer(capacity=2)
+    for t, (symbol, direction) in enumerate([("A", "BUY"), ("B", "BUY"), ("A", "SELL")]):
+        portfolio.on_fill(FillEvent(
+            time=t, symbol=symbol, exchange="X", quantity=1.0, direction=direction, fill_cost=10.0, commission=0.5
+        ))
+
+    fills = portfolio.fills
+    assert fills["symbol"].to_list() == ["A", "B", "A"]
+    assert fills["direction"].to_list() == ["BUY", "BUY", "SELL"]
+    assert fills["cash_after"].to_list() == [99989.5, 99979.0, 99988.5]
+    log = portfolio.fills_log
+    assert log[2] == {
+        "time": 2, "symbol": "A", "direction": "SELL", "quantity": 1.0, "price": 10.0,
+        "commission": 0.5, "cash_after": 99988.5, "equity_after": 99998.5,
+    }
+    assert portfolio.fills_log is log
+
+    portfolio.on_fill(FillEvent(
+        time=3, symbol="B", exchange="X", quantity=1.0, direction="SELL", fill_cost=10.0, commission=0.5
+    ))
+    assert portfolio.fills_log is log
+    assert [f["time"] for f in log] == [0, 1, 2, 3]
+    assert log[3]["symbol"] == "B"
+
+def test_portfolio_kernels():
+    import numpy as np
+    from engine._portfolio_kernels import calc_qty_atr, calc_qty_pct_equity, check_stop, stop_mask
+
+    assert calc_qty_pct_equity(100000.0, 50.0, 0.02) == 40.0
+    assert calc_qty_pct_equity(100000.0, 0.0, 0.02) == 1.0
+    assert calc_qty_atr(100000.0, 0.02, 50.0, 0.05) == 800.0
+    assert check_stop(94.0, 100.0, 0.05)
+    assert not check_stop(96.0, 100.0, 0.05)
+
+    mask = stop_mask(
+        np.array([94.0, 94.0, 94.0, 10.0]),
+        np.array([100.0, 100.0, 0.0, 100.0]),
+        np.array([5.0, 0.0, 5.0, 1.0]),
+        0.05,
+    )
+    assert mask.tolist() == [True, False, False, True]
+
+def test_portfolio_manager_incremental_equity_matches_recompute():
+    import numpy as np
+    from engine.events import FillEvent, MarketBatchEvent, MarketEvent
+
+    rng = np.random.default_rng(3)
+    portfolio = PortfolioManager(bus=EventBus(), initial_cash=100000.0)
+    ids = portfolio.register_universe(["A", "B", "C"])
+    symbols = list(ids)
+
+    for t in range(300):
+        symbol = symbols[rng.integers(3)]
+        price = float(rng.uniform(50, 150))
+        kind = rng.integers(4)
+        if kind == 0:
+            portfolio.on_fill(FillEvent(
+                time=t, symbol=symbol, exchange="X", quantity=float(rng.integers(1, 5)),
+                direction="BUY" if rng.random() < 0.6 else "SELL", fill_cost=price, commission=0.1,
+            ))
+        elif kind == 1:
+            portfolio.on_bar(MarketEvent(
+                time=t, symbol=symbol, open=price, high=price, low=price, close=price, volume=1,
+            ))
+        else:
+            portfolio.on_bars(MarketBatchEvent(
+                time=t, symbols=symbols, symbol_ids=np.array([ids[s] for s in symbols]),
+                close=rng.uniform(50, 150, 3),
+            ))
+        # The incremental market value must not drift from a full recompute
+        assert portfolio._market_value == pytest.approx(portfolio._recompute_market_value(), rel=1e-9, abs=1e-6)
+        portfolio.snapshot(t)
+
+    assert portfolio.equity == pytest.approx(portfolio.cash + portfolio._recompute_market_value())
+
+@pytest.mark.parametrize("method, expected", [
+    ("fixed", 7.0),
+    ("pct_equity", 100000.0 * 0.1 / 50.0),
+    ("atr_based", 100000.0 * 0.1 / (50.0 * 0.02)),
+    ("unknown", 7.0),
+])
+def test_portfolio_manager_sizing_bound_at_init(method, expected):
+    from engine.portfolio import RiskParams
+
+    risk_params = RiskParams(sizing_method=method, fixed_quantity=7.0, pct_equity=0.1, stop_loss_pct=0.02)
+    portfolio = PortfolioManager(bus=EventBus(), risk_params=risk_params)
+
+    assert portfolio._size_fn(50.0) == pytest.approx(expected)
+
+def test_portfolio_dataclasses_are_slotted():
+    from engine.portfolio import Position, RiskParams
+
+    for obj in (RiskParams(), Position(symbol="TEST")):
+        assert not hasattr(obj, "__dict__")
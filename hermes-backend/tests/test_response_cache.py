@@ -0,0 +1,46 @@
+"""Tests for the serialized response cache."""
+
+from api.models import ScanRequest
+from services.response_cache import ResponseCache, request_cache_key
+
+
+def test_cache_key_is_stable_and_namespaced():
+    a = ScanRequest(strategy="RSIStrategy", params={"period": 14, "upper": 70}, end_date="2023-12-31")
+    b = ScanRequest(strategy="RSIStrategy", params={"upper": 70, "period": 14}, end_date="2023-12-31")
+    assert request_cache_key("scan", a) is not None
+    assert request_cache_key("scan", a) == request_cache_key("scan", b)
+    assert request_cache_key("scan", a) != request_cache_key("backtest", a)
+
+
+def test_open_date_range_has_no_cache_key():
+    assert request_cache_key("scan", ScanRequest(strategy="RSIStrategy")) is None
+    future = ScanRequest(strategy="RSIStrategy", end_date="2999-01-01")
+    assert request_cache_key("scan", future) is None
+
+
+def test_lru_eviction_by_entries():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"  # "a" becomes most recent
+    cache.put("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+def test_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"x" * 6)
+    cache.put("b", b"y" * 6)
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 6
+    cache.put("huge", b"z" * 11)
+    assert cache.get("huge") is None
+
+
+def test_ttl_expiry():
+    cache = ResponseCache(ttl_seconds=-1)
+    cache.put("a", b"1")
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
@@ -7,7 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from main import app
-from api.models import ScanRequest, BacktestResponse, ChartPoint, SignalPoint
+from api.models import ScanRequest, BacktestResponse, ChartSeries, SignalSeries
 
 client = TestClient(app)
 
@@ -31,12 +31,8 @@ def _make_mock_response(symbol: str, total_return: str = "5.00%") -> BacktestRes
         symbol=symbol,
         strategy="RSIStrategy",
         metrics={"Total Return": total_return, "Sharpe Ratio": "1.5", "Max Drawdown": "-3.00%"},
-        equity_curve=[ChartPoint(time=1000, value=100000), ChartPoint(time=2000, value=105000)],
-        signals=[
-            SignalPoint(time=1500, type="buy", price=100.0),
-            SignalPoint(time=1800, type="sell", price=105.0),
-        ],
-        candles=[],
+        equity_curve=ChartSeries(time=[1000, 2000], value=[100000, 105000]),
+        signals=SignalSeries(time=[1500, 1800], type=["buy", "sell"], price=[100.0, 105.0]),
     )
 
 
@@ -62,6 +58,18 @@ class TestScannerService:
         assert result.results[0].status == "success"
         assert result.elapsed_ms >= 0
 
+    def test_scan_strategy_name_is_case_insensitive(self, mock_market_data_service):
+        """Lower-cased strategy names resolve to the registered spelling."""
+        from services.backtest_service import BacktestService
+        from services.scanner_service import ScannerService
+
+        scanner = ScannerService(BacktestService(mock_market_data_service))
+
+        result = asyncio.run(scanner.scan(ScanRequest(strategy="rsistrategy", symbols=["TEST_SYM"])))
+
+        assert result.strategy == "RSIStrategy"
+        assert result.results[0].status == "success"
+
     def test_scan_multiple_symbols(self, mock_market_data_service):
         """Scan multiple symbols returns results for all."""
         from services.backtest_service import BacktestService
@@ -0,0 +1,36 @@
+"""Tests for the strategy signal cache."""
+
+import polars as pl
+
+from api.models import BacktestRequest
+from services.signal_cache import SignalCache, signal_cache_key
+
+
+def test_key_ignores_execution_settings():
+    base = dict(symbol="infy", strategy="RSIStrategy", params={"period": 14}, end_date="2023-12-31")
+    a = BacktestRequest(**base, initial_cash=1000.0)
+    b = BacktestRequest(**{**base, "symbol": "INFY"}, initial_cash=5000.0)
+    assert signal_cache_key(a) is not None
+    assert signal_cache_key(a) == signal_cache_key(b)
+    assert signal_cache_key(a) != signal_cache_key(BacktestRequest(**base, timeframe="15m"))
+
+
+def test_open_date_range_has_no_key():
+    assert signal_cache_key(BacktestRequest(symbol="INFY", strategy="RSIStrategy")) is None
+
+
+def test_lru_eviction_by_size():
+    frame = pl.DataFrame({"signal": [1] * 1000})
+    cache = SignalCache(max_bytes=int(frame.estimated_size() * 2.5))
+    cache.put("a", frame)
+    cache.put("b", frame)
+    assert cache.get("a") is frame  # "a" becomes most recent
+    cache.put("c", frame)
+    assert cache.get("b") is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_ttl_expiry():
+    cache = SignalCache(ttl_seconds=0.0)
+    cache.put("a", pl.DataFrame({"signal": [1]}))
+    assert cache.get("a") is None
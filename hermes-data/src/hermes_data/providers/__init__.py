@@ -1,6 +1,7 @@
 """Data providers for different storage backends."""
 
 from .base import DataProvider
+from .filters import filter_date_range
 from .local import LocalFileProvider
 
-__all__ = ["DataProvider", "LocalFileProvider"]
+__all__ = ["DataProvider", "LocalFileProvider", "filter_date_range"]
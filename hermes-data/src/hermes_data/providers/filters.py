@@ -0,0 +1,34 @@
+"""Lazy-scan filters shared by the Parquet-backed loaders."""
+
+from datetime import datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import polars as pl
+
+
+def filter_date_range(
+    lazy: pl.LazyFrame,
+    start_dt: Optional[datetime] = None,
+    end_dt: Optional[datetime] = None,
+) -> pl.LazyFrame:
+    """Restrict a raw Parquet scan to [start_dt, end_dt] (either may be None).
+
+    Apply this before any timezone normalization: a filter on a rewritten
+    timestamp column cannot be pushed into the reader, while this one is
+    checked against row-group statistics, so row groups outside the range
+    are never decoded. Bounds are naive wall-clock times and take the file's
+    zone.
+    """
+    if not (start_dt or end_dt):
+        return lazy
+
+    tz = getattr(lazy.collect_schema()["timestamp"], "time_zone", None)
+    if tz:
+        start_dt = start_dt and start_dt.replace(tzinfo=ZoneInfo(tz))
+        end_dt = end_dt and end_dt.replace(tzinfo=ZoneInfo(tz))
+    if start_dt and end_dt:
+        return lazy.filter(pl.col("timestamp").is_between(start_dt, end_dt))
+    if start_dt:
+        return lazy.filter(pl.col("timestamp") >= start_dt)
+    return lazy.filter(pl.col("timestamp") <= end_dt)
@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 import polars as pl
 
 from .base import DataProvider
+from .filters import filter_date_range
 
 logger = logging.getLogger(__name__)
 
@@ -43,66 +44,69 @@ class LocalFileProvider(DataProvider):
         Implements efficient lazy loading with Polars, applying filters 
         at scan time for optimal performance.
         """
-        dfs = []
+        paths = []
 
         for symbol in symbols:
             file_path = self.data_dir / f"{symbol}.parquet"
             if not file_path.exists():
                 logger.warning(f"Data for {symbol} not found at {file_path}")
                 continue
+            paths.append(file_path)
 
-            # Lazy Scan for efficiency
-            lazy_df = pl.scan_parquet(file_path)
-
-            # NORMALIZATION: Ensure timestamp is Naive (Wall Clock)
-            # This handles UTC-aware parquet files by dropping timezone info
-            lazy_df = lazy_df.with_columns(
-                pl.col("timestamp").dt.replace_time_zone(None)
-            )
-
-            # Filter by Date Range
-            if start_date:
-                s_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                lazy_df = lazy_df.filter(pl.col("timestamp") >= s_dt)
-
-            if end_date:
-                e_dt = datetime.strptime(end_date, "%Y-%m-%d")
-                lazy_df = lazy_df.filter(pl.col("timestamp") <= e_dt)
-
-            # Add Symbol Column (needed for stacked df)
-            lazy_df = lazy_df.with_columns(pl.lit(symbol).alias("symbol"))
-
-            dfs.append(lazy_df)
-
-        if not dfs:
+        if not paths:
             raise ValueError("No data loaded for any of the provided symbols.")
 
-        # Concat all lazy frames and collect
-        combined_lazy = pl.concat(dfs)
+        # One lazy scan over all files: Polars reads them in parallel under a
+        # single plan and pushes the filters below into the Parquet reader.
+        combined_lazy = pl.scan_parquet(
+            paths, include_file_paths="__path__", hive_partitioning=False
+        )
 
-        # Sort by timestamp (crucial for backtesting)
-        combined_lazy = combined_lazy.sort(["timestamp", "symbol"])
+        # Date range on the raw timestamp column, before the normalization
+        # below, so it is pushed into the reader
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+        combined_lazy = filter_date_range(combined_lazy, start_dt, end_dt)
+
+        # The symbol column is recovered from each row's source file name.
+        combined_lazy = combined_lazy.with_columns(
+            # NORMALIZATION: Ensure timestamp is Naive (Wall Clock)
+            # This handles UTC-aware parquet files by dropping timezone info
+            pl.col("timestamp").dt.replace_time_zone(None),
+            pl.col("__path__").str.extract(r"([^/\\]+)\.parquet$", 1).alias("symbol"),
+        ).drop("__path__")
 
         # --- DATA GUARD (Robustness) ---
         # 1. Filter out invalid prices (<= 0)
         # 2. Drop rows with Nulls in critical columns
+        # This ensures AUTHENTICITY: we never backtest on fake/zero data.
+        # Price and integrity checks form one predicate.
         logger.info("Applying Data Guard: Filtering invalid prices and nulls...")
-        combined_lazy = combined_lazy.filter(
+        predicate = (
             (pl.col("close") > 0)
             & (pl.col("open") > 0)
             & (pl.col("high") > 0)
             & (pl.col("low") > 0)
-        ).filter(
             # Integrity Checks (High must be highest, Low must be lowest)
-            (pl.col("high") >= pl.col("low"))
+            & (pl.col("high") >= pl.col("low"))
             & (pl.col("high") >= pl.col("open"))
             & (pl.col("high") >= pl.col("close"))
             & (pl.col("low") <= pl.col("open"))
             & (pl.col("low") <= pl.col("close"))
-        ).drop_nulls(subset=["close", "open", "high", "low"])
+        )
+
+        # Sort by timestamp (crucial for backtesting)
+        # For a centralized event loop, (timestamp, symbol) is better.
+        combined_lazy = (
+            combined_lazy.filter(predicate)
+            .drop_nulls(subset=["close", "open", "high", "low"])
+            .sort(["timestamp", "symbol"])
+        )
 
-        logger.info(f"Materializing data for {len(symbols)} symbols...")
-        final_df = combined_lazy.collect()
+        logger.info(f"Materializing data for {len(paths)} symbols...")
+        # Streaming engine: the scan -> filter -> sort pipeline runs in
+        # batches, so peak memory stays bounded for large universes
+        final_df = combined_lazy.collect(engine="streaming")
 
         logger.info(f"Loaded {len(final_df)} rows.")
         return final_df
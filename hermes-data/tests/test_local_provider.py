@@ -50,6 +50,8 @@ class TestLocalFileProvider:
         assert len(df) == 200  # 100 rows each
         symbols = df["symbol"].unique().to_list()
         assert set(symbols) == {"TESTSYM", "ANOTHERSYM"}
+        assert "__path__" not in df.columns
+        assert df.equals(df.sort(["timestamp", "symbol"]))
 
     def test_load_with_date_filter(self, temp_data_dir: Path):
         """Should apply date filters correctly."""
@@ -103,3 +105,29 @@ class TestLocalFileProvider:
         
         # Invalid row should be filtered
         assert len(df) == 2
+
+    def test_load_date_filter_tz_aware(self, temp_data_dir: Path):
+        """Date bounds should apply as wall-clock times to tz-aware files."""
+        import datetime
+
+        pl.DataFrame({
+            "timestamp": pl.datetime_range(
+                datetime.datetime(2024, 1, 1),
+                datetime.datetime(2024, 1, 5),
+                "1h",
+                eager=True,
+                time_zone="Asia/Kolkata",
+            ),
+            "open": 100.0,
+            "high": 101.0,
+            "low": 99.0,
+            "close": 100.5,
+        }).write_parquet(temp_data_dir / "TZSYM.parquet", row_group_size=24)
+
+        provider = LocalFileProvider(temp_data_dir)
+        df = provider.load(["TZSYM"], start_date="2024-01-02", end_date="2024-01-03")
+
+        assert df["timestamp"].dtype == pl.Datetime("us")
+        assert df["timestamp"].min() == datetime.datetime(2024, 1, 2)
+        assert df["timestamp"].max() == datetime.datetime(2024, 1, 3)
+        assert len(df) == 25
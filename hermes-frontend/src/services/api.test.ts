@@ -17,7 +17,20 @@ describe("API Service", () => {
   });
 
   it("runBacktest calls correct endpoint with payload", async () => {
-    const mockResponse = { metrics: {}, candles: [] };
+    const mockResponse = {
+      metrics: {},
+      equity_curve: { time: [1, 2], value: [100, 101] },
+      signals: { time: [2], type: ["buy"], price: [12] },
+      candles: {
+        time: [1, 2],
+        open: [10, 11],
+        high: [12, 13],
+        low: [9, 10],
+        close: [11, 12],
+        volume: [100, 200],
+      },
+      indicators: { rsi: { time: [2], value: [55] } },
+    };
     vi.mocked(axios.post).mockResolvedValue({ data: mockResponse });
 
     const payload = {
@@ -33,7 +46,19 @@ describe("API Service", () => {
       "http://localhost:8000/backtest",
       payload,
     );
-    expect(data).toEqual(mockResponse);
+    expect(data).toEqual({
+      metrics: {},
+      equity_curve: [
+        { time: 1, value: 100 },
+        { time: 2, value: 101 },
+      ],
+      signals: [{ time: 2, type: "buy", price: 12 }],
+      candles: [
+        { time: 1, open: 10, high: 12, low: 9, close: 11, volume: 100 },
+        { time: 2, open: 11, high: 13, low: 10, close: 12, volume: 200 },
+      ],
+      indicators: { rsi: [{ time: 2, value: 55 }] },
+    });
   });
 
   it("runBacktestAsync calls correct endpoint", async () => {
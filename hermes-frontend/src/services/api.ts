@@ -50,6 +50,73 @@ export interface IndicatorPoint {
   value: number;
 }
 
+// Wire format: series arrive as parallel columns
+export interface CandleSeries {
+  time: number[];
+  open: number[];
+  high: number[];
+  low: number[];
+  close: number[];
+  volume: number[];
+}
+
+export interface ChartSeries {
+  time: number[];
+  value: number[];
+}
+
+export interface SignalSeries {
+  time: number[];
+  type: ("buy" | "sell")[];
+  price: number[];
+}
+
+export interface BacktestResponsePayload
+  extends Omit<
+    BacktestResponse,
+    "equity_curve" | "signals" | "candles" | "indicators"
+  > {
+  equity_curve: ChartSeries;
+  signals: SignalSeries;
+  candles: CandleSeries;
+  indicators: Record<string, ChartSeries>;
+}
+
+export const toCandlePoints = (series: CandleSeries): CandlePoint[] =>
+  series.time.map((time, i) => ({
+    time,
+    open: series.open[i],
+    high: series.high[i],
+    low: series.low[i],
+    close: series.close[i],
+    volume: series.volume[i],
+  }));
+
+export const toChartPoints = (series: ChartSeries): ChartPoint[] =>
+  series.time.map((time, i) => ({ time, value: series.value[i] }));
+
+export const toSignalPoints = (series: SignalSeries): SignalPoint[] =>
+  series.time.map((time, i) => ({
+    time,
+    type: series.type[i],
+    price: series.price[i],
+  }));
+
+export const fromBacktestPayload = (
+  payload: BacktestResponsePayload,
+): BacktestResponse => ({
+  ...payload,
+  equity_curve: toChartPoints(payload.equity_curve),
+  signals: toSignalPoints(payload.signals),
+  candles: toCandlePoints(payload.candles),
+  indicators: Object.fromEntries(
+    Object.entries(payload.indicators).map(([name, series]) => [
+      name,
+      toChartPoints(series),
+    ]),
+  ),
+});
+
 export interface BacktestResponse {
   symbol: string;
   strategy: string;
@@ -63,6 +130,28 @@ export interface BacktestResponse {
   task_id?: string;
 }
 
+// NDJSON lines from POST /backtest/stream, demultiplexed by "type". The
+// server sends them once the backtest has finished, in column batches.
+export type BacktestStreamLine =
+  | {
+      type: "meta";
+      symbol: string;
+      strategy: string;
+      metrics: Record<string, string>;
+      status: string;
+      error?: string | null;
+    }
+  | ({ type: "candles" } & CandleSeries)
+  | ({ type: "equity" } & ChartSeries)
+  | ({ type: "indicator"; name: string } & ChartSeries)
+  | {
+      type: "signals";
+      time: number[];
+      side: ("buy" | "sell")[];
+      price: number[];
+    }
+  | { type: "end" };
+
 export interface BacktestTaskResponse {
   task_id: string;
   status: string;
@@ -118,11 +207,11 @@ export interface ScanResponse {
 
 export const api = {
   runBacktest: async (req: BacktestRequest): Promise<BacktestResponse> => {
-    const response = await axios.post<BacktestResponse>(
+    const response = await axios.post<BacktestResponsePayload>(
       `${API_URL}/backtest`,
       req,
     );
-    return response.data;
+    return fromBacktestPayload(response.data);
   },
   runBacktestAsync: async (
     req: BacktestRequest,
@@ -136,10 +225,57 @@ export const api = {
   pollBacktestStatus: async (
     taskId: string,
   ): Promise<BacktestStatusResponse> => {
-    const response = await axios.get<BacktestStatusResponse>(
-      `${API_URL}/backtest/status/${taskId}`,
-    );
-    return response.data;
+    const response = await axios.get<
+      Omit<BacktestStatusResponse, "result"> & {
+        result?: BacktestResponsePayload;
+      }
+    >(`${API_URL}/backtest/status/${taskId}`);
+    const { result, ...status } = response.data;
+    return result ? { ...status, result: fromBacktestPayload(result) } : status;
+  },
+  streamBacktestStatus: (
+    taskId: string,
+    onStatus: (status: BacktestStatusResponse) => void,
+  ): (() => void) => {
+    const source = new EventSource(`${API_URL}/backtest/stream/${taskId}`);
+    source.addEventListener("status", (event) => {
+      const { result, ...status } = JSON.parse(
+        (event as MessageEvent<string>).data,
+      ) as Omit<BacktestStatusResponse, "result"> & {
+        result?: BacktestResponsePayload | null;
+      };
+      onStatus(
+        result ? { ...status, result: fromBacktestPayload(result) } : status,
+      );
+      if (status.status !== "processing") source.close();
+    });
+    return () => source.close();
+  },
+  runBacktestStream: async (
+    req: BacktestRequest,
+    onLine: (line: BacktestStreamLine) => void,
+  ): Promise<void> => {
+    const response = await fetch(`${API_URL}/backtest/stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(req),
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Backtest stream failed: ${response.status}`);
+    }
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = "";
+    for (;;) {
+      const { done, value } = await reader.read();
+      buffered += decoder.decode(value, { stream: !done });
+      const lines = buffered.split("\n");
+      buffered = lines.pop() ?? "";
+      for (const line of lines) {
+        if (line) onLine(JSON.parse(line) as BacktestStreamLine);
+      }
+      if (done) return;
+    }
   },
   getInstruments: async (): Promise<string[]> => {
     const response = await axios.get<string[]>(`${API_URL}/instruments`);
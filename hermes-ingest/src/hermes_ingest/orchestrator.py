@@ -109,7 +109,8 @@ class IngestOrchestrator:
 
         Implements:
         - Smart resume: only fetches data after the last stored timestamp
-        - Incremental writes: writes each chunk immediately as it's fetched
+        - Incremental writes: stages each chunk as it's fetched, merging once
+          at the end (or on failure) so the stored file is rewritten only once
         - Progress updates: updates progress tracker per chunk
 
         Args:
@@ -120,6 +121,9 @@ class IngestOrchestrator:
             True if successful, False otherwise
         """
         end_date = datetime.now().strftime("%Y-%m-%d")
+
+        # Fold in chunks left staged by an interrupted run before resuming
+        self.sink.commit(symbol)
         start_date = self._get_resume_date(symbol, self._settings.start_date)
 
         # Check if already up to date
@@ -141,22 +145,27 @@ class IngestOrchestrator:
             chunks_written = 0
             total_rows = 0
 
-            async for chunk_df, _from_date, _to_date in source.fetch_chunks(
-                symbol, token, start_date, end_date
-            ):
-                if chunk_df is None or chunk_df.is_empty():
-                    continue
-
-                # Write immediately - sink handles append/dedupe
-                self.sink.write(symbol, chunk_df)
-                chunks_written += 1
-                total_rows += len(chunk_df)
-
-                # Update progress
-                if self._progress:
-                    self._progress.update_symbol(
-                        symbol, chunks_done=1, rows_written=len(chunk_df)
-                    )
+            try:
+                async for chunk_df, _from_date, _to_date in source.fetch_chunks(
+                    symbol, token, start_date, end_date
+                ):
+                    if chunk_df is None or chunk_df.is_empty():
+                        continue
+
+                    # Stage immediately - merged/deduped once by commit()
+                    self.sink.stage(symbol, chunk_df)
+                    chunks_written += 1
+                    total_rows += len(chunk_df)
+
+                    # Update progress
+                    if self._progress:
+                        self._progress.update_symbol(
+                            symbol, chunks_done=1, rows_written=len(chunk_df)
+                        )
+            finally:
+                # Keep whatever was fetched, even if a later chunk failed
+                if chunks_written:
+                    self.sink.commit(symbol)
 
             if chunks_written == 0:
                 logger.info(f"[{symbol}] No new data")
@@ -213,22 +222,28 @@ class IngestOrchestrator:
         if self._progress:
             self._progress.start(total_symbols)
 
-        # Setup semaphore for concurrency control
-        semaphore = asyncio.Semaphore(concurrency)
+        # Bounded producer/consumer: a fixed pool of workers drains a small
+        # queue, so a full exchange universe never materializes one task per
+        # symbol up front
+        workers = min(concurrency, total_symbols)
+        queue: asyncio.Queue[tuple[str, int] | None] = asyncio.Queue(maxsize=workers * 2)
         results: dict[str, bool] = {}
 
-        async def _process_one(row: dict[str, Any]) -> None:
-            symbol = str(row["tradingsymbol"])
-            token = int(row["instrument_token"])
-
-            async with semaphore:
-                result = await self.fetch_symbol(symbol, token)
-                results[symbol] = result
+        async def _worker() -> None:
+            while (item := await queue.get()) is not None:
+                symbol, token = item
+                results[symbol] = await self.fetch_symbol(symbol, token)
 
         # Use TaskGroup for structured concurrency (Python 3.11+)
         async with asyncio.TaskGroup() as tg:
-            for row in instruments_df.iter_rows(named=True):
-                tg.create_task(_process_one(row))
+            for _ in range(workers):
+                tg.create_task(_worker())
+            for symbol, token in instruments_df.select(
+                "tradingsymbol", "instrument_token"
+            ).iter_rows():
+                await queue.put((str(symbol), int(token)))
+            for _ in range(workers):
+                await queue.put(None)
 
         # Close source
         await self.source.close()
@@ -4,7 +4,7 @@ import io
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import polars as pl
 
@@ -12,6 +12,12 @@ Compression = Literal['lz4', 'uncompressed', 'snappy', 'gzip', 'brotli', 'zstd']
 
 logger = logging.getLogger(__name__)
 
+# Row groups sized for timestamp range scans (~35 trading days of 1m bars)
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+# Codec levels tuned for write speed vs size; codecs not listed use their default
+PARQUET_COMPRESSION_LEVELS: dict[str, int] = {"zstd": 3}
+
 
 
 
@@ -37,13 +43,27 @@ class DataSink(ABC):
     # Parquet helpers — centralized compression
     # ------------------------------------------------------------------
 
+    @property
+    def _parquet_options(self) -> dict[str, Any]:
+        """Keyword arguments shared by every Parquet write.
+
+        Row groups of PARQUET_ROW_GROUP_SIZE rows with column statistics let
+        timestamp range scans skip groups outside the requested window.
+        """
+        return {
+            "compression": self.compression,
+            "compression_level": PARQUET_COMPRESSION_LEVELS.get(self.compression),
+            "statistics": True,
+            "row_group_size": PARQUET_ROW_GROUP_SIZE,
+        }
+
     def _to_parquet_bytes(self, df: pl.DataFrame) -> bytes:
         """Serialize a DataFrame to compressed Parquet bytes.
 
         Uses the compression codec configured at init time.
         """
         buffer = io.BytesIO()
-        df.write_parquet(buffer, compression=self.compression)
+        df.write_parquet(buffer, **self._parquet_options)
         return buffer.getvalue()
 
     def _from_parquet_bytes(self, data: bytes) -> pl.DataFrame:
@@ -87,7 +107,11 @@ class DataSink(ABC):
         if df is None or df.is_empty():
             return None
 
-        last_ts = df.select(pl.col("timestamp").max()).item()
+        return self._format_last_timestamp(df.select(pl.col("timestamp").max()).item())
+
+    @staticmethod
+    def _format_last_timestamp(last_ts: Any) -> str | None:
+        """Format a max-timestamp scalar as a naive ISO string (None-safe)."""
         if last_ts is None:
             return None
 
@@ -97,6 +121,33 @@ class DataSink(ABC):
 
         return str(last_ts.isoformat())
 
+    # ------------------------------------------------------------------
+    # Staged writes — append chunks cheaply, merge once per symbol
+    # ------------------------------------------------------------------
+
+    def stage(self, symbol: str, df: pl.DataFrame) -> None:
+        """Stage a fetched chunk for a later commit().
+
+        The default writes through immediately (read + merge + write).
+        Sinks that can append cheaply override this together with commit().
+
+        Args:
+            symbol: Instrument symbol
+            df: DataFrame chunk with OHLCV data
+        """
+        self.write(symbol, df)
+
+    def commit(self, symbol: str) -> Path | None:
+        """Merge any staged chunks into the stored dataset.
+
+        Args:
+            symbol: Instrument symbol
+
+        Returns:
+            Path to the merged file/resource, or None if nothing was staged
+        """
+        return None
+
     # ------------------------------------------------------------------
     # Abstract methods — subclasses implement storage-specific logic
     # ------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Local file system data sink for Parquet files."""
 
 import logging
+import shutil
 from pathlib import Path
 
 import polars as pl
@@ -45,11 +46,58 @@ class LocalFileSink(DataSink):
         df = self._merge_and_deduplicate(df, existing_df)
 
         # Write with compression
-        df.write_parquet(output_path, compression=self.compression)
+        df.write_parquet(output_path, **self._parquet_options)
         logger.info(f"[{symbol}] Wrote {len(df)} rows to {output_path}")
 
         return output_path
 
+    def _get_staging_dir(self, symbol: str) -> Path:
+        """Get the staging directory holding uncommitted chunks for a symbol."""
+        return self.data_dir / f"{symbol}.staging"
+
+    def stage(self, symbol: str, df: pl.DataFrame) -> None:
+        """Append a chunk as its own Parquet file, without touching the main file.
+
+        Chunks are merged by commit(), so a full sync costs O(N) disk I/O
+        instead of rewriting the whole file for every chunk.
+        """
+        staging_dir = self._get_staging_dir(symbol)
+        staging_dir.mkdir(exist_ok=True)
+        index = sum(1 for _ in staging_dir.glob("*.parquet"))
+        df.write_parquet(staging_dir / f"{index:06d}.parquet", **self._parquet_options)
+
+    def commit(self, symbol: str) -> Path | None:
+        """Merge staged chunks (and existing data) into the symbol's file.
+
+        Streams through Polars' sink_parquet into a temp file, then atomically
+        replaces the output and removes the staging directory. Leftover
+        staging from an interrupted run is picked up by the next commit.
+        """
+        staging_dir = self._get_staging_dir(symbol)
+        if not staging_dir.exists():
+            return None
+
+        parts = sorted(staging_dir.glob("*.parquet"))
+        if not parts:
+            shutil.rmtree(staging_dir)
+            return None
+
+        output_path = self._get_path(symbol)
+        sources = ([output_path] if output_path.exists() else []) + parts
+        tmp_path = output_path.with_suffix(".parquet.tmp")
+
+        (
+            pl.scan_parquet(sources)
+            .unique(subset=["timestamp"], keep="last")
+            .sort("timestamp")
+            .sink_parquet(tmp_path, **self._parquet_options)
+        )
+        tmp_path.replace(output_path)
+        shutil.rmtree(staging_dir)
+        logger.info(f"[{symbol}] Committed {len(parts)} staged chunks to {output_path}")
+
+        return output_path
+
     def read(self, symbol: str) -> pl.DataFrame | None:
         """Read existing data for a symbol."""
         path = self._get_path(symbol)
@@ -62,6 +110,24 @@ class LocalFileSink(DataSink):
             logger.warning(f"[{symbol}] Error reading file: {e}")
             return None
 
+    def get_last_timestamp(self, symbol: str) -> str | None:
+        """Get the last timestamp for a symbol without loading the file.
+
+        The max is pushed into a lazy Parquet scan, so only the timestamp
+        column (or its row-group statistics) is read.
+        """
+        path = self._get_path(symbol)
+        if not path.exists():
+            return None
+
+        try:
+            last_ts = pl.scan_parquet(path).select(pl.col("timestamp").max()).collect().item()
+        except Exception as e:
+            logger.warning(f"[{symbol}] Error reading last timestamp: {e}")
+            return None
+
+        return self._format_last_timestamp(last_ts)
+
     def exists(self, symbol: str) -> bool:
         """Check if data exists for a symbol."""
         return self._get_path(symbol).exists()
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp
+import orjson
 import polars as pl
 
 from hermes_ingest.config import IngestSettings, get_settings
@@ -17,6 +18,22 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://kite.zerodha.com/oms"
 
+# Column layout of a Zerodha historical candle row (requested with oi=1)
+CANDLE_SCHEMA: dict[str, pl.DataType] = {
+    "timestamp": pl.Utf8(),
+    "open": pl.Float64(),
+    "high": pl.Float64(),
+    "low": pl.Float64(),
+    "close": pl.Float64(),
+    "volume": pl.Int64(),
+    "oi": pl.Int64(),
+}
+
+# HTTP session tuning (seconds)
+DNS_CACHE_TTL_SECONDS = 600
+KEEPALIVE_TIMEOUT_SECONDS = 60
+REQUEST_TIMEOUT_SECONDS = 60
+
 
 class RateLimiter:
     """Token Bucket Rate Limiter to enforce Global Request Limits.
@@ -29,22 +46,23 @@ class RateLimiter:
         self.tokens = rate_limit_per_sec
         self.max_tokens = rate_limit_per_sec
         self.updated_at = time.monotonic()
-        self.lock = asyncio.Lock()
 
     async def wait(self) -> None:
-        """Wait until a token is available."""
-        async with self.lock:
-            while self.tokens < 1:
-                now = time.monotonic()
-                elapsed = now - self.updated_at
-                self.tokens = min(self.max_tokens, self.tokens + elapsed * self.rate_limit)
-                self.updated_at = now
+        """Wait until a token is available.
 
-                if self.tokens < 1:
-                    wait_time = (1 - self.tokens) / self.rate_limit
-                    await asyncio.sleep(wait_time)
+        The token is reserved up front (the balance may go negative) and the
+        caller sleeps off its own debt afterwards. The bookkeeping has no await,
+        so it is atomic on the event loop and concurrent workers never queue
+        behind each other's sleeps.
+        """
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.max_tokens, self.tokens + elapsed * self.rate_limit)
+        self.updated_at = now
 
-            self.tokens -= 1
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate_limit)
 
 
 class ZerodhaSource(DataSource):
@@ -94,7 +112,19 @@ class ZerodhaSource(DataSource):
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # Keep TCP/TLS connections and DNS lookups alive across chunks and
+            # symbols; the pool matches the orchestrator's worker count
+            concurrency = self._settings.max_concurrency
+            connector = aiohttp.TCPConnector(
+                limit=concurrency * 2,
+                limit_per_host=concurrency * 2,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+            )
         return self._session
 
     async def fetch(
@@ -183,20 +213,29 @@ class ZerodhaSource(DataSource):
                 logger.info(f"[{symbol}] {f_date} -> {t_date}: Got {len(candles)} candles")
 
                 # Convert to DataFrame immediately
-                schema = ["timestamp", "open", "high", "low", "close", "volume", "oi"]
-                chunk_df = pl.DataFrame(candles, schema=schema, orient="row")
-
-                # Parse timestamp
-                chunk_df = chunk_df.with_columns(
-                    pl.col("timestamp").str.strptime(
-                        pl.Datetime, "%Y-%m-%dT%H:%M:%S%z", strict=False
-                    )
-                )
+                chunk_df = self._candles_to_frame(candles)
 
                 yield (chunk_df, f_date, t_date)
 
             current_dt = next_dt + timedelta(days=1)
 
+    @staticmethod
+    def _candles_to_frame(candles: list[Any]) -> pl.DataFrame:
+        """Build a chunk DataFrame from Zerodha candle rows.
+
+        Rows are transposed once with zip and handed to Polars as typed
+        columns, avoiding row-oriented construction and dtype inference.
+        """
+        columns = zip(CANDLE_SCHEMA, zip(*candles, strict=True), strict=True)
+        chunk_df = pl.DataFrame(dict(columns), schema=CANDLE_SCHEMA)
+
+        # Parse timestamp
+        return chunk_df.with_columns(
+            pl.col("timestamp").str.strptime(
+                pl.Datetime, "%Y-%m-%dT%H:%M:%S%z", strict=False
+            )
+        )
+
     async def _fetch_chunk(
         self,
         session: aiohttp.ClientSession,
@@ -230,7 +269,9 @@ class ZerodhaSource(DataSource):
                         return []
 
                     response.raise_for_status()
-                    data = await response.json()
+                    # Candle payloads are large numeric arrays; decode the raw
+                    # body with orjson instead of aiohttp's stdlib json path
+                    data = orjson.loads(await response.read())
 
                     if data.get("status") == "success":
                         candles = data["data"]["candles"]
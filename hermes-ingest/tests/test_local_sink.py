@@ -1,6 +1,7 @@
 """Tests for LocalFileSink."""
 
 import polars as pl
+import pytest
 
 from hermes_ingest.sinks.local import LocalFileSink
 
@@ -136,3 +137,68 @@ class TestLocalFileSink:
         LocalFileSink(nested_path)
 
         assert nested_path.exists()
+
+    def test_stage_does_not_touch_main_file(self, temp_data_dir, sample_ohlcv_df):
+        """Test that staged chunks are kept aside until commit."""
+        sink = LocalFileSink(temp_data_dir)
+
+        sink.stage("TEST", sample_ohlcv_df.head(2))
+        sink.stage("TEST", sample_ohlcv_df.tail(2))
+
+        assert not sink.exists("TEST")
+        assert sink.list_symbols() == []
+        assert len(list((temp_data_dir / "TEST.staging").glob("*.parquet"))) == 2
+
+    def test_commit_merges_staged_chunks_with_existing(self, temp_data_dir, sample_ohlcv_df):
+        """Test that commit merges, deduplicates, sorts and cleans up staging."""
+        sink = LocalFileSink(temp_data_dir)
+        sink.write("TEST", sample_ohlcv_df.head(1))
+
+        sink.stage("TEST", sample_ohlcv_df.tail(2))
+        sink.stage("TEST", sample_ohlcv_df)
+        path = sink.commit("TEST")
+
+        assert path == temp_data_dir / "TEST.parquet"
+        result = sink.read("TEST")
+        assert result is not None
+        assert result["timestamp"].to_list() == sorted(sample_ohlcv_df["timestamp"].to_list())
+        assert not (temp_data_dir / "TEST.staging").exists()
+        assert not (temp_data_dir / "TEST.parquet.tmp").exists()
+
+    def test_commit_without_staged_chunks_is_noop(self, temp_data_dir):
+        """Test that commit returns None when nothing is staged."""
+        sink = LocalFileSink(temp_data_dir)
+
+        assert sink.commit("TEST") is None
+
+    def test_get_last_timestamp_does_not_read_full_file(
+        self, temp_data_dir, sample_ohlcv_df, monkeypatch
+    ):
+        """Test get_last_timestamp uses a lazy scan instead of read()."""
+        sink = LocalFileSink(temp_data_dir)
+        sink.write("TEST", sample_ohlcv_df)
+
+        def fail(symbol):
+            raise AssertionError("read() should not be called")
+
+        monkeypatch.setattr(sink, "read", fail)
+
+        expected = sample_ohlcv_df["timestamp"].max().isoformat()
+        assert sink.get_last_timestamp("TEST") == expected
+
+    def test_commit_writes_row_groups_with_statistics(
+        self, temp_data_dir, sample_ohlcv_df, monkeypatch
+    ):
+        """Test committed files are split into row groups carrying min/max stats."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        monkeypatch.setattr("hermes_ingest.sinks.base.PARQUET_ROW_GROUP_SIZE", 2)
+        sink = LocalFileSink(temp_data_dir)
+
+        sink.stage("TEST", sample_ohlcv_df)
+        path = sink.commit("TEST")
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == -(-len(sample_ohlcv_df) // 2)
+        column = metadata.row_group(0).column(metadata.schema.names.index("timestamp"))
+        assert column.compression == "ZSTD"
+        assert column.statistics.has_min_max
@@ -101,7 +101,7 @@ class TestIngestOrchestrator:
             result = await orch.fetch_symbol("TEST", 12345)
 
             assert result is True
-            mock_sink.write.assert_not_called()
+            mock_sink.stage.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_fetch_symbol_success(self, temp_data_dir, sample_ohlcv_df):
@@ -123,7 +123,8 @@ class TestIngestOrchestrator:
             result = await orch.fetch_symbol("TEST", 12345)
 
             assert result is True
-            mock_sink.write.assert_called_once()
+            mock_sink.stage.assert_called_once()
+            mock_sink.commit.assert_called_with("TEST")
 
     @pytest.mark.asyncio
     async def test_fetch_symbol_handles_exception(self, temp_data_dir):
@@ -243,6 +244,37 @@ class TestIngestOrchestrator:
             assert len(results) == 2
             assert "RELIANCE" in results
 
+    @pytest.mark.asyncio
+    async def test_sync_bounds_in_flight_symbols(self):
+        """Test sync never runs more symbols at once than the worker count."""
+        import asyncio
+
+        mock_source = MagicMock()
+        mock_source.list_instruments.return_value = pl.DataFrame({
+            "instrument_token": list(range(20)),
+            "tradingsymbol": [f"SYM{i}" for i in range(20)],
+        })
+        mock_source.close = AsyncMock()
+
+        orch = IngestOrchestrator(source=mock_source, sink=MagicMock())
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(symbol, token):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return token % 2 == 0
+
+        with patch.object(orch, "fetch_symbol", side_effect=fake_fetch):
+            results = await orch.sync(concurrency=3)
+
+        assert len(results) == 20
+        assert results["SYM4"] is True and results["SYM5"] is False
+        assert peak == 3
+
     @pytest.mark.asyncio
     async def test_close_calls_source_close(self):
         """Test close method calls source.close."""
@@ -291,8 +323,11 @@ class TestIncrementalWrites:
             result = await orch.fetch_symbol("TEST", 12345)
 
             assert result is True
-            # Should be called twice - once per chunk
-            assert mock_sink.write.call_count == 2
+            # Staged twice - once per chunk - then merged once
+            assert mock_sink.stage.call_count == 2
+            mock_sink.write.assert_not_called()
+            # One commit for leftovers before resuming, one after the fetch
+            assert mock_sink.commit.call_count == 2
 
     @pytest.mark.asyncio
     async def test_progress_updated_per_chunk(self, sample_ohlcv_df):
@@ -1,6 +1,6 @@
 """Tests for ZerodhaSource."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import polars as pl
 import pytest
@@ -33,6 +33,24 @@ class TestRateLimiter:
         assert limiter.tokens < 1
 
 
+    @pytest.mark.asyncio
+    async def test_concurrent_waits_are_spaced_by_rate(self):
+        """Test concurrent callers reserve successive slots instead of queueing."""
+        import asyncio
+
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        with patch("hermes_ingest.sources.zerodha.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(rate_limit_per_sec=2.0)
+            with patch("hermes_ingest.sources.zerodha.asyncio.sleep", fake_sleep):
+                await asyncio.gather(*(limiter.wait() for _ in range(5)))
+
+        assert sorted(sleeps) == [0.5, 1.0, 1.5]
+
+
 class TestZerodhaSource:
     """Test suite for ZerodhaSource."""
 
@@ -112,6 +130,57 @@ class TestZerodhaSource:
             assert "TCS" in symbols
             assert "NIFTY24JANFUT" not in symbols
 
+    @pytest.mark.asyncio
+    async def test_session_reuses_tuned_connector(self):
+        """Test the session is created once with a pooled, DNS-caching connector."""
+        source = ZerodhaSource(enctoken="test")
+
+        session = await source._get_session()
+        try:
+            assert await source._get_session() is session
+            connector = session.connector
+            assert connector.limit == source._settings.max_concurrency * 2
+            assert connector.limit_per_host == source._settings.max_concurrency * 2
+            assert connector.use_dns_cache
+            assert session.timeout.total == 60
+        finally:
+            await source.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_parses_candles(self):
+        """Test a successful chunk response is decoded into candle rows."""
+        source = ZerodhaSource(enctoken="test")
+        source.rate_limiter = MagicMock(wait=AsyncMock())
+
+        response = MagicMock(status=200)
+        response.read = AsyncMock(
+            return_value=b'{"status":"success","data":{"candles":'
+            b'[["2024-01-01T09:15:00+0530",1.0,2.0,0.5,1.5,100,0]]}}'
+        )
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        candles = await source._fetch_chunk(session, 123, "2024-01-01", "2024-01-02")
+
+        assert candles == [["2024-01-01T09:15:00+0530", 1.0, 2.0, 0.5, 1.5, 100, 0]]
+
+    def test_candles_to_frame_is_typed_and_parsed(self):
+        """Test candle rows become typed columns with parsed timestamps."""
+        candles = [
+            ["2024-01-01T09:15:00+0530", 100, 101.5, 99, 100.5, 1200, 0],
+            ["2024-01-01T09:16:00+0530", 100.5, 102.0, 100.0, 101.0, 800, 0],
+        ]
+
+        df = ZerodhaSource._candles_to_frame(candles)
+
+        assert df.columns == ["timestamp", "open", "high", "low", "close", "volume", "oi"]
+        assert df["open"].dtype == pl.Float64
+        assert df["open"].to_list() == [100.0, 100.5]
+        assert df["volume"].dtype == pl.Int64
+        assert isinstance(df["timestamp"].dtype, pl.Datetime)
+        assert df["timestamp"].null_count() == 0
+
     @pytest.mark.asyncio
     async def test_close_closes_session(self):
         """Test close method closes aiohttp session."""